@@ -0,0 +1,46 @@
+"""
+Autenticación personalizada para la API REST de MajobaSyS.
+"""
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from users.cache import get_cached_user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` sin la query del usuario en cada request.
+
+    La firma y expiración del token se validan igual; el usuario del claim
+    ``user_id`` sale del cache de ``users.cache`` (memoria del proceso y
+    Redis) en vez de ``CustomUser.objects.get``. A diferencia de
+    ``JWTStatelessUserAuthentication`` (``TokenUser``), ``request.user`` es un
+    ``CustomUser`` real: ``IsOwner`` (``obj.user == request.user``), los
+    filtros por usuario y los serializers funcionan sin cambios.
+
+    Un usuario desactivado deja de autenticar cuando vence la entrada local
+    del cache (``AUTH_USER_LOCAL_CACHE_TIMEOUT``).
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # El hash no está en cache: esto lee la contraseña de la base
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
@@ -0,0 +1,17 @@
+"""
+Manejo de excepciones de la API REST de MajobaSyS.
+"""
+from rest_framework import exceptions
+from rest_framework.views import exception_handler as drf_exception_handler
+
+from majobacore.utils.hashers import HASHING_BUSY_RETRY_AFTER, HashingBusy
+
+
+def exception_handler(exc, context):
+    """
+    ``exception_handler`` de DRF que además responde 429 con ``Retry-After``
+    a ``HashingBusy`` (registro, cambio de contraseña, ...), igual que el login.
+    """
+    if isinstance(exc, HashingBusy):
+        exc = exceptions.Throttled(wait=HASHING_BUSY_RETRY_AFTER)
+    return drf_exception_handler(exc, context)
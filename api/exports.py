@@ -0,0 +1,228 @@
+"""
+Exportaciones CSV/JSON en streaming.
+
+``ExportViewMixin`` agrega a un ViewSet la acción ``GET .../export/`` que
+responde un ``StreamingHttpResponse``: el encabezado sale antes de tocar la
+base (primer byte inmediato) y las filas se leen con ``values_list`` en lotes
+por keyset (``pk > último``), así la memoria no depende del total de filas.
+
+No se usa ``QuerySet.iterator()``: el cuerpo se genera después de que la
+vista retornó (fuera de ATOMIC_REQUESTS), y en PostgreSQL un cursor de
+servidor fuera de una transacción se declara ``WITH HOLD``, lo que
+materializa el resultado completo antes del primer fetch (y choca con el
+``statement_timeout``). Cada lote por keyset es una query corta e indexada.
+
+En CSV los textos que empiezan como fórmula (``=``, ``+``, ``-``, ``@``,
+tab, CR) salen con ``'`` adelante: son datos del usuario y al abrir el
+archivo en Excel se ejecutarían (CSV injection).
+
+Parámetros:
+    ?as=csv|json   Formato (default: csv). ``format`` lo reserva DRF.
+    ?all=1         Solo staff: exporta las filas de todos los usuarios y
+                   agrega la columna ``username``.
+"""
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+
+from api.throttling import ExportRateThrottle
+from manager.importers import FORMULA_PREFIXES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson está en requirements/base.txt
+    orjson = None
+
+logger = logging.getLogger('api')
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'json': 'application/json',
+}
+
+ALL_VALUES = ('1', 'true', 'yes')
+
+# Columna extra de las exportaciones staff (``?all=1``)
+USERNAME_COLUMN = ('username', 'user__username')
+
+
+def iter_keyset(queryset, lookups, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Filas de ``queryset.values_list(*lookups)`` en lotes de pk creciente.
+
+    Yields:
+        tuple: Valores de cada fila, en el orden de ``lookups``.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        batch_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset.values_list('pk', *lookups)[:chunk_size])
+        for row in batch:
+            yield row[1:]
+        if len(batch) < chunk_size:
+            return
+        last_pk = batch[-1][0]
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(columns, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    CSV en bloques de ``chunk_size`` filas (no una escritura por fila: cada
+    bloque es un flush del compresor y del socket).
+
+    Empieza con BOM para que Excel detecte UTF-8 (el importador lo acepta).
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield '\ufeff' + buffer.getvalue()
+
+    pending = 0
+    buffer.seek(0)
+    buffer.truncate()
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        pending += 1
+        if pending == chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+
+
+def stream_json(columns, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    """Array JSON de objetos ``{columna: valor}``, en bloques de ``chunk_size`` filas."""
+    yield b'['
+    block = []
+    separator = b''
+    for row in rows:
+        block.append(dict(zip(columns, row)))
+        if len(block) == chunk_size:
+            # Un dumps por bloque (sin los corchetes): más rápido que uno por
+            # fila y sin miles de buffers chicos vivos a la vez
+            yield separator + _dumps(block)[1:-1]
+            separator = b','
+            block = []
+    if block:
+        yield separator + _dumps(block)[1:-1]
+    yield b']'
+
+
+STREAMERS = {
+    'csv': stream_csv,
+    'json': stream_json,
+}
+
+
+def export_response(columns, rows, fmt, filename):
+    """
+    ``StreamingHttpResponse`` descargable con ``rows`` en formato ``fmt``.
+
+    Args:
+        columns (list[str]): Nombres de columna (encabezado CSV / claves JSON).
+        rows: Iterable de tuplas, típicamente ``iter_keyset(...)``.
+        fmt (str): ``'csv'`` o ``'json'``.
+        filename (str): Nombre base del archivo descargado.
+    """
+    response = StreamingHttpResponse(
+        STREAMERS[fmt](columns, rows),
+        content_type=EXPORT_CONTENT_TYPES[fmt],
+    )
+    stamp = timezone.localtime().strftime('%Y%m%d-%H%M')
+    response['Content-Disposition'] = f'attachment; filename="{filename}-{stamp}.{fmt}"'
+    patch_cache_control(response, private=True, no_store=True)
+    # Que un proxy (nginx) no acumule el cuerpo antes de reenviarlo
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+class ExportViewMixin:
+    """
+    Acción ``export`` para ViewSets.
+
+    Las vistas definen:
+        export_columns: Tupla de ``(columna, lookup de values_list)``.
+        export_filename: Nombre base del archivo.
+
+    y pueden redefinir ``get_export_queryset(export_all)`` si las columnas
+    necesitan anotaciones.
+    """
+    export_columns = ()
+    export_filename = 'export'
+
+    def get_export_queryset(self, export_all):
+        """
+        Queryset a exportar (el orden lo pone ``iter_keyset``): el de la vista
+        o, con ``export_all``, todas las filas del modelo.
+        """
+        queryset = self.get_queryset()
+        if export_all:
+            return queryset.model._default_manager.all()
+        return queryset
+
+    def get_export_format(self):
+        fmt = self.request.query_params.get('as', 'csv').lower()
+        if fmt not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(
+                {'as': [f"Formato no soportado: usar {' o '.join(EXPORT_CONTENT_TYPES)}."]}
+            )
+        return fmt
+
+    def is_export_all(self):
+        """``?all=1``: exportación de todos los usuarios, solo para staff."""
+        export_all = self.request.query_params.get('all', '').lower() in ALL_VALUES
+        if export_all and not self.request.user.is_staff:
+            raise PermissionDenied('Solo el staff puede exportar datos de todos los usuarios.')
+        return export_all
+
+    @action(detail=False, methods=['get'], url_path='export', throttle_classes=[ExportRateThrottle])
+    def export(self, request):
+        """Descarga CSV/JSON en streaming de los registros del usuario (o de todos, staff)."""
+        fmt = self.get_export_format()
+        export_all = self.is_export_all()
+
+        export_columns = self.export_columns
+        if export_all:
+            export_columns = (USERNAME_COLUMN, *export_columns)
+        columns = [column for column, _ in export_columns]
+        lookups = [lookup for _, lookup in export_columns]
+
+        logger.info(
+            "Exportación %s de %s por %s%s",
+            fmt, self.export_filename, request.user.username,
+            ' (todos los usuarios)' if export_all else '',
+        )
+        rows = iter_keyset(self.get_export_queryset(export_all), lookups)
+        filename = f"{self.export_filename}{'-todos' if export_all else ''}"
+        return export_response(columns, rows, fmt, filename)
@@ -0,0 +1,260 @@
+"""
+Sparse fieldsets (?fields= / ?expand=) para la API REST de MajobaSyS.
+
+Permite que el cliente pida solo los campos que necesita:
+
+    GET /api/v1/projects/1/?fields=id,name,client.name
+    GET /api/v1/users/profile/?expand=
+
+- ``fields``: lista separada por comas de los campos a devolver. Los campos
+  anidados se seleccionan con notación de punto (``client.name``).
+- ``expand``: lista de campos anidados (``Meta.expandable_fields``) a incluir.
+  Si el parámetro no se envía se expanden todos (comportamiento histórico);
+  ``?expand=`` vacío no expande ninguno.
+
+Un nombre que el serializer no tiene (o que no es expandible) responde 400
+en lugar de recortar la respuesta a ``{}``.
+
+Además de recortar la respuesta, ``SparseFieldsetViewMixin`` traduce los
+campos pedidos a ``.only()`` y ``select_related()`` sobre el queryset, de
+modo que las columnas y los JOINs no solicitados nunca se consultan.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+
+
+def parse_fieldset_param(value):
+    """
+    Convierte el valor de ``fields``/``expand`` en un árbol de nombres.
+
+    Args:
+        value (str | None): Valor crudo del query param.
+
+    Returns:
+        dict | None: ``{'id': {}, 'client': {'name': {}}}`` para
+        ``"id,client.name"``, o None si el parámetro no fue enviado.
+    """
+    if value is None:
+        return None
+    tree = {}
+    for raw_path in value.split(','):
+        node = tree
+        for part in raw_path.split('.'):
+            part = part.strip()
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+class SparseFieldsetMixin:
+    """
+    Mixin para serializers de lectura que recorta ``fields`` según el request.
+
+    Meta opcional:
+        expandable_fields: nombres de campos anidados controlados por ``expand``.
+        field_dependencies: columnas del modelo que necesita cada campo que no
+            mapea directo a una columna (propiedades, SerializerMethodField).
+            Permite que la vista siga usando ``.only()`` cuando se piden.
+    """
+
+    def get_field_path(self):
+        """Prefijo con puntos de este serializer dentro del raíz (``''`` en el raíz)."""
+        owner = self.parent if isinstance(self.parent, serializers.ListSerializer) else self
+        container = owner.parent
+        if not isinstance(container, SparseFieldsetMixin):
+            return ''
+        return f'{container.get_field_path()}{owner.field_name}.'
+
+    def check_sparse_names(self, param, names, known):
+        """Lanza ValidationError (400) si ``names`` incluye alguno fuera de ``known``."""
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            prefix = self.get_field_path()
+            raise serializers.ValidationError({
+                param: [f"Campos desconocidos: {', '.join(prefix + name for name in unknown)}."],
+            })
+
+    def get_sparse_spec(self):
+        """
+        Retorna los árboles ``(fields, expand)`` que aplican a este serializer.
+
+        El serializer raíz los lee del request; los anidados heredan el
+        sub-árbol correspondiente a su ``field_name`` dentro del padre.
+        """
+        owner = self.parent if isinstance(self.parent, serializers.ListSerializer) else self
+        container = owner.parent
+
+        if container is None:
+            request = self.context.get('request')
+            if request is None:
+                return None, None
+            params = getattr(request, 'query_params', request.GET)
+            # ?fields= vacío no tiene sentido (respuesta vacía): se ignora
+            return (
+                parse_fieldset_param(params.get(FIELDS_PARAM)) or None,
+                parse_fieldset_param(params.get(EXPAND_PARAM)),
+            )
+
+        if not isinstance(container, SparseFieldsetMixin):
+            return None, None
+
+        fields_tree, expand_tree = container.get_sparse_spec()
+        name = owner.field_name
+        return (
+            (fields_tree or {}).get(name) or None,
+            (expand_tree or {}).get(name) or None,
+        )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields_tree, expand_tree = self.get_sparse_spec()
+
+        if fields_tree:
+            self.check_sparse_names(FIELDS_PARAM, fields_tree, fields)
+            for name in list(fields):
+                if name not in fields_tree:
+                    fields.pop(name)
+
+        if expand_tree is not None:
+            expandable = getattr(self.Meta, 'expandable_fields', ())
+            self.check_sparse_names(EXPAND_PARAM, expand_tree, expandable)
+            for name in expandable:
+                if name not in expand_tree:
+                    fields.pop(name, None)
+
+        return fields
+
+
+def _collect_field_columns(model, field, prefix, only, related):
+    """
+    Agrega a ``only``/``related`` lo que necesita ``field`` para serializarse.
+
+    Returns:
+        bool: False si el campo no se puede mapear a columnas conocidas
+        (en ese caso no es seguro usar ``.only()``).
+    """
+    meta = getattr(field.parent, 'Meta', None)
+    dependencies = getattr(meta, 'field_dependencies', {})
+    if field.field_name in dependencies:
+        only.update(prefix + column for column in dependencies[field.field_name])
+        return True
+
+    if field.source == '*':
+        return False
+
+    is_nested = isinstance(field, serializers.BaseSerializer)
+    attrs = field.source.split('.')
+    current_model = model
+    path = prefix
+
+    for index, attr in enumerate(attrs):
+        try:
+            model_field = current_model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return False
+        is_last = index == len(attrs) - 1
+
+        if not model_field.is_relation:
+            if not is_last:
+                return False
+            only.add(path + attr)
+            return True
+
+        if model_field.many_to_many or model_field.one_to_many:
+            return False
+
+        if is_last and not is_nested:
+            # FK serializada como PK: basta con la columna local
+            if not model_field.concrete:
+                return False
+            only.add(path + attr)
+            return True
+
+        related.add(path + attr)
+        if model_field.concrete:
+            only.add(path + attr)
+        current_model = model_field.related_model
+        path = f'{path}{attr}__'
+
+    if not is_nested:
+        return False
+    return all(
+        _collect_field_columns(current_model, sub_field, path, only, related)
+        for sub_field in field.fields.values()
+    )
+
+
+def get_queryset_plan(model, fields):
+    """
+    Calcula las columnas y relaciones necesarias para serializar ``fields``.
+
+    Args:
+        model: Clase del modelo raíz del queryset.
+        fields: Campos ya recortados (``serializer.fields.values()``).
+
+    Returns:
+        tuple[set, set] | None: ``(only, select_related)``, o None si algún
+        campo no se puede resolver y hay que traer todas las columnas.
+    """
+    only = {model._meta.pk.name}
+    related = set()
+    for field in fields:
+        if not _collect_field_columns(model, field, '', only, related):
+            return None
+    return only, related
+
+
+class SparseFieldsetViewMixin:
+    """
+    Mixin para vistas genéricas que aplica el sparse fieldset al queryset.
+
+    Solo actúa en las acciones de lectura y cuando el request trae ``fields``
+    o ``expand``; sin esos parámetros el queryset queda intacto.
+    """
+    sparse_fieldset_actions = ('list', 'retrieve')
+    # Columnas que siempre se cargan (ej: 'user' para el permiso IsOwner)
+    sparse_fieldset_required = ()
+
+    def get_sparse_fields(self):
+        """
+        Retorna los campos efectivos del serializer de lectura, o None.
+
+        Se cachea en la vista porque ``get_queryset`` puede consultarlo
+        más de una vez por request.
+        """
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = None
+            params = self.request.query_params
+            if (
+                getattr(self, 'action', None) in self.sparse_fieldset_actions
+                and (FIELDS_PARAM in params or EXPAND_PARAM in params)
+            ):
+                serializer_class = self.get_serializer_class()
+                serializer = serializer_class(context=self.get_serializer_context())
+                self._sparse_fields = serializer.fields
+        return self._sparse_fields
+
+    def is_field_requested(self, name):
+        """Indica si ``name`` forma parte de la respuesta de este request."""
+        fields = self.get_sparse_fields()
+        return fields is None or name in fields
+
+    def apply_sparse_fieldset(self, queryset):
+        """Restringe columnas y JOINs del queryset a los campos pedidos."""
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+
+        plan = get_queryset_plan(queryset.model, fields.values())
+        if plan is None:
+            return queryset
+
+        only, related = plan
+        only.update(self.sparse_fieldset_required)
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*sorted(related))
+        return queryset.only(*sorted(only))
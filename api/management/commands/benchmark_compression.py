@@ -0,0 +1,96 @@
+"""
+Benchmark de la compresión de respuestas dinámicas (CompressionMiddleware).
+
+Para páginas JSON de la API de distinto tamaño y para el HTML de una vista
+pública, mide los bytes que viajan por la red sin comprimir, con gzip y con
+brotli, y el costo de CPU de comprimir cada respuesta.
+
+Uso:
+    python manage.py benchmark_compression
+    python manage.py benchmark_compression --rows 5 20 100 --iterations 500
+"""
+import timeit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.text import compress_string
+
+from api.management.commands.benchmark_json import build_notification_page, build_project_page
+from api.renderers import ORJSONRenderer
+from majobacore.utils.compression import (
+    DEFAULT_BROTLI_QUALITY,
+    DEFAULT_MIN_LENGTH,
+    CompressionMiddleware,
+    brotli,
+    compress_brotli,
+)
+
+
+class Command(BaseCommand):
+    help = 'Mide bytes en la red y CPU de gzip/brotli por tamaño de respuesta'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[5, 20, 100],
+            help='Tamaños de página JSON a medir (default: 5 20 100)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=500,
+            help='Repeticiones por medición (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        quality = getattr(settings, 'RESPONSE_COMPRESSION_BROTLI_QUALITY', DEFAULT_BROTLI_QUALITY)
+        min_length = getattr(settings, 'RESPONSE_COMPRESSION_MIN_LENGTH', DEFAULT_MIN_LENGTH)
+
+        if brotli is None:
+            self.stdout.write(self.style.WARNING('brotli no está instalado: solo se mide gzip'))
+        self.stdout.write(f'Umbral: {min_length} bytes, calidad brotli: {quality}\n')
+
+        renderer = ORJSONRenderer()
+        payloads = []
+        for rows in options['rows']:
+            payloads.append((f'projects x{rows}', renderer.render(build_project_page(rows))))
+            payloads.append((f'notifications x{rows}', renderer.render(build_notification_page(rows))))
+        payloads.append(('index.html', render_to_string('index.html').encode()))
+
+        self.stdout.write(
+            f'{"respuesta":<20} {"original":>9} {"gzip":>9} {"µs":>7} '
+            f'{"br":>9} {"µs":>7}'
+        )
+        for name, content in payloads:
+            self._measure(name, content, quality, min_length, iterations)
+
+    def _measure(self, name, content, quality, min_length, iterations):
+        """Imprime tamaños y µs por respuesta de cada compresor."""
+        size = len(content)
+        if size < min_length:
+            self.stdout.write(f'{name:<20} {size:>9} (bajo el umbral: se envía sin comprimir)')
+            return
+
+        max_random_bytes = CompressionMiddleware.max_random_bytes
+        gzip_size = len(compress_string(content, max_random_bytes=max_random_bytes))
+        gzip_us = self._time(
+            lambda: compress_string(content, max_random_bytes=max_random_bytes), iterations,
+        )
+        line = (
+            f'{name:<20} {size:>9} {gzip_size:>9} {gzip_us:>7.1f} '
+        )
+
+        if brotli is not None:
+            br_size = len(compress_brotli(content, quality))
+            br_us = self._time(lambda: compress_brotli(content, quality), iterations)
+            line += f'{br_size:>9} {br_us:>7.1f}'
+
+        self.stdout.write(line)
+
+    def _time(self, func, iterations):
+        """µs por llamada (mejor de 3 repeticiones)."""
+        return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
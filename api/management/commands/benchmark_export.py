@@ -0,0 +1,109 @@
+"""
+Benchmark de las exportaciones en streaming (api/exports.py).
+
+Crea proyectos de prueba dentro de una transacción que se revierte al final
+y consume ``GET /api/v1/projects/export/`` completo dos veces: con una
+décima parte de las filas y con todas. Para cada corrida informa el tiempo
+hasta el primer chunk, el tiempo total, los bytes generados y el pico de
+memoria Python (tracemalloc) durante el streaming: el pico debe ser el mismo
+para ambos tamaños.
+
+Uso:
+    python manage.py benchmark_export
+    python manage.py benchmark_export --rows 1000000 --as json
+"""
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.v1.projects.views import ProjectViewSet
+from manager.models import Client, Project
+from users.models import CustomUser
+
+INSERT_BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = 'Mide primer byte, throughput y memoria de la exportación en streaming de proyectos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=200_000,
+            help='Proyectos a exportar en la corrida grande (default: 200000)',
+        )
+        parser.add_argument(
+            '--as',
+            dest='fmt',
+            choices=['csv', 'json'],
+            default='csv',
+            help='Formato de exportación (default: csv)',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+
+        with transaction.atomic():
+            small_user = self._create_user('benchmark_export_small')
+            large_user = self._create_user('benchmark_export_large')
+            self._create_projects(small_user, rows // 10)
+            self._create_projects(large_user, rows)
+
+            for user, count in ((small_user, rows // 10), (large_user, rows)):
+                first_chunk_ms, total_s, size, peak = self._export(user, options['fmt'])
+                self.stdout.write(
+                    f'{count:>9} filas: primer chunk {first_chunk_ms:6.1f} ms, total {total_s:6.2f} s '
+                    f'({count / total_s:,.0f} filas/s), {size / 2**20:7.1f} MiB, '
+                    f'pico de memoria {peak / 2**20:5.1f} MiB'
+                )
+
+            transaction.set_rollback(True)
+
+    def _create_user(self, username):
+        return CustomUser.objects.create(
+            username=username, first_name='Bench', last_name='Mark', phone='0000000000',
+        )
+
+    def _create_projects(self, user, count):
+        clients = Client.objects.bulk_create(
+            Client(user=user, name=f'Cliente {i}', phone=f'351{i:07d}') for i in range(100)
+        )
+        start = date(2015, 1, 1)
+        for offset in range(0, count, INSERT_BATCH_SIZE):
+            Project.objects.bulk_create(
+                Project(
+                    user=user,
+                    client=clients[i % len(clients)],
+                    name=f'Obra {i}',
+                    location='Av. Colón 1234, Córdoba',
+                    description='Estructura de hormigón armado, 4 plantas',
+                    start_date=start + timedelta(days=i % 3650),
+                )
+                for i in range(offset, min(offset + INSERT_BATCH_SIZE, count))
+            )
+
+    def _export(self, user, fmt):
+        """Consume la respuesta completa como lo haría el servidor WSGI."""
+        request = APIRequestFactory().get('/api/v1/projects/export/', {'as': fmt})
+        force_authenticate(request, user=user)
+        view = ProjectViewSet.as_view({'get': 'export'}, throttle_classes=[])
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        response = view(request)
+        chunks = iter(response.streaming_content)
+        size = len(next(chunks))
+        first_chunk_ms = (time.perf_counter() - start) * 1e3
+        for chunk in chunks:
+            size += len(chunk)
+        total_s = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # Sin response.close(): dispara request_finished, que cerraría la
+        # conexión en medio de la transacción del benchmark.
+        return first_chunk_ms, total_s, size, peak
@@ -0,0 +1,131 @@
+"""
+Microbenchmark de serialización JSON de la API: renderer/parser de DRF vs orjson.
+
+Arma en memoria (sin tocar la base de datos) una página de proyectos y una de
+notificaciones con la misma forma que devuelven los endpoints de listado, y
+mide render y parse con cada implementación.
+
+Uso:
+    python manage.py benchmark_json
+    python manage.py benchmark_json --rows 100 --iterations 2000
+"""
+import io
+import timeit
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+from api.v1.notifications.serializers import NotificationSerializer
+from api.v1.projects.serializers import ProjectListSerializer
+from manager.models import Client, Notification, Project
+
+
+def _paginated(results):
+    """Envuelve ``results`` con la forma de ``StandardPagination``."""
+    return {
+        'count': len(results),
+        'total_pages': 1,
+        'current_page': 1,
+        'next': None,
+        'previous': None,
+        'results': results,
+    }
+
+
+def build_project_page(rows):
+    """Página de ``ProjectListSerializer`` con ``rows`` proyectos sin guardar."""
+    client = Client(id=1, name='Constructora Del Sur S.A.', phone='3511234567')
+    projects = []
+    for i in range(rows):
+        project = Project(
+            id=i + 1,
+            name=f'Edificio Residencial Nº {i + 1}',
+            location='Av. Colón 1234, Córdoba',
+            start_date=date(2024, 1, 1) + timedelta(days=i),
+            end_date=date(2025, 1, 1) + timedelta(days=i) if i % 3 else None,
+            is_active=bool(i % 4),
+        )
+        if i % 5:
+            project.client = client
+        projects.append(project)
+    return _paginated(ProjectListSerializer(projects, many=True).data)
+
+
+def build_notification_page(rows):
+    """Página de ``NotificationSerializer`` con ``rows`` notificaciones sin guardar."""
+    now = timezone.now()
+    notifications = [
+        Notification(
+            id=i + 1,
+            message=f'¡Felicitaciones! sumaste {i * 10} puntos.',
+            description='Se han añadido puntos a tu cuenta.',
+            is_read=bool(i % 2),
+            created_at=now - timedelta(minutes=i * 37),
+        )
+        for i in range(rows)
+    ]
+    return _paginated(NotificationSerializer(notifications, many=True).data)
+
+
+class Command(BaseCommand):
+    help = 'Compara el render/parse JSON de DRF (stdlib) contra orjson sobre payloads de listado'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=100,
+            help='Filas por página (default: 100, el máximo de StandardPagination)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=1000,
+            help='Repeticiones por medición (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        iterations = options['iterations']
+
+        payloads = {
+            'projects': build_project_page(rows),
+            'notifications': build_notification_page(rows),
+        }
+
+        for name, data in payloads.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({rows} filas)'))
+
+            stock_bytes = JSONRenderer().render(data)
+            fast_bytes = ORJSONRenderer().render(data)
+            if stock_bytes == fast_bytes:
+                self.stdout.write(self.style.SUCCESS(f'  salida idéntica ({len(fast_bytes)} bytes)'))
+            else:
+                self.stdout.write(self.style.ERROR('  ¡la salida difiere entre renderers!'))
+
+            self._compare(
+                'render',
+                lambda: JSONRenderer().render(data),
+                lambda: ORJSONRenderer().render(data),
+                iterations,
+            )
+            self._compare(
+                'parse',
+                lambda: JSONParser().parse(io.BytesIO(stock_bytes)),
+                lambda: ORJSONParser().parse(io.BytesIO(stock_bytes)),
+                iterations,
+            )
+
+    def _compare(self, label, stock, fast, iterations):
+        """Mide ambas implementaciones e imprime µs por operación y speedup."""
+        stock_us = min(timeit.repeat(stock, number=iterations, repeat=3)) / iterations * 1e6
+        fast_us = min(timeit.repeat(fast, number=iterations, repeat=3)) / iterations * 1e6
+        self.stdout.write(
+            f'  {label:<6} drf={stock_us:8.1f} µs  orjson={fast_us:8.1f} µs  '
+            f'x{stock_us / fast_us:.1f}'
+        )
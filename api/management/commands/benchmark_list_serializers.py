@@ -0,0 +1,142 @@
+"""
+Benchmark del fast path ``.values()`` frente a los ModelSerializer de listado.
+
+Crea una página de filas reales (proyectos, clientes y notificaciones) dentro
+de una transacción que se revierte al final, verifica que ambos caminos
+generen exactamente los mismos bytes y mide el costo por fila de consultar
+y serializar con cada uno.
+
+Uso:
+    python manage.py benchmark_list_serializers
+    python manage.py benchmark_list_serializers --rows 100 --iterations 200
+"""
+import timeit
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from api.renderers import ORJSONRenderer
+from api.v1.clients.serializers import ClientSerializer
+from api.v1.notifications.serializers import NotificationSerializer
+from api.v1.projects.serializers import ProjectListSerializer
+from api.values import ValuesSerializer
+from manager.models import Client, Notification, Project
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = 'Compara ModelSerializer vs fast path .values() en páginas de listado'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=100,
+            help='Filas por página (default: 100)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Repeticiones por medición (default: 200)',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        iterations = options['iterations']
+
+        with transaction.atomic():
+            user = self._create_rows(rows)
+            cases = [
+                (
+                    'projects',
+                    ProjectListSerializer,
+                    Project.objects.filter(user=user).select_related('client')
+                    .order_by('-created_at')[:rows],
+                ),
+                (
+                    'clients',
+                    ClientSerializer,
+                    Client.objects.filter(user=user)
+                    .annotate(projects_count=Count('projects', filter=Q(projects__user=user)))
+                    .order_by('name')[:rows],
+                ),
+                (
+                    'notifications',
+                    NotificationSerializer,
+                    Notification.objects.filter(user=user).order_by('-created_at')[:rows],
+                ),
+            ]
+            for name, serializer_class, queryset in cases:
+                self._run_case(name, serializer_class, queryset, rows, iterations)
+
+            # No dejar datos de benchmark en la base
+            transaction.set_rollback(True)
+
+    def _create_rows(self, rows):
+        """Crea un usuario temporal con ``rows`` filas de cada modelo."""
+        user = CustomUser.objects.create(
+            username='benchmark_list_serializers',
+            first_name='Bench',
+            last_name='Mark',
+            phone='0000000000',
+        )
+        clients = Client.objects.bulk_create(
+            Client(user=user, name=f'Cliente {i:04d}', phone=f'351{i:07d}')
+            for i in range(rows)
+        )
+        Project.objects.bulk_create(
+            Project(
+                user=user,
+                client=clients[i] if i % 5 else None,
+                name=f'Edificio Residencial Nº {i + 1}',
+                description='Obra de ejemplo para benchmark.',
+                location='Av. Colón 1234, Córdoba',
+                start_date=date(2024, 1, 1) + timedelta(days=i),
+                end_date=date(2025, 1, 1) + timedelta(days=i) if i % 3 else None,
+                is_active=bool(i % 4),
+            )
+            for i in range(rows)
+        )
+        Notification.objects.bulk_create(
+            Notification(
+                user=user,
+                message=f'¡Felicitaciones! sumaste {i * 10} puntos.',
+                description='Se han añadido puntos a tu cuenta.',
+                is_read=bool(i % 2),
+            )
+            for i in range(rows)
+        )
+        return user
+
+    def _run_case(self, name, serializer_class, queryset, rows, iterations):
+        """Verifica igualdad de bytes y mide ambos caminos para un serializer."""
+        context = {'now': timezone.now()}
+        values_serializer = ValuesSerializer.compile(serializer_class(context=context))
+        if values_serializer is None:
+            raise CommandError(f'{serializer_class.__name__} no es compatible con el fast path')
+
+        def model_path():
+            return serializer_class(list(queryset.all()), many=True, context=context).data
+
+        def values_path():
+            values_queryset = queryset.all().values(*values_serializer.columns)
+            return values_serializer.to_representation(list(values_queryset))
+
+        renderer = ORJSONRenderer()
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({rows} filas)'))
+        if renderer.render(model_path()) == renderer.render(values_path()):
+            self.stdout.write(self.style.SUCCESS('  salida idéntica'))
+        else:
+            raise CommandError(f'La salida de {name} difiere entre ModelSerializer y .values()')
+
+        model_us = min(timeit.repeat(model_path, number=iterations, repeat=3)) / iterations * 1e6
+        values_us = min(timeit.repeat(values_path, number=iterations, repeat=3)) / iterations * 1e6
+        self.stdout.write(
+            f'  ModelSerializer={model_us / rows:6.1f} µs/fila  '
+            f'.values()={values_us / rows:6.1f} µs/fila  '
+            f'x{model_us / values_us:.1f}'
+        )
@@ -0,0 +1,93 @@
+"""
+Persiste y limpia la blacklist de refresh tokens (api/tokens.py).
+
+Reemplaza a ``flushexpiredtokens`` de SimpleJWT, que borra todos los tokens
+vencidos en una sola sentencia. En cada corrida:
+
+1. Vacía la cola ``jwt:pending`` de Redis a ``OutstandingToken`` (los
+   tokens emitidos desde la corrida anterior; los blacklisteados ya se
+   escribieron en la base en el request).
+2. Borra los tokens vencidos por lotes (``--batch-size``), cada lote en su
+   propia sentencia corta.
+3. Reconstruye el filtro de Bloom con los tokens blacklisteados vigentes.
+
+Sin Redis configurado solo hace el paso 2. En Railway corre cada 5 minutos
+como servicio cron (railway.flush.toml); un lock en Redis evita corridas
+superpuestas.
+
+Uso:
+    python manage.py flush_token_blacklist
+    python manage.py flush_token_blacklist --batch-size 1000 --skip-prune
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.tokens import (
+    DEFAULT_BATCH_SIZE,
+    FLUSH_LOCK_KEY,
+    get_redis_client,
+    persist_pending,
+    prune_expired_tokens,
+    rebuild_bloom_filter,
+    redis_key,
+)
+
+# Segundos que se retiene el lock si el proceso muere sin liberarlo
+LOCK_TIMEOUT = 600
+
+
+class Command(BaseCommand):
+    help = 'Persiste la blacklist JWT encolada en Redis y borra por lotes los tokens vencidos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Filas por lote al insertar y al borrar (default: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--skip-prune',
+            action='store_true',
+            help='No borrar tokens vencidos (solo persistir la cola y reconstruir el filtro)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        client = get_redis_client()
+
+        if client is None:
+            self.stdout.write('Cache sin Redis: la blacklist vive en la base, solo se borran vencidos')
+            if not options['skip_prune']:
+                self._prune(batch_size)
+            return
+
+        lock = client.lock(redis_key(FLUSH_LOCK_KEY), timeout=LOCK_TIMEOUT, blocking=False)
+        if not lock.acquire():
+            self.stdout.write(self.style.WARNING('Otra corrida de flush_token_blacklist está en curso'))
+            return
+        try:
+            start = time.perf_counter()
+            tokens, blacklisted = persist_pending(client, batch_size)
+            self.stdout.write(
+                f'{tokens} tokens persistidos ({blacklisted} blacklisteados) '
+                f'en {time.perf_counter() - start:.2f} s'
+            )
+            if not options['skip_prune']:
+                self._prune(batch_size)
+
+            start = time.perf_counter()
+            count = rebuild_bloom_filter(client, batch_size)
+            self.stdout.write(
+                f'Filtro de Bloom reconstruido con {count} tokens en {time.perf_counter() - start:.2f} s'
+            )
+        finally:
+            lock.release()
+
+    def _prune(self, batch_size):
+        start = time.perf_counter()
+        deleted = prune_expired_tokens(batch_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'{deleted} tokens vencidos borrados en {time.perf_counter() - start:.2f} s'
+        ))
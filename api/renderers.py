@@ -0,0 +1,84 @@
+"""
+Renderers para la API REST de MajobaSyS.
+"""
+import datetime
+import decimal
+
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson está en requirements/base.txt
+    orjson = None
+
+
+_fallback_encoder = JSONEncoder()
+_datetime_field = serializers.DateTimeField()
+_date_field = serializers.DateField()
+_time_field = serializers.TimeField()
+
+
+def orjson_default(obj):
+    """
+    Convierte los tipos que orjson no serializa (o que debe formatear DRF).
+
+    Las fechas respetan ``DATETIME_FORMAT``/``DATE_FORMAT``/``TIME_FORMAT`` de
+    REST_FRAMEWORK, igual que un campo de serializer, aunque lleguen crudas
+    dentro de un ``Response``. Los Decimal siguen ``COERCE_DECIMAL_TO_STRING``.
+    El resto (lazy strings, QuerySet, timedelta, ...) se delega al encoder de DRF.
+    """
+    if isinstance(obj, datetime.datetime):
+        return _datetime_field.to_representation(obj)
+    if isinstance(obj, datetime.date):
+        return _date_field.to_representation(obj)
+    if isinstance(obj, datetime.time):
+        return _time_field.to_representation(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj) if api_settings.COERCE_DECIMAL_TO_STRING else float(obj)
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer basado en orjson (C/Rust) en lugar de ``json`` de stdlib.
+
+    Con la salida de serializers genera exactamente los mismos bytes que el
+    renderer de DRF en la configuración por defecto (compacto, UTF-8). Solo
+    difieren los datetime naive o con offset y los Decimal que lleguen
+    crudos al ``Response``: se formatean como en un campo de serializer
+    (ver ``orjson_default``), no como el encoder de DRF. Si se pide un formato que
+    orjson no soporta (indentación distinta de 2, ASCII forzado, JSON no
+    compacto) o orjson no está instalado, cae al renderer estándar.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+
+        if (
+            orjson is None
+            or indent not in (None, 2)
+            or self.ensure_ascii
+            or not self.compact
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            ret = orjson.dumps(data, default=orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            # Casos que orjson rechaza y stdlib no (ej: enteros > 64 bits)
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Igual que DRF: escapar U+2028/U+2029 para que sea un subconjunto
+        # estricto de JavaScript.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,40 @@
+"""
+Señales de la app api.
+
+Un ``BlacklistedToken`` insertado fuera de ``CachedRefreshToken.blacklist``
+(el admin de SimpleJWT permite crearlos) no tiene su clave en Redis ni sus
+bits en el filtro de Bloom: el filtro lo daría por válido hasta el próximo
+``flush_token_blacklist``. Al confirmar se agrega a Redis y, si no se puede,
+se invalida el filtro (api/tokens.py).
+"""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from . import tokens
+
+logger = logging.getLogger('api')
+
+
+def _cache_blacklisted(jti, exp):
+    client = tokens.get_redis_client()
+    if client is None:
+        return
+    try:
+        tokens.add_to_blacklist(client, jti, exp)
+    except tokens.RedisError as e:
+        logger.warning("Redis no disponible para la blacklist JWT, se consulta la base: %s", e)
+        tokens.invalidate_bloom(client)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def cache_blacklisted_token(sender, instance, created, **kwargs):
+    """Lleva a Redis la revocación de un token blacklisteado directo en la base."""
+    if not created:
+        return
+    outstanding = instance.token
+    jti, exp = outstanding.jti, outstanding.expires_at.timestamp()
+    transaction.on_commit(lambda: _cache_blacklisted(jti, exp))
@@ -0,0 +1,147 @@
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt import tokens as simplejwt_tokens
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api import authentication
+from majobacore.utils import tiered_cache
+from majobacore.utils.hashers import HashingBusy
+from manager.models import Project
+from users.cache import get_cached_user, user_cache
+from users.models import CustomUser
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'api-auth-tests',
+    }
+}
+
+
+class HashingBusyAPITests(TestCase):
+    """``HashingBusy`` en la API (api/exceptions.py)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='cambia',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_cambio_de_contrasena_responde_429_con_retry_after(self):
+        data = {
+            'old_password': 'Contraseña-Larga-123',
+            'new_password': 'Otra-Contraseña-456',
+            'new_password_confirm': 'Otra-Contraseña-456',
+        }
+        with mock.patch.object(CustomUser, 'set_password', side_effect=HashingBusy):
+            response = self.client.put(reverse('api:api_change_password'), data)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '1')
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('Contraseña-Larga-123'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LOCAL_CACHE_ENABLED=True)
+class CachedJWTAuthenticationTests(TestCase):
+    """Usuario del JWT desde el cache en dos niveles (api/authentication.py, users/cache.py)."""
+
+    unread_count_url = '/api/v1/notifications/unread-count/'
+
+    def setUp(self):
+        cache.clear()
+        self.reset_local_cache()
+        self.addCleanup(self.reset_local_cache)
+        self.user = CustomUser.objects.create_user(
+            username='portador',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        self.client = APIClient()
+        self.authorize(self.user)
+
+    def reset_local_cache(self):
+        # Los ids se reusan entre tests: sin esto quedan versiones viejas anunciadas
+        tiered_cache._lru.clear()
+        tiered_cache._latest_versions.clear()
+
+    def authorize(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+
+    def test_segundo_request_no_consulta_el_usuario(self):
+        self.assertEqual(self.client.get(self.unread_count_url).status_code, 200)
+
+        # Solo el COUNT de notificaciones
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.unread_count_url).status_code, 200)
+
+    def test_usuario_desactivado_responde_401(self):
+        self.assertEqual(self.client.get(self.unread_count_url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        response = self.client.get(self.unread_count_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'user_inactive')
+
+    def test_usuario_borrado_responde_user_not_found(self):
+        self.assertEqual(self.client.get(self.unread_count_url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        response = self.client.get(self.unread_count_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'user_not_found')
+
+    def test_el_hash_de_la_contrasena_no_se_cachea(self):
+        self.client.get(self.unread_count_url)
+        key = user_cache.make_key(str(self.user.pk))
+
+        _, shared = cache.get(key)
+        _, local = tiered_cache._lru.get(key)
+        for values in (shared, local):
+            self.assertNotIn('password', values)
+            self.assertNotIn(self.user.password, values.values())
+        # Diferido: se lee de la base solo si se usa
+        self.assertIn('password', get_cached_user(self.user.pk).get_deferred_fields())
+
+    def test_check_revoke_token_rechaza_tras_cambiar_la_contrasena(self):
+        # api_settings de SimpleJWT no se recarga en los módulos que lo importaron
+        for module in (authentication, simplejwt_tokens):
+            patcher = mock.patch.object(module.api_settings, 'CHECK_REVOKE_TOKEN', True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.authorize(self.user)
+        self.assertEqual(self.client.get(self.unread_count_url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('Otra-Contraseña-456')
+            self.user.save()
+        response = self.client.get(self.unread_count_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'password_changed')
+
+    def test_usuario_cacheado_es_igual_a_la_fila_para_is_owner(self):
+        own = Project.objects.create(user=self.user, name='Propio', start_date=date(2024, 1, 1))
+        self.client.get(self.unread_count_url)
+
+        cached = get_cached_user(self.user.pk)
+        self.assertEqual(cached, CustomUser.objects.get(pk=self.user.pk))
+        self.assertEqual(own.user, cached)
+        self.assertFalse(cached._state.adding)
+
+        response = self.client.get(f'/api/v1/projects/{own.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Propio')
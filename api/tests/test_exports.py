@@ -0,0 +1,73 @@
+import csv
+import io
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.exports import stream_csv
+from api.v1.notifications.views import NotificationViewSet
+from manager.importers import _text
+from manager.models import Notification
+from users.models import CustomUser
+
+
+def read_csv(chunks):
+    return list(csv.reader(io.StringIO(''.join(chunks).lstrip('\ufeff'))))
+
+
+class StreamCSVTests(SimpleTestCase):
+    """Exportación CSV en streaming (api/exports.py)."""
+
+    def test_textos_que_empiezan_como_formula_salen_escapados(self):
+        rows = [
+            ('=HYPERLINK("http://evil.example","clic")',),
+            ('+54 351 1234567',),
+            ('-2 pisos',),
+            ('@SUM(A1:A2)',),
+            ('\tTab',),
+            ('\rCR',),
+            ('Vivienda = 2 pisos',),
+        ]
+
+        exported = read_csv(stream_csv(['name'], rows))
+
+        self.assertEqual([row[0] for row in exported[1:]], [
+            '\'=HYPERLINK("http://evil.example","clic")',
+            "'+54 351 1234567",
+            "'-2 pisos",
+            "'@SUM(A1:A2)",
+            "'\tTab",
+            "'\rCR",
+            'Vivienda = 2 pisos',
+        ])
+
+    def test_numeros_negativos_no_se_escapan(self):
+        exported = read_csv(stream_csv(['points'], [(-5,), (None,), (True,)]))
+
+        self.assertEqual(exported[1:], [['-5'], [''], ['true']])
+
+    def test_el_importador_quita_el_escape(self):
+        exported = read_csv(stream_csv(['name'], [('=1+1',), ("'citado'",)]))
+
+        self.assertEqual([_text(row[0]) for row in exported[1:]], ['=1+1', "'citado'"])
+
+
+class ExportQuerysetTests(TestCase):
+    """Queryset por defecto de ``ExportViewMixin.get_export_queryset``."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='exporta', password='x', phone='1')
+        other = CustomUser.objects.create_user(username='otro', password='x', phone='2')
+        self.own = Notification.objects.create(user=self.user, message='Propia')
+        Notification.objects.create(user=other, message='Ajena')
+
+        request = Request(APIRequestFactory().get('/api/v1/notifications/export/'))
+        request.user = self.user
+        self.view = NotificationViewSet(request=request, format_kwarg=None, kwargs={}, action='export')
+
+    def test_exporta_el_queryset_de_la_vista(self):
+        self.assertQuerySetEqual(self.view.get_export_queryset(export_all=False), [self.own])
+
+    def test_export_all_exporta_todas_las_filas(self):
+        self.assertEqual(self.view.get_export_queryset(export_all=True).count(), 2)
@@ -0,0 +1,79 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from manager.models import Client, Project
+from users.models import CustomUser
+
+
+class SparseFieldsetTests(TestCase):
+    """``?fields=`` / ``?expand=`` en los endpoints v1 (api/fieldsets.py)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='campos',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        client = Client.objects.create(user=self.user, name='Ana', phone='351 111')
+        self.project = Project.objects.create(
+            user=self.user, client=client, name='Casa', start_date=date(2024, 3, 1),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.detail_url = f'/api/v1/projects/{self.project.pk}/'
+
+    def test_listado_con_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/projects/', {'fields': 'id,name'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [{'id': self.project.pk, 'name': 'Casa'}])
+        # Sin client_name no hace falta el JOIN con clientes
+        self.assertFalse(any('manager_client' in query['sql'] for query in queries.captured_queries))
+
+    def test_fields_vacio_devuelve_todos_los_campos(self):
+        response = self.client.get('/api/v1/projects/', {'fields': ''})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['client_name'], 'Ana')
+
+    def test_listado_con_campo_desconocido_responde_400(self):
+        for fields in ('nombre', 'id,nombre'):
+            with self.subTest(fields=fields):
+                response = self.client.get('/api/v1/projects/', {'fields': fields})
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'fields': ['Campos desconocidos: nombre.']})
+
+    def test_detalle_con_campos_anidados(self):
+        response = self.client.get(self.detail_url, {'fields': 'id,client.name'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'id': self.project.pk, 'client': {'name': 'Ana'}})
+
+    def test_detalle_con_campo_anidado_desconocido_responde_400(self):
+        response = self.client.get(self.detail_url, {'fields': 'id,client.direccion'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Campos desconocidos: client.direccion.']})
+
+    def test_detalle_expand(self):
+        expanded = self.client.get(self.detail_url).json()
+        self.assertEqual(expanded['client']['name'], 'Ana')
+
+        response = self.client.get(self.detail_url, {'expand': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('client', response.json())
+
+        response = self.client.get(self.detail_url, {'expand': 'client'})
+        self.assertEqual(response.json()['client'], expanded['client'])
+
+    def test_expand_de_campo_no_expandible_responde_400(self):
+        response = self.client.get(self.detail_url, {'expand': 'name'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'expand': ['Campos desconocidos: name.']})
@@ -0,0 +1,138 @@
+import io
+from datetime import date
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from manager.models import Client, Project
+from users.models import CustomUser
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - openpyxl es opcional (solo XLSX)
+    openpyxl = None
+
+IMPORT_URL = '/api/v1/projects/import/'
+
+
+def csv_upload(text, name='proyectos.csv', encoding='utf-8-sig'):
+    return SimpleUploadedFile(name, text.encode(encoding), content_type='text/csv')
+
+
+class ProjectImportTests(TestCase):
+    """POST /api/v1/projects/import/ (manager/importers.py)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='importa',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def post(self, upload, **data):
+        return self.client.post(IMPORT_URL, {'file': upload, **data}, format='multipart')
+
+    def test_csv_con_bom_y_punto_y_coma(self):
+        Client.objects.create(user=self.user, name='Ana Pérez', phone='351 111-2222')
+        upload = csv_upload(
+            'Nombre;Fecha de Inicio;Fecha_Fin;Cliente;Teléfono;Activo\n'
+            'Casa;2024-03-01;15/04/2024;ana perez;3511112222;sí\n'
+            'Galpón;01/02/2024;;Juan;351 999;no\n'
+            'Quincho;2024-05-10;;JUAN;351-999;\n'
+        )
+
+        response = self.post(upload)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['rows'], 3)
+        self.assertEqual(response.data['created_projects'], 3)
+        self.assertEqual(response.data['error_count'], 0)
+        # Ana ya existía; Juan aparece dos veces con distinto formato
+        self.assertEqual(response.data['created_clients'], 1)
+        self.assertEqual(response.data['reused_clients'], 1)
+        self.assertEqual(Client.objects.filter(user=self.user).count(), 2)
+
+        casa = Project.objects.get(user=self.user, name='Casa')
+        self.assertEqual(casa.client.name, 'Ana Pérez')
+        self.assertEqual(casa.end_date, date(2024, 4, 15))
+        galpon = Project.objects.get(user=self.user, name='Galpón')
+        self.assertFalse(galpon.is_active)
+        self.assertEqual(galpon.start_date, date(2024, 2, 1))
+        self.assertEqual(Project.objects.get(name='Quincho').client_id, galpon.client_id)
+
+    def test_fila_invalida_se_informa_y_las_demas_se_importan(self):
+        upload = csv_upload(
+            'name,start_date,end_date,is_active\n'
+            'Buena,2024-01-01,,\n'
+            ',31/02/2024,2023-01-01,quizás\n'
+            'Al revés,2024-06-01,2024-05-01,\n'
+        )
+
+        response = self.post(upload)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created_projects'], 1)
+        self.assertEqual(response.data['error_count'], 2)
+        first, second = response.data['errors']
+        self.assertEqual(first['row'], 3)
+        self.assertEqual(
+            [message.split(':')[0] for message in first['errors']],
+            ['name', 'start_date', 'is_active'],
+        )
+        self.assertEqual(second, {'row': 4, 'errors': ['end_date: no puede ser anterior a start_date']})
+        self.assertQuerySetEqual(Project.objects.values_list('name', flat=True), ['Buena'])
+
+    def test_dry_run_no_escribe(self):
+        response = self.post(csv_upload('name,start_date\nCasa,2024-01-01\n'), dry_run='true')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created_projects'], 1)
+        self.assertFalse(Project.objects.exists())
+
+    def test_csv_que_no_es_utf8(self):
+        upload = csv_upload('name,start_date\nGalpón,2024-01-01\n', encoding='latin-1')
+
+        response = self.post(upload)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('UTF-8', response.data['file'][0])
+
+    def test_faltan_columnas_obligatorias(self):
+        response = self.post(csv_upload('nombre,cliente\nCasa,Ana\n'))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('start_date', response.data['file'][0])
+
+    @override_settings(PROJECT_IMPORT_MAX_SIZE=64)
+    def test_archivo_demasiado_grande(self):
+        rows = ''.join(f'Proyecto {number},2024-01-01\n' for number in range(10))
+
+        response = self.post(csv_upload('name,start_date\n' + rows))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Project.objects.exists())
+
+    def test_sin_archivo(self):
+        response = self.client.post(IMPORT_URL, {}, format='multipart')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_xlsx(self):
+        if openpyxl is None:  # pragma: no cover
+            self.skipTest('requiere openpyxl')
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['Nombre', 'Fecha de inicio', 'Cliente'])
+        sheet.append(['Casa', date(2024, 3, 1), 'Ana'])
+        sheet.append([None, None, None])
+        stream = io.BytesIO()
+        workbook.save(stream)
+
+        response = self.post(SimpleUploadedFile('proyectos.xlsx', stream.getvalue()))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['rows'], 1)
+        self.assertEqual(Project.objects.get().start_date, date(2024, 3, 1))
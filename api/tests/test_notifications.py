@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.test import APIClient
+
+from api.v1.notifications.views import SERVER_TIME_HEADER
+from manager.models import Notification
+from users.models import CustomUser
+
+LIST_URL = '/api/v1/notifications/'
+
+
+class NotificationListCachingTests(TestCase):
+    """Headers de cache y ``?humanize=`` del listado de notificaciones."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='avisos',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        old = Notification.objects.create(user=self.user, message='Vieja')
+        Notification.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(hours=3))
+        Notification.objects.create(user=self.user, message='Nueva')
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get(self, params=None, now=None, **extra):
+        now = now or timezone.now()
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            return self.client.get(LIST_URL, params, **extra)
+
+    def test_humanize_por_defecto_incluye_time_elapsed(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        rows = response.json()['results']
+        self.assertEqual([row['time_elapsed'] for row in rows], ['ahora', 'hace 3 horas'])
+
+    def test_humanize_cero_omite_time_elapsed(self):
+        for value in ('0', 'false', 'no'):
+            with self.subTest(humanize=value):
+                rows = self.get({'humanize': value}).json()['results']
+
+                self.assertEqual(len(rows), 2)
+                for row in rows:
+                    self.assertNotIn('time_elapsed', row)
+                    self.assertIn('created_at', row)
+
+    def test_header_x_server_time(self):
+        now = timezone.now()
+
+        response = self.get({'humanize': '0'}, now=now)
+
+        # Mismo formato que created_at: el cliente resta una fecha de la otra
+        self.assertEqual(parse_datetime(response[SERVER_TIME_HEADER]), now)
+        created_at = response.json()['results'][0]['created_at']
+        self.assertEqual(response[SERVER_TIME_HEADER][-1], created_at[-1])
+
+    def test_cache_control_privado_y_vary_authorization(self):
+        response = self.get()
+
+        directives = {part.strip() for part in response['Cache-Control'].split(',')}
+        self.assertEqual(directives, {'private', 'no-cache'})
+        self.assertIn('Authorization', response['Vary'])
+
+    def test_304_con_if_none_match(self):
+        first = self.get({'humanize': '0'})
+        etag = first['ETag']
+
+        # Aunque pase el tiempo, sin time_elapsed el cuerpo no cambia
+        later = timezone.now() + timedelta(hours=2)
+        response = self.get({'humanize': '0'}, now=later, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_sin_304_si_cambian_las_notificaciones(self):
+        etag = self.get({'humanize': '0'})['ETag']
+        Notification.objects.create(user=self.user, message='Otra')
+
+        response = self.get({'humanize': '0'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_acciones_de_escritura_sin_headers_de_lectura(self):
+        response = self.client.post(f'{LIST_URL}mark-all-read/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(SERVER_TIME_HEADER, response)
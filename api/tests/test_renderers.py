@@ -0,0 +1,195 @@
+import datetime
+import decimal
+import io
+import uuid
+from unittest import mock, skipIf
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api import renderers
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+
+
+class ClientSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+
+
+class ProjectSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    budget = serializers.DecimalField(max_digits=12, decimal_places=2)
+    start_date = serializers.DateField()
+    updated_at = serializers.DateTimeField()
+    client = ClientSerializer()
+    tags = serializers.ListField(child=serializers.CharField())
+
+
+def projects():
+    return [
+        {
+            'name': 'Casa Güemes — 2 pisos',
+            'budget': decimal.Decimal('1520300.5'),
+            'start_date': datetime.date(2024, 3, 1),
+            'updated_at': timezone.now(),
+            'client': {'id': uuid.uuid4(), 'name': 'Ana'},
+            'tags': ['obra', 'línea\u2028nueva'],
+        },
+        {
+            'name': 'Galpón',
+            'budget': decimal.Decimal('0'),
+            'start_date': datetime.date(2023, 12, 31),
+            'updated_at': datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            'client': {'id': uuid.uuid4(), 'name': 'Sin cliente'},
+            'tags': [],
+        },
+    ]
+
+
+@skipIf(renderers.orjson is None, 'requiere orjson')
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer genera los mismos bytes que el JSONRenderer de DRF (api/renderers.py)."""
+
+    def render_both(self, data, accepted_media_type=None, renderer_context=None):
+        return (
+            JSONRenderer().render(data, accepted_media_type, renderer_context),
+            ORJSONRenderer().render(data, accepted_media_type, renderer_context),
+        )
+
+    def assertSameBytes(self, data, accepted_media_type=None, renderer_context=None):
+        expected, actual = self.render_both(data, accepted_media_type, renderer_context)
+        self.assertEqual(actual, expected)
+        return actual
+
+    def test_datos_de_serializer_anidados(self):
+        data = {
+            'count': 2,
+            'next': None,
+            'results': ProjectSerializer(projects(), many=True).data,
+        }
+
+        body = self.assertSameBytes(data)
+
+        self.assertIn(b'"1520300.50"', body)
+        self.assertIn(b'\\u2028', body)
+
+    def test_decimal_sin_coercion_a_string(self):
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'COERCE_DECIMAL_TO_STRING': False}):
+            data = ProjectSerializer(projects(), many=True).data
+            body = self.assertSameBytes(data)
+
+        self.assertIn(b'"budget":1520300.5', body)
+
+    def test_tipos_crudos_que_coinciden_con_drf(self):
+        data = {
+            'utc': timezone.now(),
+            'date': datetime.date(2024, 1, 2),
+            'time': datetime.time(1, 2, 3, 4),
+            'uuid': uuid.uuid4(),
+            'lazy': _('Notificación'),
+            'duration': datetime.timedelta(hours=1),
+            'int_keys': {1: 'a', 2: 'b'},
+            'tuple': (1, 2),
+            'big': 2 ** 70,
+            'floats': [1.0, 1e20, 0.1],
+            'nothing': None,
+        }
+
+        self.assertSameBytes(data)
+
+    def test_datetime_crudo_sigue_datetime_format(self):
+        value = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+        rest_framework = {**settings.REST_FRAMEWORK, 'DATETIME_FORMAT': '%Y-%m-%dT%H:%M:%S%z'}
+
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            body = ORJSONRenderer().render({'updated_at': value})
+
+        self.assertEqual(body, b'{"updated_at":"2024-01-02T03:04:05+0000"}')
+
+    def test_decimal_crudo_sigue_coerce_decimal_to_string(self):
+        data = {'budget': decimal.Decimal('1.50')}
+
+        self.assertEqual(ORJSONRenderer().render(data), b'{"budget":"1.50"}')
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'COERCE_DECIMAL_TO_STRING': False}):
+            self.assertEqual(ORJSONRenderer().render(data), b'{"budget":1.5}')
+
+    def test_none_es_cuerpo_vacio(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indent_2_con_orjson(self):
+        data = ProjectSerializer(projects(), many=True).data
+
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps:
+            self.assertSameBytes(data, 'application/json; indent=2')
+
+        dumps.assert_called_once()
+
+    def test_indent_distinto_de_2_usa_drf(self):
+        data = ProjectSerializer(projects(), many=True).data
+
+        with mock.patch.object(renderers.orjson, 'dumps') as dumps:
+            self.assertSameBytes(data, 'application/json; indent=4')
+            self.assertSameBytes(data, None, {'indent': 3})
+
+        dumps.assert_not_called()
+
+    def test_ensure_ascii_y_no_compacto_usan_drf(self):
+        data = ProjectSerializer(projects(), many=True).data
+
+        for options in ({'ensure_ascii': True}, {'compact': False}):
+            with self.subTest(**options):
+                drf = type('Renderer', (JSONRenderer,), options)()
+                fast = type('Renderer', (ORJSONRenderer,), options)()
+                with mock.patch.object(renderers.orjson, 'dumps') as dumps:
+                    self.assertEqual(fast.render(data), drf.render(data))
+                dumps.assert_not_called()
+
+    def test_sin_orjson_usa_drf(self):
+        data = ProjectSerializer(projects(), many=True).data
+        expected = JSONRenderer().render(data)
+
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(ORJSONRenderer().render(data), expected)
+
+
+@skipIf(renderers.orjson is None, 'requiere orjson')
+class ORJSONParserTests(SimpleTestCase):
+    """ORJSONParser (api/parsers.py)."""
+
+    def parse(self, body, encoding='utf-8'):
+        return ORJSONParser().parse(io.BytesIO(body), 'application/json', {'encoding': encoding})
+
+    def test_json_valido(self):
+        self.assertEqual(
+            self.parse('{"nombre": "Güemes", "pisos": [1, 2.5, null]}'.encode()),
+            {'nombre': 'Güemes', 'pisos': [1, 2.5, None]},
+        )
+
+    def test_json_mal_formado_es_parse_error(self):
+        for body in (b'{"nombre": ', b'{nombre: 1}', b'', b'\xff\xfe'):
+            with self.subTest(body=body):
+                with self.assertRaisesMessage(ParseError, 'JSON parse error'):
+                    self.parse(body)
+
+    def test_nan_es_parse_error(self):
+        with self.assertRaises(ParseError):
+            self.parse(b'{"valor": NaN}')
+
+    def test_otro_charset_usa_drf(self):
+        with mock.patch.object(renderers.orjson, 'loads') as loads:
+            data = self.parse('{"nombre": "Güemes"}'.encode('latin-1'), encoding='latin-1')
+
+        loads.assert_not_called()
+        self.assertEqual(data, {'nombre': 'Güemes'})
+
+    def test_sin_orjson_usa_drf(self):
+        with mock.patch('api.parsers.orjson', None):
+            self.assertEqual(self.parse(b'{"a": 1}'), {'a': 1})
+            with self.assertRaises(ParseError):
+                self.parse(b'{"a": ')
@@ -0,0 +1,130 @@
+from unittest import mock, skipIf
+
+from django.test import TestCase
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from api import tokens
+from api.tokens import (
+    BLACKLIST_KEY_PREFIX,
+    BLOOM_KEY,
+    BLOOM_READY_KEY,
+    CachedRefreshToken,
+    rebuild_bloom_filter,
+    redis_key,
+)
+from users.models import CustomUser
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - fakeredis está en requirements/development.txt
+    fakeredis = None
+
+
+@skipIf(fakeredis is None, 'requiere fakeredis')
+class CachedRefreshTokenTests(TestCase):
+    """Blacklist JWT en Redis con la base como respaldo (api/tokens.py)."""
+
+    def setUp(self):
+        self.redis = fakeredis.FakeRedis()
+        patcher = mock.patch('api.tokens.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, tokens, '_bloom_stale', False)
+
+        self.user = CustomUser.objects.create_user(
+            username='tokens',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        # Filtro construido (vacío): un token sin bits se da por válido sin ir a la base
+        rebuild_bloom_filter(self.redis)
+
+    def test_blacklist_en_redis(self):
+        token = CachedRefreshToken.for_user(self.user)
+        token.blacklist()
+
+        with self.assertRaises(TokenError), self.assertNumQueries(0):
+            CachedRefreshToken(str(token)).check_blacklist()
+
+    def test_blacklist_sobrevive_a_redis_vaciado(self):
+        token = CachedRefreshToken.for_user(self.user)
+        token.blacklist()
+        # Eviction o reinicio: Redis pierde la clave, los bits y la marca
+        self.redis.flushall()
+
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=token['jti']).exists())
+        with self.assertRaises(TokenError):
+            CachedRefreshToken(str(token)).check_blacklist()
+
+    def test_filtro_desalojado_consulta_la_base(self):
+        token = CachedRefreshToken.for_user(self.user)
+        token.blacklist()
+        self.redis.delete(redis_key(f'{BLACKLIST_KEY_PREFIX}:{token["jti"]}'), redis_key(BLOOM_KEY))
+
+        with self.assertRaises(TokenError):
+            CachedRefreshToken(str(token)).check_blacklist()
+
+    def test_token_valido_no_consulta_la_base(self):
+        token = CachedRefreshToken.for_user(self.user)
+
+        with self.assertNumQueries(0):
+            CachedRefreshToken(str(token)).check_blacklist()
+
+    def test_blacklist_durante_corte_de_redis_sigue_revocado(self):
+        token = CachedRefreshToken.for_user(self.user)
+        error = RedisConnectionError('Redis no disponible')
+        with mock.patch('api.tokens.add_to_blacklist', side_effect=error):
+            token.blacklist()
+
+        self.assertFalse(self.redis.exists(redis_key(BLOOM_READY_KEY)))
+        with self.assertRaises(TokenError):
+            CachedRefreshToken(str(token)).check_blacklist()
+
+    def test_redis_caido_del_todo_invalida_el_filtro_al_volver(self):
+        token = CachedRefreshToken.for_user(self.user)
+        error = RedisConnectionError('Redis no disponible')
+        with mock.patch('api.tokens.add_to_blacklist', side_effect=error), \
+                mock.patch.object(self.redis, 'delete', side_effect=error):
+            token.blacklist()
+        self.assertTrue(self.redis.exists(redis_key(BLOOM_READY_KEY)))
+
+        # Redis volvió con la marca de filtro construido y sin los bits del token
+        with self.assertRaises(TokenError):
+            CachedRefreshToken(str(token)).check_blacklist()
+        self.assertFalse(self.redis.exists(redis_key(BLOOM_READY_KEY)))
+
+    def test_blacklist_creado_en_la_base_se_ve_enseguida(self):
+        # Como el admin de SimpleJWT: filas creadas a mano, sin pasar por blacklist()
+        token = CachedRefreshToken.for_user(self.user)
+        outstanding = OutstandingToken.objects.create(
+            user=self.user,
+            jti=token['jti'],
+            token=str(token),
+            expires_at=datetime_from_epoch(token['exp']),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            BlacklistedToken.objects.create(token=outstanding)
+
+        self.assertTrue(self.redis.exists(redis_key(f'{BLACKLIST_KEY_PREFIX}:{token["jti"]}')))
+        with self.assertRaises(TokenError), self.assertNumQueries(0):
+            CachedRefreshToken(str(token)).check_blacklist()
+
+    def test_blacklist_creado_en_la_base_con_redis_caido_invalida_el_filtro(self):
+        token = CachedRefreshToken.for_user(self.user)
+        outstanding = OutstandingToken.objects.create(
+            user=self.user,
+            jti=token['jti'],
+            token=str(token),
+            expires_at=datetime_from_epoch(token['exp']),
+        )
+        error = RedisConnectionError('Redis no disponible')
+        with mock.patch('api.tokens.add_to_blacklist', side_effect=error), \
+                self.captureOnCommitCallbacks(execute=True):
+            BlacklistedToken.objects.create(token=outstanding)
+
+        self.assertFalse(self.redis.exists(redis_key(BLOOM_READY_KEY)))
+        with self.assertRaises(TokenError):
+            CachedRefreshToken(str(token)).check_blacklist()
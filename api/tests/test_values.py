@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.v1.clients.views import ClientViewSet
+from api.v1.notifications.views import NotificationViewSet
+from api.v1.projects.views import ProjectViewSet
+from api.values import ValuesSerializer
+from manager.models import Client, Notification, Project
+from users.models import CustomUser
+
+
+class ValuesListTests(TestCase):
+    """El fast path de ``.values()`` devuelve lo mismo que el ModelSerializer (api/values.py)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='valores',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        client = Client.objects.create(user=self.user, name='Ana', phone='351 111')
+        Client.objects.create(user=self.user, name='Sin proyectos')
+        Project.objects.create(
+            user=self.user, client=client, name='Casa', location='Centro',
+            start_date=date(2024, 3, 1), end_date=date(2024, 6, 30),
+        )
+        # Sin cliente: client_name tiene que salir null en los dos caminos
+        Project.objects.create(user=self.user, name='Galpón', start_date=date(2024, 1, 15), is_active=False)
+        old = Notification.objects.create(user=self.user, message='Vieja', description='Detalle')
+        Notification.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=3))
+        Notification.objects.create(user=self.user, message='Nueva', is_read=True)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_both(self, viewset, url, params=None):
+        """Respuesta del fast path y del ModelSerializer para el mismo request."""
+        now = timezone.now()
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            with mock.patch.object(
+                ValuesSerializer, 'to_representation',
+                autospec=True, side_effect=ValuesSerializer.to_representation,
+            ) as fast_path:
+                fast = self.client.get(url, params)
+            fast_path.assert_called_once()
+
+            with mock.patch.object(viewset, 'values_list_enabled', False):
+                slow = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(slow.status_code, 200)
+        return fast.json(), slow.json()
+
+    def test_proyectos_incluido_sin_cliente(self):
+        fast, slow = self.get_both(ProjectViewSet, '/api/v1/projects/')
+
+        self.assertEqual(fast, slow)
+        self.assertEqual([row['client_name'] for row in fast['results']], [None, 'Ana'])
+        self.assertEqual(list(fast['results'][0]), list(slow['results'][0]))
+
+    def test_proyectos_con_sparse_fieldset(self):
+        fast, slow = self.get_both(ProjectViewSet, '/api/v1/projects/', {'fields': 'name,client_name'})
+
+        self.assertEqual(fast, slow)
+
+    def test_clientes(self):
+        fast, slow = self.get_both(ClientViewSet, '/api/v1/clients/')
+
+        self.assertEqual(fast, slow)
+        self.assertEqual([row['projects_count'] for row in fast['results']], [1, 0])
+
+    def test_notificaciones(self):
+        for params in ({}, {'humanize': '0'}):
+            with self.subTest(**params):
+                fast, slow = self.get_both(NotificationViewSet, '/api/v1/notifications/', params)
+                self.assertEqual(fast, slow)
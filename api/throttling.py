@@ -1,9 +1,60 @@
 """
 Throttling personalizado para la API REST de MajobaSyS.
+
+Los throttles usan el limitador GCRA de ``majobacore.utils.ratelimit`` (un
+script Lua atómico, un round trip a Redis) en lugar del historial en cache de
+``SimpleRateThrottle``. Las tasas siguen saliendo de
+``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` por ``scope``.
 """
-from rest_framework.throttling import AnonRateThrottle
+from rest_framework import throttling
+
+from majobacore.utils.ratelimit import hit
+from majobacore.utils.security import RATE_LIMIT_SETTINGS
+
+
+class GCRARateThrottleMixin:
+    """Reemplaza ``allow_request``/``wait`` de ``SimpleRateThrottle`` por el limitador GCRA."""
+    result = None
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.result = hit(self.key, self.rate)
+        return self.result.allowed
+
+    def wait(self):
+        return self.result.retry_after if self.result is not None else None
+
+
+class AnonRateThrottle(GCRARateThrottleMixin, throttling.AnonRateThrottle):
+    """Límite por IP para requests anónimos (scope ``anon``)."""
+
+
+class UserRateThrottle(GCRARateThrottleMixin, throttling.UserRateThrottle):
+    """Límite por usuario autenticado, o por IP si es anónimo (scope ``user``)."""
 
 
 class LoginRateThrottle(AnonRateThrottle):
     """Rate limit para el endpoint de login."""
     scope = 'login'
+
+
+class PasswordChangeRateThrottle(UserRateThrottle):
+    """Rate limit para el cambio de contraseña (``PASSWORD_RESET_RATE_LIMIT``)."""
+    scope = 'password_change'
+    rate = RATE_LIMIT_SETTINGS['PASSWORD_RESET_RATE_LIMIT']
+
+
+class ProjectImportRateThrottle(UserRateThrottle):
+    """Rate limit para la importación masiva de proyectos (operación pesada)."""
+    scope = 'project_import'
+
+
+class ExportRateThrottle(UserRateThrottle):
+    """Rate limit para las exportaciones CSV/JSON (recorren tablas completas)."""
+    scope = 'export'
@@ -0,0 +1,382 @@
+"""
+Blacklist de refresh tokens respaldada en Redis.
+
+Con ``ROTATE_REFRESH_TOKENS`` + ``BLACKLIST_AFTER_ROTATION``, SimpleJWT en
+cada refresh consulta ``BlacklistedToken`` (JOIN con ``OutstandingToken``),
+hace ``get_or_create`` de ambos para blacklistear el token usado e inserta el
+``OutstandingToken`` del nuevo. Esas tablas crecen sin límite y con ellas la
+latencia del refresh.
+
+``CachedRefreshToken`` mueve ese camino a Redis:
+
+- Emitir un token lo encola en ``jwt:pending`` en vez de insertar su
+  ``OutstandingToken``; ``flush_token_blacklist`` (cron cada 5 minutos, ver
+  railway.flush.toml) vacía la cola a la base por lotes.
+- Blacklistear escribe ``OutstandingToken``/``BlacklistedToken`` en la base
+  en el request: Redis es el cache de un servidor que puede perder claves
+  (eviction, reinicio) y la revocación no puede depender de él. Después se
+  escriben en un solo pipeline la clave ``jwt:blacklist:<jti>`` (TTL = vida
+  restante del token) y los bits del filtro de Bloom.
+- Verificar pide la clave, los bits del filtro y las marcas de filtro
+  construido en un solo round trip. Si la clave existe, el token está
+  blacklisteado; si algún bit está en 0, seguro que no lo está. Solo un
+  falso positivo del filtro, o un filtro todavía no construido o perdido
+  (ej: Redis reiniciado), consulta la base.
+
+El filtro es un bitmap de Redis compartido por todos los workers y lo
+reconstruye desde la base ``flush_token_blacklist`` (que además borra los
+tokens vencidos), así no acumula bits de tokens que ya expiraron.
+
+Un ``BlacklistedToken`` creado por otro camino (admin de SimpleJWT,
+``RefreshToken.blacklist``) se agrega a Redis al confirmar (api/signals.py).
+
+Sin django-redis (desarrollo, tests) o con Redis caído se usa el
+comportamiento estándar de SimpleJWT contra la base.
+"""
+import hashlib
+import json
+import logging
+import math
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+
+try:
+    from django_redis import get_redis_connection
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - django-redis está en requirements/base.txt
+    get_redis_connection = None
+    RedisError = OSError
+
+logger = logging.getLogger('api')
+
+BLACKLIST_KEY_PREFIX = 'jwt:blacklist'
+BLOOM_KEY = 'jwt:blacklist:bloom'
+BLOOM_READY_KEY = 'jwt:blacklist:bloom:ready'
+PENDING_KEY = 'jwt:pending'
+FLUSH_LOCK_KEY = 'jwt:flush:lock'
+
+DEFAULT_BATCH_SIZE = 5000
+
+# El filtro quedó sin los bits de un token blacklisteado con Redis caído y no
+# se pudo borrar ``BLOOM_READY_KEY``: hay que hacerlo apenas Redis responda
+_bloom_stale = False
+
+
+def get_redis_client():
+    """Cliente Redis crudo del cache ``default``, o ``None`` si no es django-redis."""
+    if get_redis_connection is None:
+        return None
+    try:
+        return get_redis_connection('default')
+    except NotImplementedError:
+        return None
+
+
+def redis_key(key):
+    """Clave con el mismo prefijo/versión que el resto del cache (``KEY_PREFIX``)."""
+    return cache.make_key(key)
+
+
+# ---------------------------------------------------------------------------
+# Filtro de Bloom
+# ---------------------------------------------------------------------------
+
+def bloom_parameters(capacity, error_rate):
+    """
+    Tamaño del bitmap y cantidad de hashes para ``capacity`` elementos con
+    tasa de falsos positivos ``error_rate``.
+
+    Returns:
+        tuple[int, int]: ``(bits, hashes)``.
+    """
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+def bloom_offsets(jti):
+    """Posiciones del bitmap para ``jti`` (doble hashing sobre un blake2b)."""
+    bits, hashes = bloom_parameters(
+        settings.JWT_BLACKLIST_BLOOM_CAPACITY,
+        settings.JWT_BLACKLIST_BLOOM_ERROR_RATE,
+    )
+    digest = hashlib.blake2b(jti.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], 'big')
+    h2 = int.from_bytes(digest[8:], 'big') | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+def rebuild_bloom_filter(client, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Reconstruye el filtro con los tokens blacklisteados no vencidos.
+
+    Se arma en una clave temporal y se reemplaza con ``RENAME`` (atómico).
+    Un token blacklisteado mientras tanto pierde sus bits, pero su clave
+    ``jwt:blacklist:<jti>`` sigue existiendo y es lo primero que se mira.
+
+    Returns:
+        int: Tokens cargados en el filtro.
+    """
+    bloom_key = redis_key(BLOOM_KEY)
+    building_key = f'{bloom_key}:building'
+    client.delete(building_key)
+
+    jtis = (
+        BlacklistedToken.objects
+        .filter(token__expires_at__gt=aware_utcnow())
+        .values_list('token__jti', flat=True)
+        .iterator(chunk_size=batch_size)
+    )
+    count = 0
+    pipe = client.pipeline(transaction=False)
+    # La clave existe aunque no haya tokens: si falta, el filtro se perdió
+    pipe.setbit(building_key, 0, 0)
+    for jti in jtis:
+        for offset in bloom_offsets(jti):
+            pipe.setbit(building_key, offset, 1)
+        count += 1
+        if count % batch_size == 0:
+            pipe.execute()
+    pipe.execute()
+
+    client.rename(building_key, bloom_key)
+    client.set(redis_key(BLOOM_READY_KEY), 1)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Blacklist
+# ---------------------------------------------------------------------------
+
+def _token_item(token, blacklisted):
+    payload = token.payload
+    return {
+        'jti': payload[api_settings.JTI_CLAIM],
+        'exp': payload['exp'],
+        'iat': payload.get('iat'),
+        'user_id': payload.get(api_settings.USER_ID_CLAIM),
+        'token': str(token),
+        'blacklisted': blacklisted,
+    }
+
+
+def is_blacklisted(client, jti):
+    """
+    Returns:
+        bool | None: ``True``/``False`` si Redis alcanza para decidir,
+        ``None`` si hay que consultar la base.
+    """
+    offsets = bloom_offsets(jti)
+    pipe = client.pipeline(transaction=False)
+    bloom_key = redis_key(BLOOM_KEY)
+    pipe.exists(redis_key(f'{BLACKLIST_KEY_PREFIX}:{jti}'))
+    # La marca y el bitmap: cualquiera de los dos pudo ser desalojado
+    pipe.exists(redis_key(BLOOM_READY_KEY), bloom_key)
+    for offset in offsets:
+        pipe.getbit(bloom_key, offset)
+    in_blacklist, bloom_keys, *bits = pipe.execute()
+
+    if in_blacklist:
+        return True
+    if bloom_keys == 2 and not all(bits):
+        return False
+    return None
+
+
+def invalidate_bloom(client):
+    """
+    Borra la marca de filtro construido: hasta el próximo
+    ``rebuild_bloom_filter`` toda verificación que no encuentre la clave
+    ``jwt:blacklist:<jti>`` consulta la base.
+
+    Si Redis tampoco responde queda pendiente para la próxima verificación
+    de este proceso (ver ``CachedRefreshToken.check_blacklist``).
+    """
+    global _bloom_stale
+    try:
+        client.delete(redis_key(BLOOM_READY_KEY))
+    except RedisError:
+        _bloom_stale = True
+    else:
+        _bloom_stale = False
+
+
+def add_to_blacklist(client, jti, exp):
+    """
+    Agrega el token ``jti`` (ya blacklisteado en la base) al cache de la
+    blacklist en Redis; ``exp`` es su vencimiento en epoch.
+    """
+    ttl = max(1, int(exp - time.time()))
+    bloom_key = redis_key(BLOOM_KEY)
+    pipe = client.pipeline(transaction=False)
+    pipe.set(redis_key(f'{BLACKLIST_KEY_PREFIX}:{jti}'), 1, ex=ttl)
+    for offset in bloom_offsets(jti):
+        pipe.setbit(bloom_key, offset, 1)
+    pipe.execute()
+
+
+def enqueue_outstanding(client, token):
+    """Encola el token emitido para registrarlo en ``OutstandingToken``."""
+    client.rpush(redis_key(PENDING_KEY), json.dumps(_token_item(token, blacklisted=False)))
+
+
+class CachedRefreshToken(RefreshToken):
+    """
+    ``RefreshToken`` cuya blacklist se consulta y escribe en Redis.
+
+    Se usa en login, logout y refresh (``CachedTokenRefreshSerializer``).
+    """
+
+    def check_blacklist(self):
+        client = get_redis_client()
+        if client is None:
+            return super().check_blacklist()
+
+        jti = self.payload[api_settings.JTI_CLAIM]
+        blacklisted = None
+        if _bloom_stale:
+            invalidate_bloom(client)
+        if not _bloom_stale:
+            try:
+                blacklisted = is_blacklisted(client, jti)
+            except RedisError as e:
+                logger.warning("Redis no disponible para la blacklist JWT, se consulta la base: %s", e)
+
+        if blacklisted is None:
+            return super().check_blacklist()
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        client = get_redis_client()
+        if client is None:
+            return super().blacklist()
+
+        # Primero la base: si Redis pierde la clave, la revocación sigue ahí.
+        # Su OutstandingToken puede estar todavía en la cola: se crea acá.
+        _persist_items([_token_item(self, blacklisted=True)])
+        try:
+            add_to_blacklist(client, self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
+        except RedisError as e:
+            logger.warning("Redis no disponible para la blacklist JWT, se consulta la base: %s", e)
+            # El token no tiene sus bits en el filtro: que no se confíe en él
+            invalidate_bloom(client)
+
+    def outstand(self):
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return enqueue_outstanding(client, self)
+            except RedisError as e:
+                logger.warning("Redis no disponible para la blacklist JWT, se escribe en la base: %s", e)
+        return super().outstand()
+
+    @classmethod
+    def for_user(cls, user):
+        client = get_redis_client()
+        if client is None:
+            return super().for_user(user)
+
+        # Token.for_user, sin el INSERT de OutstandingToken de BlacklistMixin
+        token = super(BlacklistMixin, cls).for_user(user)
+        try:
+            enqueue_outstanding(client, token)
+        except RedisError as e:
+            logger.warning("Redis no disponible para la blacklist JWT, se escribe en la base: %s", e)
+            super(CachedRefreshToken, token).outstand()
+        return token
+
+
+# ---------------------------------------------------------------------------
+# Persistencia y limpieza (flush_token_blacklist)
+# ---------------------------------------------------------------------------
+
+def _persist_items(items):
+    """Inserta los tokens encolados; idempotente (``ignore_conflicts``)."""
+    User = get_user_model()
+    user_ids = {str(item['user_id']) for item in items if item['user_id'] is not None}
+    existing_users = {
+        str(pk) for pk in User.objects.filter(pk__in=user_ids).values_list('pk', flat=True)
+    }
+    OutstandingToken.objects.bulk_create(
+        [
+            OutstandingToken(
+                user_id=item['user_id'] if str(item['user_id']) in existing_users else None,
+                jti=item['jti'],
+                token=item['token'],
+                created_at=datetime_from_epoch(item['iat']) if item['iat'] else None,
+                expires_at=datetime_from_epoch(item['exp']),
+            )
+            for item in items
+        ],
+        ignore_conflicts=True,
+    )
+
+    blacklisted_jtis = [item['jti'] for item in items if item['blacklisted']]
+    if blacklisted_jtis:
+        token_ids = OutstandingToken.objects.filter(jti__in=blacklisted_jtis).order_by().values_list('id', flat=True)
+        BlacklistedToken.objects.bulk_create(
+            [BlacklistedToken(token_id=token_id) for token_id in token_ids],
+            ignore_conflicts=True,
+        )
+    return len(blacklisted_jtis)
+
+
+def persist_pending(client, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Vacía la cola ``jwt:pending`` a la base por lotes.
+
+    Cada lote se lee, se inserta y recién entonces se recorta de la cola: si
+    la inserción falla el lote queda para la próxima corrida.
+
+    Returns:
+        tuple[int, int]: ``(tokens, blacklisteados)`` persistidos.
+    """
+    pending_key = redis_key(PENDING_KEY)
+    tokens = blacklisted = 0
+    while True:
+        raw_items = client.lrange(pending_key, 0, batch_size - 1)
+        if not raw_items:
+            break
+        blacklisted += _persist_items([json.loads(raw) for raw in raw_items])
+        client.ltrim(pending_key, len(raw_items), -1)
+        tokens += len(raw_items)
+        if len(raw_items) < batch_size:
+            break
+    return tokens, blacklisted
+
+
+def prune_expired_tokens(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Borra los ``OutstandingToken`` vencidos (y en cascada su ``BlacklistedToken``)
+    en lotes de ``batch_size``, cada uno en su propia sentencia corta.
+
+    Returns:
+        int: Tokens borrados.
+    """
+    now = aware_utcnow()
+    total = 0
+    while True:
+        # Sin el ordering por ``user`` del modelo (haría JOIN con usuarios)
+        ids = list(
+            OutstandingToken.objects
+            .filter(expires_at__lte=now)
+            .order_by()
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        total += len(ids)
+        if len(ids) < batch_size:
+            break
+    return total
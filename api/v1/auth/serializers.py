@@ -5,9 +5,15 @@ import logging
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
-from rest_framework import serializers
+from rest_framework import exceptions, serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
+from api.tokens import CachedRefreshToken
+from majobacore.utils.hashers import HASHING_BUSY_RETRY_AFTER, HashingBusy
 from majobacore.utils.http import get_client_ip
+from users.cache import get_cached_user
 from users.models import CustomUser
 from manager.services import create_manager
 
@@ -32,23 +38,27 @@ class LoginSerializer(serializers.Serializer):
         username = attrs.get('username')
         password = attrs.get('password')
 
-        user = authenticate(
-            request=self.context.get('request'),
-            username=username,
-            password=password,
-        )
+        try:
+            user = authenticate(
+                request=self.context.get('request'),
+                username=username,
+                password=password,
+            )
+        except HashingBusy:
+            # Pool de hashing saturado: 429 con Retry-After en vez de encolar
+            raise exceptions.Throttled(wait=HASHING_BUSY_RETRY_AFTER)
 
         ip = get_client_ip(self.context.get('request'))
 
         if user is None:
-            logger.warning(f"Login API fallido | usuario={username} | ip={ip}")
+            logger.warning("Login API fallido | usuario=%s | ip=%s", username, ip)
             raise serializers.ValidationError(
                 'Credenciales inválidas.',
                 code='invalid_credentials',
             )
 
         if not user.is_active:
-            logger.warning(f"Login API cuenta desactivada | usuario={username} | ip={ip}")
+            logger.warning("Login API cuenta desactivada | usuario=%s | ip=%s", username, ip)
             raise serializers.ValidationError(
                 'Esta cuenta está desactivada.',
                 code='inactive_account',
@@ -141,7 +151,7 @@ class RegisterSerializer(serializers.Serializer):
         # Crear ManagerData automáticamente
         create_manager(user)
 
-        logger.info(f"Usuario '{user.username}' creado vía API")
+        logger.info("Usuario '%s' creado vía API", user.username)
         return user
 
 
@@ -206,3 +216,39 @@ class TokenResponseSerializer(serializers.Serializer):
                 'is_staff': user.is_staff,
             }
         return None
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    ``TokenRefreshSerializer`` sin queries en el camino común: la blacklist
+    se consulta/escribe en Redis (``CachedRefreshToken``) y el usuario sale
+    del cache de ``users.cache``.
+    """
+    token_class = CachedRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id:
+            user = get_cached_user(user_id)
+            if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+                raise AuthenticationFailed(
+                    self.error_messages['no_active_account'],
+                    'no_active_account',
+                )
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+
+            data['refresh'] = str(refresh)
+
+        return data
@@ -8,11 +8,11 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 
 from api.permissions import IsStaffUser
-from api.throttling import LoginRateThrottle
+from api.throttling import LoginRateThrottle, PasswordChangeRateThrottle
+from api.tokens import CachedRefreshToken
 from majobacore.utils.http import get_client_ip
 from manager.services import create_manager
 from .serializers import (
@@ -47,13 +47,13 @@ class LoginView(APIView):
             create_manager(user)
 
         # Generar tokens JWT
-        refresh = RefreshToken.for_user(user)
+        refresh = CachedRefreshToken.for_user(user)
 
         # Actualizar last_login (Django no lo hace automáticamente con JWT)
         update_last_login(None, user)
 
         ip = get_client_ip(request)
-        logger.info(f"Login API exitoso | usuario={user.username} | ip={ip}")
+        logger.info("Login API exitoso | usuario=%s | ip=%s", user.username, ip)
 
         return Response(
             {
@@ -88,9 +88,9 @@ class LogoutView(APIView):
             )
 
         try:
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
-            logger.info(f"Logout API para usuario: {request.user.username}")
+            logger.info("Logout API para usuario: %s", request.user.username)
             return Response(
                 {'detail': 'Sesión cerrada exitosamente.'},
                 status=status.HTTP_200_OK,
@@ -138,6 +138,7 @@ class ChangePasswordView(APIView):
     PUT /api/v1/auth/change-password/
     """
     permission_classes = [IsAuthenticated]
+    throttle_classes = [PasswordChangeRateThrottle]
 
     def put(self, request):
         serializer = ChangePasswordSerializer(
@@ -150,7 +151,7 @@ class ChangePasswordView(APIView):
         user.set_password(serializer.validated_data['new_password'])
         user.save()
 
-        logger.info(f"Contraseña cambiada vía API para usuario: {user.username}")
+        logger.info("Contraseña cambiada vía API para usuario: %s", user.username)
 
         return Response(
             {'detail': 'Contraseña actualizada exitosamente.'},
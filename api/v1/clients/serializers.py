@@ -3,10 +3,11 @@ Serializers de clientes para la API REST de MajobaSyS.
 """
 from rest_framework import serializers
 
+from api.fieldsets import SparseFieldsetMixin
 from manager.models import Client
 
 
-class ClientSerializer(serializers.ModelSerializer):
+class ClientSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer de cliente con conteo de proyectos asociados.
     """
@@ -22,6 +23,8 @@ class ClientSerializer(serializers.ModelSerializer):
             'projects_count',
         ]
         read_only_fields = ['id', 'created_at', 'projects_count']
+        # Anotación calculada en la vista, no es una columna
+        field_dependencies = {'projects_count': []}
 
 
 class ClientCreateUpdateSerializer(serializers.ModelSerializer):
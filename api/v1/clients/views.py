@@ -7,14 +7,17 @@ from django.db.models import Count, Q
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
 
+from api.exports import ExportViewMixin
+from api.fieldsets import SparseFieldsetViewMixin
 from api.permissions import IsOwner
+from api.values import ValuesListMixin
 from manager.models import Client
 from .serializers import ClientCreateUpdateSerializer, ClientSerializer
 
 logger = logging.getLogger('api')
 
 
-class ClientViewSet(ModelViewSet):
+class ClientViewSet(ExportViewMixin, SparseFieldsetViewMixin, ValuesListMixin, ModelViewSet):
     """
     ViewSet CRUD para clientes del usuario autenticado.
 
@@ -24,23 +27,40 @@ class ClientViewSet(ModelViewSet):
     update:  PUT    /api/v1/clients/{id}/
     partial_update: PATCH /api/v1/clients/{id}/
     destroy: DELETE /api/v1/clients/{id}/
+    export:  GET    /api/v1/clients/export/?as=csv|json[&all=1]
     """
     permission_classes = [IsAuthenticated, IsOwner]
     search_fields = ['name', 'phone']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
+    sparse_fieldset_required = ('user',)
+    export_filename = 'clientes'
+    export_columns = (
+        ('id', 'id'),
+        ('name', 'name'),
+        ('phone', 'phone'),
+        ('projects_count', 'projects_count'),
+        ('created_at', 'created_at'),
+    )
 
     def get_queryset(self):
         """Filtra clientes al usuario autenticado y anota conteo de proyectos."""
-        return (
-            Client.objects.filter(user=self.request.user)
-            .annotate(
+        queryset = Client.objects.filter(user=self.request.user).order_by('name')
+        # El COUNT con JOIN a proyectos solo se paga si se pidió el campo
+        if self.is_field_requested('projects_count'):
+            queryset = queryset.annotate(
                 projects_count=Count(
                     'projects',
                     filter=Q(projects__user=self.request.user),
                 ),
             )
-            .order_by('name')
+        return self.apply_sparse_fieldset(queryset)
+
+    def get_export_queryset(self, export_all):
+        if export_all:
+            return Client.objects.annotate(projects_count=Count('projects'))
+        return Client.objects.filter(user=self.request.user).annotate(
+            projects_count=Count('projects', filter=Q(projects__user=self.request.user)),
         )
 
     def get_serializer_class(self):
@@ -53,14 +73,14 @@ class ClientViewSet(ModelViewSet):
         """Asigna el usuario autenticado al crear un cliente."""
         serializer.save(user=self.request.user)
         logger.info(
-            f"Cliente '{serializer.instance.name}' creado vía API "
-            f"por {self.request.user.username}"
+            "Cliente '%s' creado vía API por %s",
+            serializer.instance.name, self.request.user.username,
         )
 
     def perform_destroy(self, instance):
         """Registra la eliminación antes de borrar."""
         logger.info(
-            f"Cliente '{instance.name}' eliminado vía API "
-            f"por {self.request.user.username}"
+            "Cliente '%s' eliminado vía API por %s",
+            instance.name, self.request.user.username,
         )
         instance.delete()
@@ -3,11 +3,12 @@ Serializers del manager/dashboard para la API REST de MajobaSyS.
 """
 from rest_framework import serializers
 
+from api.fieldsets import SparseFieldsetMixin
 from manager.models import ManagerData
 from api.v1.users.serializers import ManagerDataNestedSerializer
 
 
-class ManagerDataSerializer(serializers.ModelSerializer):
+class ManagerDataSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer completo de ManagerData con propiedades computadas.
     """
@@ -31,6 +32,11 @@ class ManagerDataSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = fields
+        field_dependencies = {
+            'progress_percentage': ['points', 'acc_level'],
+            'points_for_next_level': ['points', 'acc_level'],
+            'next_level_display': ['points', 'acc_level'],
+        }
 
 
 class DashboardSerializer(serializers.Serializer):
@@ -7,12 +7,38 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from manager.models import ManagerData, Notification, Project
-from manager.services import create_manager
+from majobacore.utils.cache import COMPUTE_KEY_PREFIX, get_or_compute, get_version
+from manager.cache import get_manager_data
+from manager.models import Notification, Project
+from manager.signals import NOTIFICATIONS_VERSION, PROJECTS_VERSION
 from .serializers import DashboardSerializer, ManagerDataSerializer
 
 logger = logging.getLogger('api')
 
+# Los contadores del dashboard se invalidan por versión (señales de Project y
+# Notification); el TTL solo acota cuánto vive una entrada que nadie invalida.
+DASHBOARD_COUNTS_CACHE_TIMEOUT = 300
+
+
+def _dashboard_counts_key(user_id):
+    """Clave de los contadores: cambia con la versión de proyectos o notificaciones."""
+    return ':'.join(str(part) for part in (
+        COMPUTE_KEY_PREFIX,
+        'dashboard',
+        user_id,
+        get_version(PROJECTS_VERSION, user_id),
+        get_version(NOTIFICATIONS_VERSION, user_id),
+    ))
+
+
+def _dashboard_counts(user):
+    return {
+        # Proyectos activos del usuario
+        'recent_projects_count': Project.objects.filter(user=user, is_active=True).count(),
+        # Notificaciones no leídas
+        'unread_notifications_count': Notification.objects.filter(user=user, is_read=False).count(),
+    }
+
 
 class DashboardView(APIView):
     """
@@ -26,28 +52,19 @@ class DashboardView(APIView):
         """Retorna datos consolidados para el dashboard."""
         user = request.user
 
-        # Asegurar que existe ManagerData
-        manager_data = getattr(user, 'manager_user', None)
-        if manager_data is None:
-            manager_data = create_manager(user)
-
-        # Contar proyectos activos del usuario
-        recent_projects_count = Project.objects.filter(
-            user=user,
-            is_active=True,
-        ).count()
+        # ManagerData desde el cache en dos niveles (se crea si no existe)
+        manager_data = get_manager_data(user)
 
-        # Contar notificaciones no leídas
-        unread_notifications_count = Notification.objects.filter(
-            user=user,
-            is_read=False,
-        ).count()
+        counts = get_or_compute(
+            _dashboard_counts_key(user.pk),
+            lambda: _dashboard_counts(user),
+            DASHBOARD_COUNTS_CACHE_TIMEOUT,
+        )
 
         data = {
             'user': user,
             'manager_data': manager_data,
-            'recent_projects_count': recent_projects_count,
-            'unread_notifications_count': unread_notifications_count,
+            **counts,
         }
 
         serializer = DashboardSerializer(data)
@@ -64,15 +81,15 @@ class ManagerDataDetailView(APIView):
 
     def get(self, request):
         """Retorna el ManagerData del usuario autenticado."""
-        manager_data = getattr(request.user, 'manager_user', None)
-        if manager_data is None:
-            manager_data = create_manager(request.user)
-
+        manager_data = get_manager_data(request.user)
         if manager_data is None:
             return Response(
                 {'detail': 'No se pudo obtener los datos del manager.'},
                 status=500,
             )
 
-        serializer = ManagerDataSerializer(manager_data)
+        serializer = ManagerDataSerializer(
+            manager_data,
+            context={'request': request},
+        )
         return Response(serializer.data)
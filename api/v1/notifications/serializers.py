@@ -1,20 +1,42 @@
 """
 Serializers de notificaciones para la API REST de MajobaSyS.
 """
+from django.utils import timezone
 from rest_framework import serializers
 
-from manager.models import Notification
+from api.fieldsets import SparseFieldsetMixin
+from manager.models import Notification, humanize_time_elapsed
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer de notificación con tiempo transcurrido computado.
+
+    Con ``context['humanize'] = False`` se omite ``time_elapsed``: el cliente
+    lo calcula localmente a partir de ``created_at`` y la hora del servidor.
     """
     time_elapsed = serializers.SerializerMethodField()
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get('humanize', True):
+            fields.pop('time_elapsed', None)
+        return fields
+
+    def get_now(self):
+        """Retorna un único "ahora" por request, compartido por todas las filas."""
+        context = self.context
+        if 'now' not in context:
+            context['now'] = timezone.now()
+        return context['now']
+
     def get_time_elapsed(self, obj):
         """Devuelve el tiempo transcurrido formateado desde el modelo."""
-        return obj.time_elapsed()
+        return obj.time_elapsed(now=self.get_now())
+
+    def values_time_elapsed(self, row):
+        """Equivalente de ``get_time_elapsed`` para el fast path de ``.values()``."""
+        return humanize_time_elapsed(row['created_at'], self.get_now())
 
     class Meta:
         model = Notification
@@ -27,3 +49,4 @@ class NotificationSerializer(serializers.ModelSerializer):
             'created_at',
         ]
         read_only_fields = fields
+        field_dependencies = {'time_elapsed': ['created_at']}
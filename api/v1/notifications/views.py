@@ -3,20 +3,39 @@ Vistas de notificaciones para la API REST de MajobaSyS.
 """
 import logging
 
-from rest_framework import status
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework import serializers, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
-from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.mixins import RetrieveModelMixin
 
+from api.exports import ExportViewMixin
+from api.fieldsets import SparseFieldsetViewMixin
+from api.values import ValuesListMixin
+from majobacore.utils.cache import bump_version
 from manager.models import Notification
+from manager.signals import NOTIFICATIONS_VERSION
 from .serializers import NotificationSerializer
 
 logger = logging.getLogger('api')
 
+# Valores de ``?humanize=`` que desactivan ``time_elapsed`` en la respuesta
+HUMANIZE_OFF_VALUES = ('0', 'false', 'no')
 
-class NotificationViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
+SERVER_TIME_HEADER = 'X-Server-Time'
+
+
+class NotificationViewSet(
+    ExportViewMixin,
+    SparseFieldsetViewMixin,
+    ValuesListMixin,
+    RetrieveModelMixin,
+    GenericViewSet,
+):
     """
     ViewSet de notificaciones del usuario autenticado (solo lectura + acciones).
 
@@ -25,15 +44,60 @@ class NotificationViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
     mark_read: POST /api/v1/notifications/{id}/mark-read/
     mark_all_read: POST /api/v1/notifications/mark-all-read/
     unread_count: GET /api/v1/notifications/unread-count/
+    export:    GET  /api/v1/notifications/export/?as=csv|json[&all=1]
+
+    Con ``?humanize=0`` las lecturas devuelven solo ``created_at`` (sin
+    ``time_elapsed``) y la hora del servidor en el header ``X-Server-Time``:
+    el cuerpo deja de cambiar con el reloj, así que el ETag se mantiene
+    estable y el cliente puede revalidar con ``If-None-Match``.
     """
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
+    conditional_get_actions = ('list', 'retrieve')
+    export_filename = 'notificaciones'
+    export_columns = (
+        ('id', 'id'),
+        ('message', 'message'),
+        ('description', 'description'),
+        ('is_read', 'is_read'),
+        ('created_at', 'created_at'),
+    )
+
+    def is_humanized(self):
+        """Indica si el request pide ``time_elapsed`` ya formateado (default: sí)."""
+        value = self.request.query_params.get('humanize', '') if self.request else ''
+        return value.lower() not in HUMANIZE_OFF_VALUES
+
+    def get_now(self):
+        """Único "ahora" del request: lo usan el serializer y ``X-Server-Time``."""
+        if not hasattr(self, '_now'):
+            self._now = timezone.now()
+        return self._now
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['now'] = self.get_now()
+        context['humanize'] = self.is_humanized()
+        return context
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.action in self.conditional_get_actions and response.status_code == status.HTTP_200_OK:
+            # Privada por usuario: el navegador/app puede guardarla pero debe
+            # revalidar siempre (ConditionalGetMiddleware responde 304).
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ['Authorization'])
+            response[SERVER_TIME_HEADER] = serializers.DateTimeField().to_representation(
+                self.get_now()
+            )
+        return response
 
     def get_queryset(self):
         """Filtra notificaciones al usuario autenticado, ordenadas por fecha."""
-        return Notification.objects.filter(
+        queryset = Notification.objects.filter(
             user=self.request.user,
         ).order_by('-created_at')
+        return self.apply_sparse_fieldset(queryset)
 
     @action(detail=True, methods=['post'], url_path='mark-read')
     def mark_read(self, request, pk=None):
@@ -43,8 +107,8 @@ class NotificationViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
         notification.save(update_fields=['is_read'])
 
         logger.info(
-            f"Notificación {notification.id} marcada como leída "
-            f"por {request.user.username}"
+            "Notificación %s marcada como leída por %s",
+            notification.id, request.user.username,
         )
         return Response(
             {'detail': 'Notificación marcada como leída.'},
@@ -58,10 +122,14 @@ class NotificationViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
             user=request.user,
             is_read=False,
         ).update(is_read=True)
+        # update() no dispara post_save: invalidar a mano los contadores
+        # cacheados, al confirmar (ATOMIC_REQUESTS) como en manager/signals.py
+        user_id = request.user.pk
+        transaction.on_commit(lambda: bump_version(NOTIFICATIONS_VERSION, user_id))
 
         logger.info(
-            f"{updated_count} notificaciones marcadas como leídas "
-            f"por {request.user.username}"
+            "%s notificaciones marcadas como leídas por %s",
+            updated_count, request.user.username,
         )
         return Response(
             {
@@ -5,12 +5,13 @@ import logging
 
 from rest_framework import serializers
 
+from api.fieldsets import SparseFieldsetMixin
 from manager.models import Client, Project
 
 logger = logging.getLogger('api')
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer ligero para listado de proyectos.
     """
@@ -34,7 +35,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class ClientNestedSerializer(serializers.ModelSerializer):
+class ClientNestedSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer anidado de cliente para el detalle de proyecto."""
 
     class Meta:
@@ -43,7 +44,7 @@ class ClientNestedSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer detallado de proyecto con cliente anidado.
     """
@@ -64,6 +65,7 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = fields
+        expandable_fields = ['client']
 
 
 class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
@@ -159,16 +161,16 @@ class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
             )
             validated_data['client'] = client
             logger.info(
-                f"Cliente '{client.name}' creado inline vía API "
-                f"por {request.user.username}"
+                "Cliente '%s' creado inline vía API por %s",
+                client.name, request.user.username,
             )
 
         validated_data['user'] = request.user
         project = Project.objects.create(**validated_data)
 
         logger.info(
-            f"Proyecto '{project.name}' creado vía API "
-            f"por {request.user.username}"
+            "Proyecto '%s' creado vía API por %s",
+            project.name, request.user.username,
         )
         return project
 
@@ -182,7 +184,7 @@ class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
         instance.save()
 
         logger.info(
-            f"Proyecto '{instance.name}' actualizado vía API "
-            f"por {self.context['request'].user.username}"
+            "Proyecto '%s' actualizado vía API por %s",
+            instance.name, self.context['request'].user.username,
         )
         return instance
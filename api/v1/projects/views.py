@@ -3,11 +3,20 @@ Vistas de proyectos para la API REST de MajobaSyS.
 """
 import logging
 
+from django.conf import settings
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from api.exports import ExportViewMixin
+from api.fieldsets import SparseFieldsetViewMixin
 from api.permissions import IsOwner
+from api.throttling import ProjectImportRateThrottle
+from api.values import ValuesListMixin
+from manager.importers import ImportFormatError, import_projects
 from manager.models import Project
 from .filters import ProjectFilter
 from .serializers import (
@@ -19,7 +28,7 @@ from .serializers import (
 logger = logging.getLogger('api')
 
 
-class ProjectViewSet(ModelViewSet):
+class ProjectViewSet(ExportViewMixin, SparseFieldsetViewMixin, ValuesListMixin, ModelViewSet):
     """
     ViewSet CRUD para proyectos del usuario autenticado.
 
@@ -29,20 +38,38 @@ class ProjectViewSet(ModelViewSet):
     update:  PUT    /api/v1/projects/{id}/
     partial_update: PATCH /api/v1/projects/{id}/
     destroy: DELETE /api/v1/projects/{id}/
+    import:  POST   /api/v1/projects/import/  (multipart: file=.csv|.xlsx)
+    export:  GET    /api/v1/projects/export/?as=csv|json[&all=1]
     """
     permission_classes = [IsAuthenticated, IsOwner]
     filterset_class = ProjectFilter
     search_fields = ['name', 'description', 'location']
     ordering_fields = ['name', 'start_date', 'end_date', 'created_at']
     ordering = ['-created_at']
+    sparse_fieldset_required = ('user',)
+    export_filename = 'proyectos'
+    # Mismos nombres de columna que acepta el importador (manager/importers.py)
+    export_columns = (
+        ('id', 'id'),
+        ('name', 'name'),
+        ('client', 'client__name'),
+        ('client_phone', 'client__phone'),
+        ('location', 'location'),
+        ('description', 'description'),
+        ('start_date', 'start_date'),
+        ('end_date', 'end_date'),
+        ('is_active', 'is_active'),
+        ('created_at', 'created_at'),
+    )
 
     def get_queryset(self):
         """Filtra proyectos al usuario autenticado."""
-        return (
+        queryset = (
             Project.objects.filter(user=self.request.user)
             .select_related('client')
             .order_by('-created_at')
         )
+        return self.apply_sparse_fieldset(queryset)
 
     def get_serializer_class(self):
         """Retorna el serializer apropiado según la acción."""
@@ -55,7 +82,45 @@ class ProjectViewSet(ModelViewSet):
     def perform_destroy(self, instance):
         """Registra la eliminación antes de borrar."""
         logger.info(
-            f"Proyecto '{instance.name}' eliminado vía API "
-            f"por {self.request.user.username}"
+            "Proyecto '%s' eliminado vía API por %s",
+            instance.name, self.request.user.username,
         )
         instance.delete()
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        parser_classes=[MultiPartParser],
+        throttle_classes=[ProjectImportRateThrottle],
+    )
+    def import_file(self, request):
+        """
+        Importa proyectos (y clientes) desde un CSV/XLSX.
+
+        Las filas inválidas se omiten y se informan con su número de fila;
+        con ``dry_run=true`` solo se valida el archivo.
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'file': ['Debes adjuntar un archivo .csv o .xlsx.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if upload.size > settings.PROJECT_IMPORT_MAX_SIZE:
+            return Response(
+                {'file': ['El archivo supera el tamaño máximo permitido.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+
+        try:
+            result = import_projects(request.user, upload.file, upload.name, dry_run=dry_run)
+        except ImportFormatError as exc:
+            return Response({'file': [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+
+        created = result.created_projects and not dry_run
+        return Response(
+            result.as_dict(),
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
@@ -3,11 +3,12 @@ Serializers de usuarios para la API REST de MajobaSyS.
 """
 from rest_framework import serializers
 
+from api.fieldsets import SparseFieldsetMixin
 from users.models import CustomUser
 from manager.models import ManagerData
 
 
-class ManagerDataNestedSerializer(serializers.ModelSerializer):
+class ManagerDataNestedSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer anidado de ManagerData para incluir en el perfil de usuario.
     """
@@ -26,9 +27,14 @@ class ManagerDataNestedSerializer(serializers.ModelSerializer):
             'next_level_display',
         ]
         read_only_fields = fields
+        field_dependencies = {
+            'progress_percentage': ['points', 'acc_level'],
+            'points_for_next_level': ['points', 'acc_level'],
+            'next_level_display': ['points', 'acc_level'],
+        }
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer básico de usuario (listados, referencias).
     """
@@ -46,7 +52,7 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer detallado de usuario con datos de ManagerData anidados.
     """
@@ -78,6 +84,8 @@ class UserDetailSerializer(serializers.ModelSerializer):
             'manager_data',
         ]
         read_only_fields = fields
+        expandable_fields = ['manager_data']
+        field_dependencies = {'full_name': ['first_name', 'last_name', 'username']}
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
@@ -8,6 +8,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from manager.cache import get_manager_data
+
 from .serializers import UserDetailSerializer, UserUpdateSerializer
 
 logger = logging.getLogger('api')
@@ -25,7 +27,12 @@ class ProfileView(APIView):
 
     def get(self, request):
         """Retorna el perfil completo del usuario autenticado."""
-        serializer = UserDetailSerializer(request.user)
+        # Deja el ManagerData cacheado en request.user.manager_user
+        get_manager_data(request.user)
+        serializer = UserDetailSerializer(
+            request.user,
+            context={'request': request},
+        )
         return Response(serializer.data)
 
     def put(self, request):
@@ -38,11 +45,11 @@ class ProfileView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        logger.info(f"Perfil actualizado vía API para usuario: {request.user.username}")
+        logger.info("Perfil actualizado vía API para usuario: %s", request.user.username)
 
         # Retornar perfil completo actualizado
         return Response(
-            UserDetailSerializer(request.user).data,
+            UserDetailSerializer(request.user, context={'request': request}).data,
             status=status.HTTP_200_OK,
         )
 
@@ -57,9 +64,9 @@ class ProfileView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        logger.info(f"Perfil actualizado parcialmente vía API para usuario: {request.user.username}")
+        logger.info("Perfil actualizado parcialmente vía API para usuario: %s", request.user.username)
 
         return Response(
-            UserDetailSerializer(request.user).data,
+            UserDetailSerializer(request.user, context={'request': request}).data,
             status=status.HTTP_200_OK,
         )
@@ -0,0 +1,124 @@
+"""
+Fast path de serialización para listados de solo lectura.
+
+``ValuesSerializer`` "compila" un ModelSerializer de lectura a una lista de
+pasos ``(campo de salida, clave de .values(), conversión)`` y arma los dicts
+directamente desde un queryset ``.values()``: sin instanciar modelos ni
+recorrer ``get_attribute``/``to_representation`` de DRF por cada fila.
+
+La salida es idéntica a la del serializer original: mismo orden de claves,
+mismos valores y las fechas formateadas por los mismos campos de DRF.
+Si algún campo no se puede traducir (serializers anidados, métodos sin
+equivalente), ``compile`` devuelve None y la vista usa el camino normal.
+"""
+from rest_framework import serializers
+from rest_framework.mixins import ListModelMixin
+from rest_framework.response import Response
+
+# Campos cuyo valor crudo de la base ya es su representación JSON
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.IntegerField,
+)
+
+VALUES_METHOD_PREFIX = 'values_'
+
+
+class ValuesSerializer:
+    """
+    Serializer de solo lectura sobre filas de ``QuerySet.values()``.
+
+    Los campos que no mapean a una columna (ej: SerializerMethodField) se
+    resuelven con un método ``values_<campo>(row)`` del serializer original,
+    que recibe la fila con las columnas declaradas en
+    ``Meta.field_dependencies[<campo>]``.
+    """
+
+    def __init__(self, steps, columns):
+        self.steps = steps
+        self.columns = columns
+
+    @classmethod
+    def compile(cls, serializer):
+        """
+        Traduce los campos efectivos de ``serializer`` a pasos sobre ``.values()``.
+
+        Args:
+            serializer: Instancia del ModelSerializer de lectura (ya con context,
+                así respeta el sparse fieldset del request).
+
+        Returns:
+            ValuesSerializer | None: None si algún campo no es traducible.
+        """
+        meta = getattr(serializer, 'Meta', None)
+        dependencies = getattr(meta, 'field_dependencies', {})
+        steps = []
+        columns = []
+
+        for field in serializer._readable_fields:
+            name = field.field_name
+            values_method = getattr(serializer, VALUES_METHOD_PREFIX + name, None)
+
+            if values_method is not None:
+                columns.extend(dependencies.get(name, ()))
+                steps.append((name, None, values_method))
+                continue
+
+            if isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField)):
+                return None
+            if isinstance(field, serializers.RelatedField) or field.source == '*':
+                return None
+
+            key = field.source.replace('.', '__')
+            columns.append(key)
+            convert = None if type(field) in PASSTHROUGH_FIELDS else field.to_representation
+            steps.append((name, key, convert))
+
+        return cls(steps, list(dict.fromkeys(columns)))
+
+    def to_representation(self, rows):
+        """Convierte filas ``.values()`` en la lista de dicts de la respuesta."""
+        steps = self.steps
+        data = []
+        for row in rows:
+            item = {}
+            for name, key, convert in steps:
+                if key is None:
+                    item[name] = convert(row)
+                    continue
+                value = row[key]
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
+class ValuesListMixin(ListModelMixin):
+    """
+    ``list`` que serializa desde ``.values()`` cuando el serializer lo permite.
+
+    Aplica filtros, orden y paginación exactamente igual que ListModelMixin;
+    solo cambia cómo se construye cada fila.
+    """
+    values_list_enabled = True
+
+    def get_values_serializer(self):
+        """Retorna el ValuesSerializer para este request, o None."""
+        if not self.values_list_enabled:
+            return None
+        serializer = self.get_serializer()
+        return ValuesSerializer.compile(serializer)
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = self.get_values_serializer()
+        if values_serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*values_serializer.columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.to_representation(page))
+
+        return Response(values_serializer.to_representation(queryset))
@@ -0,0 +1,136 @@
+"""
+Micro-benchmarks de los métodos calientes de los modelos y los serializers v1.
+
+Miden el costo en Python por fila (sin base de datos: los objetos se arman en
+memoria) sobre lotes de ``BATCH_SIZE`` objetos con datos deterministas. No
+forman parte de ``pytest`` a secas (no están en ``testpaths``).
+
+Uso (requiere ``pytest-benchmark``, en requirements/development.txt):
+
+    # Correr y ver los tiempos
+    pytest benchmarks --no-cov
+
+    # Guardar un baseline nuevo (después de un cambio de performance aceptado)
+    pytest benchmarks --no-cov --benchmark-storage=benchmarks/baselines \\
+        --benchmark-disable-gc --benchmark-warmup=on --benchmark-min-rounds=20 --benchmark-save=baseline
+
+    # CI: falla si algún mínimo empeora más de 15% respecto del baseline 0001
+    pytest benchmarks --no-cov --benchmark-storage=benchmarks/baselines \\
+        --benchmark-disable-gc --benchmark-warmup=on --benchmark-min-rounds=20 \\
+        --benchmark-compare=0001 --benchmark-compare-fail=min:15%
+
+Se compara el mínimo y sin GC: la mediana de los lotes grandes varía más
+del 15% entre corridas idénticas en una VM compartida. Los baselines se
+guardan por máquina (``<storage>/<OS>-<Python>-<bits>/``) y solo son
+comparables en el mismo hardware: guardar uno en el runner de CI.
+"""
+import datetime
+import random
+
+import pytest
+
+from manager.models import Client, ManagerData, Notification, Project
+from users.models import CustomUser
+
+BATCH_SIZE = 1000
+
+NOW = datetime.datetime(2025, 6, 2, 14, 30, tzinfo=datetime.timezone.utc)
+
+LEVELS = [
+    (0, 'principiante'),
+    (500, 'intermedio'),
+    (2000, 'avanzado'),
+    (5000, 'experto'),
+    (10000, 'maestro'),
+]
+
+
+def level_for(points):
+    return [level for threshold, level in LEVELS if points >= threshold][-1]
+
+
+@pytest.fixture(scope='session')
+def rng():
+    return random.Random(42)
+
+
+@pytest.fixture(scope='session')
+def now():
+    return NOW
+
+
+@pytest.fixture(scope='session')
+def users(rng):
+    users = []
+    for i in range(BATCH_SIZE):
+        user = CustomUser(
+            id=i + 1,
+            username=f'usuario_{i:04d}',
+            # Un 10% sin apellido: get_full_name cae al username
+            first_name=rng.choice(['Juan', 'María', 'Lucía', 'Martín']),
+            last_name='' if i % 10 == 0 else rng.choice(['Pérez', 'Gómez', 'Díaz']),
+            email=f'usuario_{i:04d}@example.com',
+            phone=f'351{i:07d}',
+            profession='Arquitecto',
+            direction='Av. Colón 1234, Córdoba',
+            is_active=True,
+            created_at=NOW - datetime.timedelta(days=i),
+            updated_at=NOW,
+        )
+        points = min(int(rng.paretovariate(1.2) * 100) - 100, 20000)
+        # Asignado del lado inverso: UserDetailSerializer no consulta la base
+        user.manager_user = ManagerData(
+            id=user.id,
+            points=points,
+            acc_level=level_for(points),
+            notifications=rng.randrange(10),
+            created_at=user.created_at,
+            updated_at=NOW,
+        )
+        users.append(user)
+    return users
+
+
+@pytest.fixture(scope='session')
+def managers(users):
+    return [user.manager_user for user in users]
+
+
+@pytest.fixture(scope='session')
+def notifications(users, rng):
+    return [
+        Notification(
+            id=i + 1,
+            user=users[i % len(users)],
+            message=f'¡Felicitaciones! sumaste {i * 10} puntos.',
+            description='Se han añadido puntos a tu cuenta.',
+            is_read=bool(i % 2),
+            # De segundos a más de un año: recorre todas las ramas de time_elapsed
+            created_at=NOW - datetime.timedelta(seconds=int(rng.expovariate(1 / 86400) * 30)),
+        )
+        for i in range(BATCH_SIZE)
+    ]
+
+
+@pytest.fixture(scope='session')
+def projects(users):
+    clients = [
+        Client(id=i + 1, user=users[i], name=f'Cliente {i:04d}', phone=f'351{i:07d}', created_at=NOW)
+        for i in range(100)
+    ]
+    return [
+        Project(
+            id=i + 1,
+            user=users[i % len(users)],
+            client=clients[i % len(clients)] if i % 5 else None,
+            name=f'Edificio Residencial Nº {i + 1}',
+            description='Obra de ejemplo para benchmark.',
+            location='Av. Colón 1234, Córdoba',
+            start_date=datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 365),
+            end_date=datetime.date(2025, 1, 1) + datetime.timedelta(days=i % 365) if i % 3 else None,
+            is_active=bool(i % 4),
+            created_at=NOW - datetime.timedelta(days=i),
+            updated_at=NOW,
+        )
+        for i in range(BATCH_SIZE)
+    ]
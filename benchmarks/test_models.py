@@ -0,0 +1,35 @@
+"""
+Métodos de modelo que se llaman una vez por fila al renderizar listados y el dashboard.
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+pytestmark = pytest.mark.benchmark(group='models')
+
+
+def test_notification_time_elapsed(benchmark, notifications, now):
+    result = benchmark(lambda: [notification.time_elapsed(now=now) for notification in notifications])
+    assert len(result) == len(notifications)
+    assert all(text == 'ahora' or text.startswith('hace ') for text in result)
+
+
+def test_manager_progress_percentage(benchmark, managers):
+    result = benchmark(lambda: [manager.progress_percentage for manager in managers])
+    assert all(0 <= percentage <= 100 for percentage in result)
+
+
+def test_manager_points_for_next_level(benchmark, managers):
+    result = benchmark(lambda: [manager.points_for_next_level for manager in managers])
+    assert all(points >= 0 for points in result)
+
+
+def test_manager_nivel_canonico(benchmark, managers):
+    result = benchmark(lambda: [manager._nivel_canonico() for manager in managers])
+    assert result == [manager.acc_level for manager in managers]
+
+
+def test_user_get_full_name(benchmark, users):
+    result = benchmark(lambda: [user.get_full_name() for user in users])
+    assert result[0] == users[0].username
+    assert result[1] == f'{users[1].first_name} {users[1].last_name}'
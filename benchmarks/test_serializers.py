@@ -0,0 +1,73 @@
+"""
+Serializers v1 sobre lotes de 1000 objetos en memoria (sin consultas).
+
+Los de listado se miden también por el fast path ``.values()``
+(api/values.py) con filas dict equivalentes.
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from api.v1.clients.serializers import ClientSerializer  # noqa: E402
+from api.v1.manager.serializers import ManagerDataSerializer  # noqa: E402
+from api.v1.notifications.serializers import NotificationSerializer  # noqa: E402
+from api.v1.projects.serializers import ProjectDetailSerializer, ProjectListSerializer  # noqa: E402
+from api.v1.users.serializers import UserDetailSerializer, UserSerializer  # noqa: E402
+from api.values import ValuesSerializer  # noqa: E402
+
+pytestmark = pytest.mark.benchmark(group='serializers')
+
+
+def serialize(serializer_class, instances, **context):
+    return serializer_class(instances, many=True, context=context).data
+
+
+def values_rows(instances, columns):
+    """Filas como las de ``.values(*columns)``, con ``relacion__campo`` resuelto."""
+    rows = []
+    for instance in instances:
+        row = {}
+        for column in columns:
+            value = instance
+            for part in column.split('__'):
+                value = getattr(value, part, None) if value is not None else None
+            row[column] = value
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize('serializer_class, fixture', [
+    (UserSerializer, 'users'),
+    (UserDetailSerializer, 'users'),
+    (ManagerDataSerializer, 'managers'),
+    (ProjectListSerializer, 'projects'),
+    (ProjectDetailSerializer, 'projects'),
+    (NotificationSerializer, 'notifications'),
+])
+def test_serializer(benchmark, request, serializer_class, fixture, now):
+    instances = request.getfixturevalue(fixture)
+    data = benchmark(serialize, serializer_class, instances, now=now)
+    assert len(data) == len(instances)
+
+
+@pytest.mark.parametrize('serializer_class, fixture', [
+    (ProjectListSerializer, 'projects'),
+    (NotificationSerializer, 'notifications'),
+])
+def test_values_serializer(benchmark, request, serializer_class, fixture, now):
+    instances = request.getfixturevalue(fixture)
+    values_serializer = ValuesSerializer.compile(serializer_class(context={'now': now}))
+    rows = values_rows(instances, values_serializer.columns)
+    data = benchmark(values_serializer.to_representation, rows)
+    # Misma salida que el ModelSerializer
+    assert data == serialize(serializer_class, instances, now=now)
+
+
+def test_client_serializer(benchmark, projects):
+    clients = list({project.client.id: project.client for project in projects if project.client}.values())
+    for client in clients:
+        client.projects_count = 10
+    # Lote de 1000 como el resto (los 100 clientes repetidos)
+    batch = (clients * 10)[:1000]
+    data = benchmark(serialize, ClientSerializer, batch)
+    assert len(data) == len(batch)
@@ -0,0 +1,167 @@
+"""
+Escenarios de carga de MajobaSyS para Locust.
+
+Simula usuarios de la API (app móvil) y de la web contra un servidor local:
+
+- ``ApiUser``: login JWT, dashboard, listado/búsqueda/alta de proyectos y
+  polling del contador de notificaciones no leídas.
+- ``WebUser``: login con formulario, panel de cuenta, listado y alta de
+  proyectos, y la home (full-page cache).
+
+Los usuarios son los de ``generate_fake_data`` (``loadtest_000001``, ...).
+
+Preparación (una vez):
+    pip install -r requirements/loadtest.txt
+    export DJANGO_SETTINGS_MODULE=majobacore.settings.loadtest   # SQLite; DATABASE_URL/REDIS_URL opcionales
+    python manage.py migrate
+    python manage.py generate_fake_data --users 1000
+
+Servidor (igual que el Procfile):
+    gunicorn majobacore.wsgi --workers 4 --worker-class gthread --threads 4 --bind 127.0.0.1:8000
+
+Corrida sin interfaz, guardando el resultado para comparar entre commits:
+    locust -f loadtest/locustfile.py --host http://127.0.0.1:8000 --headless \\
+        --users 50 --spawn-rate 10 --run-time 2m --results-file loadtest/results/$(git rev-parse --short HEAD).json
+    python loadtest/results.py compare loadtest/results/<base>.json loadtest/results/<nuevo>.json
+
+Variables de entorno: ``LOADTEST_USERS`` (usuarios generados, default 100),
+``LOADTEST_PREFIX`` y ``LOADTEST_PASSWORD`` (los de generate_fake_data).
+"""
+import datetime
+import os
+import random
+import re
+import sys
+
+from locust import HttpUser, between, events, task
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import results  # noqa: E402
+
+USER_COUNT = int(os.getenv('LOADTEST_USERS', '100'))
+USER_PREFIX = os.getenv('LOADTEST_PREFIX', 'loadtest')
+PASSWORD = os.getenv('LOADTEST_PASSWORD', 'loadtest-1234')
+
+# El nombre de la cookie CSRF es configurable: el token se toma del formulario
+CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+SEARCH_TERMS = ['vivienda', 'relevamiento', 'mensura', 'córdoba', 'nave', 'refacción', 'general paz']
+
+
+def pick_username():
+    return f'{USER_PREFIX}_{random.randint(1, USER_COUNT):06d}'
+
+
+def new_project_data():
+    start = datetime.date.today() - datetime.timedelta(days=random.randrange(60))
+    return {
+        'name': f'Proyecto de carga {random.randrange(10**6)}',
+        'description': 'Creado por la prueba de carga.',
+        'location': 'Av. Colón 1234, Córdoba',
+        'start_date': start.isoformat(),
+        'new_client_name': 'Cliente de carga',
+    }
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument(
+        '--results-file',
+        default='',
+        help='Guarda el resumen de la corrida en este JSON (ver loadtest/results.py)',
+    )
+
+
+@events.quitting.add_listener
+def save_results(environment, **kwargs):
+    path = getattr(environment.parsed_options, 'results_file', '')
+    if path:
+        results.write(path, results.from_locust(environment))
+
+
+class ApiUser(HttpUser):
+    """Cliente de la API REST con JWT (app móvil)."""
+    weight = 3
+    wait_time = between(1, 3)
+
+    def on_start(self):
+        self.login()
+
+    def login(self):
+        response = self.client.post(
+            '/api/v1/auth/login/',
+            json={'username': pick_username(), 'password': PASSWORD},
+            name='api: login',
+        )
+        if response.status_code == 200:
+            self.client.headers['Authorization'] = f'Bearer {response.json()["access"]}'
+
+    def get(self, url, name):
+        with self.client.get(url, name=name, catch_response=True) as response:
+            if response.status_code == 401:
+                # Access token vencido en corridas largas: se cuenta como falla y se reloguea
+                response.failure('401: token vencido')
+                self.login()
+
+    @task(5)
+    def dashboard(self):
+        self.get('/api/v1/manager/dashboard/', 'api: dashboard')
+
+    @task(4)
+    def projects_list(self):
+        self.get('/api/v1/projects/', 'api: projects list')
+
+    @task(2)
+    def projects_search(self):
+        self.get(f'/api/v1/projects/?search={random.choice(SEARCH_TERMS)}', 'api: projects search')
+
+    @task(1)
+    def projects_create(self):
+        self.client.post('/api/v1/projects/', json=new_project_data(), name='api: projects create')
+
+    @task(8)
+    def notifications_poll(self):
+        self.get('/api/v1/notifications/unread-count/', 'api: notifications unread-count')
+
+    @task(2)
+    def notifications_list(self):
+        self.get('/api/v1/notifications/', 'api: notifications list')
+
+
+class WebUser(HttpUser):
+    """Usuario de la web con sesión y CSRF."""
+    weight = 1
+    wait_time = between(2, 5)
+
+    def on_start(self):
+        form = self.client.get('/users/login/', name='web: login form')
+        self.post_form(
+            '/users/login/',
+            form,
+            {'username': pick_username(), 'password': PASSWORD},
+            name='web: login',
+        )
+
+    def post_form(self, url, form, data, name):
+        """POST de ``data`` con el token CSRF del formulario ``form`` (respuesta del GET)."""
+        match = CSRF_INPUT.search(form.text)
+        data = {**data, 'csrfmiddlewaretoken': match.group(1) if match else ''}
+        return self.client.post(url, data=data, headers={'Referer': self.host + url}, name=name)
+
+    @task(5)
+    def account(self):
+        self.client.get('/manager/', name='web: account')
+
+    @task(3)
+    def projects_list(self):
+        self.client.get('/manager/list-projects/', name='web: projects list')
+
+    @task(1)
+    def projects_create(self):
+        form = self.client.get('/manager/create-project/', name='web: projects create form')
+        self.post_form('/manager/create-project/', form, new_project_data(), name='web: projects create')
+
+    @task(2)
+    def home(self):
+        self.client.get('/', name='web: home')
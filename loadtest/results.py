@@ -0,0 +1,199 @@
+"""
+Formato de resultados de las pruebas de carga y comparación entre commits.
+
+Cada corrida de loadtest/locustfile.py con ``--results-file`` guarda un JSON:
+
+    {
+      "format": 1,
+      "commit": "3c7b182",              # git rev-parse --short HEAD (+dirty)
+      "created_at": "2025-06-02T14:30:12+00:00",
+      "host": "http://127.0.0.1:8000",
+      "users": 50,
+      "run_time": 120.0,
+      "total": {...},
+      "endpoints": {
+        "api: dashboard": {"method": "GET", "requests": 5012, "failures": 0,
+                           "rps": 41.8, "avg_ms": 12.3, "p50_ms": 9, "p95_ms": 31,
+                           "p99_ms": 58, "max_ms": 140},
+        ...
+      }
+    }
+
+``compare`` marca regresión cuando, para un endpoint con al menos
+``--min-requests`` requests en las dos corridas, el p95 sube más de
+``--threshold`` (relativo) y más de ``--min-delta-ms``, o la tasa de fallas
+sube más de un punto, o cuando el throughput total baja más de
+``--threshold``. Sale con código 1 si hay alguna, para usarlo en CI:
+
+    python loadtest/results.py compare base.json nuevo.json --threshold 0.10
+"""
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+
+FORMAT_VERSION = 1
+
+
+def git_commit():
+    """Commit actual (corto), con ``+dirty`` si hay cambios sin commitear."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f'{commit}+dirty' if dirty else commit
+
+
+def _entry(stats):
+    return {
+        'method': stats.method,
+        'requests': stats.num_requests,
+        'failures': stats.num_failures,
+        'rps': round(stats.total_rps, 2),
+        'avg_ms': round(stats.avg_response_time, 2),
+        'p50_ms': stats.get_response_time_percentile(0.50),
+        'p95_ms': stats.get_response_time_percentile(0.95),
+        'p99_ms': stats.get_response_time_percentile(0.99),
+        'max_ms': round(stats.max_response_time, 2),
+    }
+
+
+def from_locust(environment):
+    """Resumen de una corrida a partir del ``Environment`` de Locust."""
+    stats = environment.stats
+    return {
+        'format': FORMAT_VERSION,
+        'commit': git_commit(),
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'host': environment.host,
+        'users': getattr(environment.parsed_options, 'num_users', None),
+        'run_time': round(stats.last_request_timestamp - stats.start_time, 1) if stats.last_request_timestamp else 0,
+        'total': _entry(stats.total),
+        'endpoints': {name: _entry(entry) for (name, _method), entry in sorted(stats.entries.items())},
+    }
+
+
+def write(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+def load(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('format') != FORMAT_VERSION:
+        raise ValueError(f'{path}: formato {data.get("format")!r} no soportado')
+    return data
+
+
+def _failure_ratio(entry):
+    return entry['failures'] / entry['requests'] if entry['requests'] else 0.0
+
+
+def compare(base, current, threshold=0.10, min_delta_ms=5, min_requests=50):
+    """
+    Compara dos corridas endpoint por endpoint.
+
+    Returns:
+        tuple[list[dict], list[str]]: Filas de la comparación y regresiones.
+    """
+    rows = []
+    regressions = []
+    for name in sorted(set(base['endpoints']) | set(current['endpoints'])):
+        before = base['endpoints'].get(name)
+        after = current['endpoints'].get(name)
+        row = {'name': name, 'before': before, 'after': after}
+        rows.append(row)
+        if before is None or after is None or min(before['requests'], after['requests']) < min_requests:
+            # Con pocas muestras el p95 es ruido
+            continue
+
+        delta = after['p95_ms'] - before['p95_ms']
+        if before['p95_ms'] and delta > min_delta_ms and delta / before['p95_ms'] > threshold:
+            regressions.append(f'{name}: p95 {before["p95_ms"]} -> {after["p95_ms"]} ms')
+        if _failure_ratio(after) - _failure_ratio(before) > 0.01:
+            regressions.append(
+                f'{name}: fallas {_failure_ratio(before):.1%} -> {_failure_ratio(after):.1%}'
+            )
+
+    before_rps, after_rps = base['total']['rps'], current['total']['rps']
+    if before_rps and (before_rps - after_rps) / before_rps > threshold:
+        regressions.append(f'throughput total {before_rps} -> {after_rps} req/s')
+    return rows, regressions
+
+
+def _format_comparison(base, current, rows, regressions):
+    lines = [
+        f'base: {base["commit"]} ({base["created_at"]}, {base["users"]} usuarios)',
+        f'nuevo: {current["commit"]} ({current["created_at"]}, {current["users"]} usuarios)',
+        '',
+        f'{"endpoint":<36} {"p95 base":>9} {"p95 nuevo":>10} {"Δ":>7} {"req/s base":>11} {"req/s nuevo":>12}',
+    ]
+    for row in rows:
+        before, after = row['before'], row['after']
+        if before is None or after is None:
+            lines.append(f'{row["name"]:<36} {"solo en " + ("nuevo" if before is None else "base"):>9}')
+            continue
+        change = (after['p95_ms'] - before['p95_ms']) / before['p95_ms'] if before['p95_ms'] else 0.0
+        lines.append(
+            f'{row["name"]:<36} {before["p95_ms"]:>9} {after["p95_ms"]:>10} {change:>+7.0%} '
+            f'{before["rps"]:>11} {after["rps"]:>12}'
+        )
+    lines.append('')
+    if regressions:
+        lines.append('REGRESIONES:')
+        lines.extend(f'  - {regression}' for regression in regressions)
+    else:
+        lines.append('Sin regresiones.')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Resultados de las pruebas de carga de MajobaSyS')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    compare_parser = subparsers.add_parser('compare', help='Compara dos corridas y detecta regresiones')
+    compare_parser.add_argument('base', help='JSON de la corrida de referencia')
+    compare_parser.add_argument('current', help='JSON de la corrida nueva')
+    compare_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='Empeoramiento relativo tolerado (default: 0.10 = 10%%)',
+    )
+    compare_parser.add_argument(
+        '--min-delta-ms',
+        type=float,
+        default=5,
+        help='Subida mínima del p95 en ms para contar como regresión (default: 5)',
+    )
+    compare_parser.add_argument(
+        '--min-requests',
+        type=int,
+        default=50,
+        help='Requests mínimos de un endpoint en cada corrida para evaluarlo (default: 50)',
+    )
+    args = parser.parse_args(argv)
+
+    base, current = load(args.base), load(args.current)
+    rows, regressions = compare(
+        base, current, args.threshold, args.min_delta_ms, args.min_requests,
+    )
+    print(_format_comparison(base, current, rows, regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -87,11 +87,15 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'majobacore.utils.compression.CompressionMiddleware',  # brotli/gzip de respuestas dinámicas
     'whitenoise.middleware.WhiteNoiseMiddleware',  # For static files in production
+    'django.middleware.http.ConditionalGetMiddleware',  # ETag + 304 para respuestas dinámicas
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'majobacore.utils.security.RateLimitMiddleware',  # límites por grupo de rutas (RATE_LIMIT_SETTINGS)
+    'majobacore.utils.hashers.HashingBusyMiddleware',  # 503 + Retry-After con el pool de hashing lleno
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -152,6 +156,31 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Hashers (majobacore/utils/hashers.py): Argon2id ajustado como preferido; los
+# hashes PBKDF2 existentes se re-hashean a Argon2 en el próximo login.
+try:
+    import argon2  # noqa: F401
+    _argon2_hashers = ['majobacore.utils.hashers.Argon2PasswordHasher']
+except ImportError:  # pragma: no cover - argon2-cffi está en requirements/base.txt
+    _argon2_hashers = []
+
+PASSWORD_HASHERS = _argon2_hashers + [
+    'majobacore.utils.hashers.PBKDF2PasswordHasher',
+    'majobacore.utils.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Parámetros de Argon2id (OWASP: 19 MiB, 2 pasadas, 1 lane). Cambiarlos
+# re-hashea cada contraseña en su siguiente login.
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=2, cast=int)
+ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', default=19456, cast=int)  # KiB
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=1, cast=int)
+
+# Hashes simultáneos por proceso (0 = en el hilo del request) y segundos de
+# espera por un lugar antes de responder "reintentar" en el login.
+PASSWORD_HASHING_THREADS = config('PASSWORD_HASHING_THREADS', default=1, cast=int)
+PASSWORD_HASHING_TIMEOUT = config('PASSWORD_HASHING_TIMEOUT', default=2.0, cast=float)
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 LANGUAGE_CODE = config('LANGUAGE_CODE', default='es')
@@ -167,6 +196,42 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# Salida de los pasos de build previos a collectstatic (variantes de imágenes,
+# bundles CSS/JS). Se suma a STATICFILES_DIRS para que collectstatic la hashee.
+STATIC_BUILD_ROOT = BASE_DIR / 'static_build'
+
+# Variantes AVIF/WebP de static/images (python manage.py build_responsive_images).
+# Se generan en el build, antes de collectstatic; ver majobacore/utils/images.py.
+RESPONSIVE_IMAGES_ROOT = STATIC_BUILD_ROOT
+RESPONSIVE_IMAGES = {
+    'WIDTHS': [480, 960, 1440, 1920],
+    'FORMATS': ['avif', 'webp'],
+    'SOURCE_DIRS': ['images'],
+}
+
+# Bundles CSS/JS por página (python manage.py build_static_bundles); ver
+# majobacore/utils/bundles.py. 'critical' se inserta inline en base.html.
+# Sin build (o con STATIC_BUNDLES_ENABLED=False) los templates linkean los
+# archivos fuente por separado.
+STATIC_BUNDLES_ENABLED = config('STATIC_BUNDLES_ENABLED', default=True, cast=bool)
+STATIC_BUNDLES = {
+    'critical': {'css': ['css/base.css']},
+    'base': {'js': ['js/base.js']},
+    'index': {'css': ['css/index.css', 'css/carousel-fallback.css']},
+    'carousel': {'css': ['css/carousel.css']},
+    'login': {'css': ['css/login.css']},
+    'create_user': {'css': ['css/create_user.css']},
+    'admin_dashboard': {
+        'css': ['css/admin_dashboard.css'],
+        'js': ['js/admin-dashboard.js', 'js/search.js'],
+    },
+    'modify_manager': {'css': ['css/modify_manager.css']},
+    'budget_form': {'css': ['css/budget_form.css']},
+}
+
+if STATIC_BUILD_ROOT.is_dir():
+    STATICFILES_DIRS.append(STATIC_BUILD_ROOT)
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -226,49 +291,57 @@ LOGGING = {
             'class': 'django.utils.log.AdminEmailHandler',
             'include_html': False,
         },
+        # Los loggers escriben acá: encola y un hilo entrega a 'console'
+        # (majobacore/utils/logqueue.py). mail_admins queda sincrónico: solo
+        # ERROR y necesita el request vivo.
+        'queue': {
+            '()': 'majobacore.utils.logqueue.QueueHandler',
+            'handlers': ['cfg://handlers.console'],
+            'maxsize': 10000,
+        },
     },
     'root': {
-        'handlers': ['console'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['console', 'mail_admins'],
+            'handlers': ['queue', 'mail_admins'],
             'level': 'ERROR',
             'propagate': False,
         },
         'django.security': {
-            'handlers': ['console', 'mail_admins'],
+            'handlers': ['queue', 'mail_admins'],
             'level': 'WARNING',
             'propagate': False,
         },
         'django.db.backends': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'WARNING',
             'propagate': False,
         },
         'majobacore': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'users': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'manager': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'api': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
@@ -283,8 +356,27 @@ CACHES = {
     }
 }
 
+# Full-page cache de páginas públicas (majobacore.utils.cache.anonymous_cache_page)
+# La versión de deploy forma parte de la clave: cada deploy empieza con cache vacío.
+# Railway expone el commit/deployment; fuera de Railway se puede fijar DEPLOY_VERSION.
+DEPLOY_VERSION = config(
+    'DEPLOY_VERSION',
+    default=os.getenv('RAILWAY_GIT_COMMIT_SHA') or os.getenv('RAILWAY_DEPLOYMENT_ID') or 'local',
+)
+PAGE_CACHE_TIMEOUT = config('PAGE_CACHE_TIMEOUT', default=600, cast=int)  # servidor y CDN (s-maxage)
+PAGE_CACHE_BROWSER_MAX_AGE = config('PAGE_CACHE_BROWSER_MAX_AGE', default=60, cast=int)
+
+# Notificaciones leídas más viejas que esto se mueven a la tabla de archivo
+# (python manage.py archive_notifications; ver manager/retention.py)
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=90, cast=int)
+
+# Tamaño máximo del archivo de POST /api/v1/projects/import/ (bytes)
+PROJECT_IMPORT_MAX_SIZE = config('PROJECT_IMPORT_MAX_SIZE', default=10 * 1024 * 1024, cast=int)
+
 # Session Configuration
-SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+# Redis adelante y la tabla django_session como respaldo durable: un corte de
+# Redis no desloguea a nadie (majobacore/utils/sessions.py).
+SESSION_ENGINE = 'majobacore.utils.sessions'
 SESSION_CACHE_ALIAS = 'default'
 SESSION_COOKIE_AGE = 86400  # 24 hours (1 día)
 SESSION_SAVE_EVERY_REQUEST = False  # Solo guardar si hay cambios
@@ -306,6 +398,17 @@ CSRF_FAILURE_VIEW = 'django.views.csrf.csrf_failure'  # Vista personalizable
 # que sanitice el header X-Forwarded-For antes de que llegue a Django.
 TRUSTED_PROXY_ENABLED = config('TRUSTED_PROXY_ENABLED', default=False, cast=bool)
 
+# Response Compression (majobacore.utils.compression.CompressionMiddleware)
+# Por debajo de ~1 KB la respuesta entra en un solo paquete: comprimir no ahorra tiempo.
+RESPONSE_COMPRESSION_MIN_LENGTH = config('RESPONSE_COMPRESSION_MIN_LENGTH', default=1024, cast=int)
+# Calidad brotli para contenido dinámico (0-11); 4 es ~gzip-6 en CPU con mejor ratio.
+RESPONSE_COMPRESSION_BROTLI_QUALITY = config('RESPONSE_COMPRESSION_BROTLI_QUALITY', default=4, cast=int)
+
+# RateLimitMiddleware (majobacore/utils/security.py). Los límites por grupo
+# de rutas están en RATE_LIMIT_SETTINGS; este dict permite pisar alguno.
+RATE_LIMIT_ENABLED = config('RATE_LIMIT_ENABLED', default=True, cast=bool)
+RATE_LIMIT_SETTINGS = {}
+
 # Security Settings (base - se sobrescriben en production.py)
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -326,7 +429,7 @@ LOGOUT_REDIRECT_URL = '/users/login/'
 # ============================================================================
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -339,21 +442,30 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'api.throttling.AnonRateThrottle',
+        'api.throttling.UserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '30/minute',
         'user': '120/minute',
         'login': '5/minute',
+        'project_import': '10/hour',
+        'export': '30/hour',
     },
+    # orjson: mismo JSON que el renderer/parser de DRF, con menos CPU por request
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DATETIME_FORMAT': '%Y-%m-%dT%H:%M:%S%z',
     'DATE_FORMAT': '%Y-%m-%d',
     'DATE_INPUT_FORMATS': ['%Y-%m-%d', '%d-%m-%Y'],
-    'EXCEPTION_HANDLER': 'rest_framework.views.exception_handler',
+    # El de DRF, más 429 + Retry-After con el pool de hashing lleno
+    'EXCEPTION_HANDLER': 'api.exceptions.exception_handler',
 }
 
 # ============================================================================
@@ -375,4 +487,33 @@ SIMPLE_JWT = {
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
     'TOKEN_USER_CLASS': 'rest_framework_simplejwt.models.TokenUser',
+    'TOKEN_REFRESH_SERIALIZER': 'api.v1.auth.serializers.CachedTokenRefreshSerializer',
 }
+
+# Blacklist de refresh tokens en Redis (api/tokens.py): tokens blacklisteados
+# vigentes que el filtro de Bloom dimensiona y su tasa de falsos positivos
+# (cada falso positivo es una consulta a la base).
+JWT_BLACKLIST_BLOOM_CAPACITY = config('JWT_BLACKLIST_BLOOM_CAPACITY', default=1_000_000, cast=int)
+JWT_BLACKLIST_BLOOM_ERROR_RATE = 0.001
+
+# Cache en dos niveles (majobacore/utils/tiered_cache.py): LRU en memoria de
+# cada worker delante de Redis, invalidado por pub/sub. Tope de entradas del LRU.
+LOCAL_CACHE_ENABLED = config('LOCAL_CACHE_ENABLED', default=True, cast=bool)
+LOCAL_CACHE_MAX_ENTRIES = config('LOCAL_CACHE_MAX_ENTRIES', default=10_000, cast=int)
+
+# Serializer (pickle, msgpack, orjson) y compresor (none, zlib, lz4, zstd) del
+# cache Redis; solo se comprimen valores de más de CACHE_COMPRESS_MIN_LENGTH
+# bytes. Ver majobacore/utils/cache_codecs.py y medir con
+# python manage.py benchmark_cache_codecs.
+CACHE_SERIALIZER = config('CACHE_SERIALIZER', default='pickle')
+CACHE_COMPRESSOR = config('CACHE_COMPRESSOR', default='zlib')
+CACHE_COMPRESS_MIN_LENGTH = config('CACHE_COMPRESS_MIN_LENGTH', default=1024, cast=int)
+
+# Cache de la fila del usuario en CachedJWTAuthentication (users/cache.py) y
+# del ManagerData (manager/cache.py): TTL en Redis y en el LRU del worker. Al
+# guardar se invalidan en todos los workers; el TTL local solo acota la
+# espera si un aviso de invalidación no se pudo publicar.
+AUTH_USER_CACHE_TIMEOUT = config('AUTH_USER_CACHE_TIMEOUT', default=300, cast=int)
+AUTH_USER_LOCAL_CACHE_TIMEOUT = config('AUTH_USER_LOCAL_CACHE_TIMEOUT', default=30, cast=int)
+MANAGER_DATA_CACHE_TIMEOUT = config('MANAGER_DATA_CACHE_TIMEOUT', default=300, cast=int)
+MANAGER_DATA_LOCAL_CACHE_TIMEOUT = config('MANAGER_DATA_LOCAL_CACHE_TIMEOUT', default=30, cast=int)
@@ -71,19 +71,27 @@ LOGGING['loggers']['manager']['level'] = 'WARNING'
 LOGGING['loggers']['api']['level'] = 'INFO'
 
 # Static files configuration for development
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# En desarrollo se editan los CSS/JS fuente: no usar bundles viejos
+STATIC_BUNDLES_ENABLED = config('STATIC_BUNDLES_ENABLED', default=False, cast=bool)
 
 # ============================================================================
 # REST FRAMEWORK (Development overrides)
 # ============================================================================
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
-    'rest_framework.renderers.JSONRenderer',
+    'api.renderers.ORJSONRenderer',
     'rest_framework.renderers.BrowsableAPIRenderer',
 ]
 REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
     'anon': '100/minute',
     'user': '500/minute',
     'login': '20/minute',
+    'project_import': '60/hour',
+    'export': '120/hour',
 }
 
 # CORS para desarrollo local de la app móvil
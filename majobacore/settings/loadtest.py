@@ -0,0 +1,86 @@
+"""
+Settings para pruebas de carga (ver loadtest/locustfile.py).
+
+Servidor local con la misma configuración de runtime que producción (sin
+DEBUG, hashers y sesiones reales) contra SQLite (loadtest.sqlite3) o la base
+de DATABASE_URL (ej: un Postgres local), con Redis si hay REDIS_URL.
+"""
+from .base import *
+import dj_database_url
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1', '0.0.0.0']
+
+# =====================================
+# DATABASE
+# =====================================
+DATABASE_URL = config('DATABASE_URL', default='')
+if DATABASE_URL:
+    DATABASES = {
+        'default': dj_database_url.parse(DATABASE_URL, conn_max_age=600, conn_health_checks=True),
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'loadtest.sqlite3',
+            # Con varios workers escribiendo, esperar el lock en vez de fallar
+            'OPTIONS': {'timeout': 20},
+        }
+    }
+
+# =====================================
+# CACHE
+# =====================================
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    from majobacore.utils.cache_codecs import cache_options
+
+    CACHE_CODEC_OPTIONS, CACHE_VERSION = cache_options(
+        CACHE_SERIALIZER, CACHE_COMPRESSOR, CACHE_COMPRESS_MIN_LENGTH,
+    )
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                **CACHE_CODEC_OPTIONS,
+                'CONNECTION_POOL_KWARGS': {'max_connections': 50},
+            },
+            'KEY_PREFIX': 'majobasys-loadtest',
+            'VERSION': CACHE_VERSION,
+        }
+    }
+else:
+    # Sin Redis cada worker tiene su propio cache
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'loadtest',
+        }
+    }
+
+# =====================================
+# SEGURIDAD
+# =====================================
+# Toda la carga sale de una IP: el rate limit cortaría la prueba
+RATE_LIMIT_ENABLED = False
+SECURE_SSL_REDIRECT = False
+SESSION_COOKIE_SECURE = False
+CSRF_COOKIE_SECURE = False
+
+# Los escenarios no piden estáticos: no hace falta collectstatic
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# =====================================
+# LOGGING
+# =====================================
+# Un log por request distorsiona la medición
+LOGGING['root']['level'] = 'WARNING'
+for _logger in ('django', 'majobacore', 'users', 'manager', 'api'):
+    LOGGING['loggers'][_logger]['level'] = 'WARNING'
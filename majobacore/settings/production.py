@@ -181,7 +181,13 @@ else:
     REDIS_URL = config('REDIS_URL', default='')
     
     if REDIS_URL:
-        # Redis configurado: usar django-redis
+        # Redis configurado: usar django-redis, con el serializer y el
+        # compresor elegidos (majobacore/utils/cache_codecs.py)
+        from majobacore.utils.cache_codecs import cache_options
+
+        CACHE_CODEC_OPTIONS, CACHE_VERSION = cache_options(
+            CACHE_SERIALIZER, CACHE_COMPRESSOR, CACHE_COMPRESS_MIN_LENGTH,
+        )
         CACHES = {
             'default': {
                 'BACKEND': 'django_redis.cache.RedisCache',
@@ -190,7 +196,7 @@ else:
                     'CLIENT_CLASS': 'django_redis.client.DefaultClient',
                     'SOCKET_CONNECT_TIMEOUT': 5,
                     'SOCKET_TIMEOUT': 5,
-                    'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+                    **CACHE_CODEC_OPTIONS,
                     'CONNECTION_POOL_KWARGS': {
                         'max_connections': 50,
                         'retry_on_timeout': True,
@@ -198,6 +204,8 @@ else:
                     'IGNORE_EXCEPTIONS': True,  # No fallar si Redis no está disponible
                 },
                 'KEY_PREFIX': 'majobasys',
+                # Cambia con el serializer/compresor: los valores viejos no se leen
+                'VERSION': CACHE_VERSION,
                 'TIMEOUT': 300,  # 5 minutos por defecto
             }
         }
@@ -216,16 +224,21 @@ else:
             }
         }
 
-# Session backend con Redis
-SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+# Session backend: Redis con respaldo en la base (majobacore/utils/sessions.py)
+SESSION_ENGINE = 'majobacore.utils.sessions'
 SESSION_CACHE_ALIAS = 'default'
 
 # ============================================================================
 # ARCHIVOS ESTÁTICOS
 # ============================================================================
 
-# WhiteNoise para servir archivos estáticos
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# WhiteNoise para servir archivos estáticos: nombres con hash de contenido
+# (cache de un año) y versiones .gz/.br precomprimidas. Django 5.1+ ignora
+# STATICFILES_STORAGE/DEFAULT_FILE_STORAGE: se configura con STORAGES.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
 
 # Compresión de archivos estáticos
 WHITENOISE_COMPRESSION_QUALITY = 90
@@ -251,7 +264,7 @@ if USE_S3:
     AWS_DEFAULT_ACL = 'public-read'
     AWS_S3_FILE_OVERWRITE = False
     
-    DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
+    STORAGES['default'] = {'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage'}
     MEDIA_URL = f'https://{AWS_S3_CUSTOM_DOMAIN}/media/'
 else:
     # Usar almacenamiento local
@@ -339,14 +352,17 @@ LOGGING['handlers']['console'] = {
 }
 
 # Actualizar niveles para producción (menos ruido)
-LOGGING['root']['handlers'] = ['console']
-LOGGING['loggers']['django']['handlers'] = ['console']
+# 'queue' (base.py) envuelve a este 'console': el JSON se arma y se escribe
+# en el hilo del listener, no en el worker
+LOGGING['root']['handlers'] = ['queue']
+LOGGING['loggers']['django']['handlers'] = ['queue']
 LOGGING['loggers']['django']['level'] = 'WARNING'
-LOGGING['loggers']['django.request']['handlers'] = ['console', 'mail_admins']
-LOGGING['loggers']['django.security']['handlers'] = ['console', 'mail_admins']
-LOGGING['loggers']['majobacore']['handlers'] = ['console']
-LOGGING['loggers']['users']['handlers'] = ['console']
-LOGGING['loggers']['manager']['handlers'] = ['console']
+LOGGING['loggers']['django.request']['handlers'] = ['queue', 'mail_admins']
+LOGGING['loggers']['django.security']['handlers'] = ['queue', 'mail_admins']
+LOGGING['loggers']['majobacore']['handlers'] = ['queue']
+LOGGING['loggers']['users']['handlers'] = ['queue']
+LOGGING['loggers']['manager']['handlers'] = ['queue']
+LOGGING['loggers']['api']['handlers'] = ['queue']
 
 # ============================================================================
 # SEGURIDAD ADICIONAL
@@ -355,11 +371,15 @@ LOGGING['loggers']['manager']['handlers'] = ['console']
 # Middleware de seguridad en orden correcto
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'majobacore.utils.compression.CompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'majobacore.utils.security.RateLimitMiddleware',
+    'majobacore.utils.hashers.HashingBusyMiddleware',  # 503 + Retry-After con el pool de hashing lleno
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'majobacore.utils.security.SecurityHeadersMiddleware',  # Nuestro middleware personalizado
@@ -407,6 +427,8 @@ REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
     'anon': '20/minute',
     'user': '60/minute',
     'login': '5/minute',
+    'project_import': '10/hour',
+    'export': '30/hour',
 }
 
 # ============================================================================
@@ -117,7 +117,10 @@ MIDDLEWARE = [item for item in MIDDLEWARE if 'debug_toolbar' not in item.lower()
 # STATIC FILES
 # =====================================
 # No coleccionar static files durante tests
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
 
 # =====================================
 # SECURITY
@@ -133,7 +136,7 @@ SECURE_HSTS_SECONDS = 0
 # ============================================================================
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -141,16 +144,34 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'api.pagination.StandardPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_THROTTLE_CLASSES': [],
-    'DEFAULT_THROTTLE_RATES': {},
+    # Los throttles por scope de las vistas (login, import, export) necesitan
+    # su tasa; con DummyCache nunca cortan.
+    'DEFAULT_THROTTLE_RATES': {
+        'login': '5/minute',
+        'project_import': '10/hour',
+        'export': '30/hour',
+    },
+    'EXCEPTION_HANDLER': 'api.exceptions.exception_handler',
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
 }
 
+RATE_LIMIT_ENABLED = False
+
+# Sin LRU en memoria: los tests revierten la base entre casos y reusan ids
+LOCAL_CACHE_ENABLED = False
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': False,
     'BLACKLIST_AFTER_ROTATION': False,
+    'TOKEN_REFRESH_SERIALIZER': 'api.v1.auth.serializers.CachedTokenRefreshSerializer',
 }
@@ -0,0 +1,105 @@
+import datetime
+import decimal
+import uuid
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+from django.utils.safestring import SafeString, mark_safe
+
+from majobacore.utils.cache_codecs import MsgPackSerializer, ORJSONSerializer
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack es opcional
+    msgpack = None
+
+AWARE = datetime.datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+OFFSET = datetime.datetime(2024, 3, 1, 9, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=-3)))
+ID = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+
+class CodecTestsMixin:
+    serializer_class = None
+
+    def round_trip(self, value):
+        serializer = self.serializer_class({})
+        return serializer.loads(serializer.dumps(value))
+
+    def assertRoundTrip(self, value):
+        result = self.round_trip(value)
+        self.assertEqual(result, value)
+        self.assertIs(type(result), type(value))
+        return result
+
+    def test_tipos_basicos(self):
+        self.assertRoundTrip({'id': 1, 'name': 'Casa', 'ok': True, 'none': None, 'ratio': 0.5})
+
+    def test_fechas_con_zona_horaria(self):
+        self.assertEqual(self.assertRoundTrip(AWARE).utcoffset(), datetime.timedelta(0))
+        # Mismo instante aunque la zona vuelva normalizada
+        self.assertEqual(self.round_trip(OFFSET), OFFSET)
+        self.assertRoundTrip(datetime.datetime(2024, 3, 1, 12, 30))
+        self.assertRoundTrip(datetime.date(2024, 3, 1))
+        self.assertRoundTrip(datetime.time(12, 30, 15))
+
+    def test_decimal_y_sets(self):
+        self.assertRoundTrip(decimal.Decimal('1234.5600'))
+        self.assertRoundTrip({1, 2, 3})
+        self.assertRoundTrip(frozenset({'a', 'b'}))
+        self.assertRoundTrip(b'\x00\xff')
+
+    def test_safestring_no_pierde_el_tipo(self):
+        result = self.assertRoundTrip({'html': mark_safe('<b>hola</b>')})
+        self.assertIsInstance(result['html'], SafeString)
+
+    def test_claves_int(self):
+        result = self.round_trip({1: 'a', 2: {'total': decimal.Decimal('1')}})
+        self.assertEqual(result, {self.int_key(1): 'a', self.int_key(2): {'total': decimal.Decimal('1')}})
+
+    def test_dict_con_la_clave_de_las_marcas(self):
+        for value in (
+            {'l': [{'__t': 'x', 'v': 1}], 'd': decimal.Decimal('1')},
+            {'l': [{'__t': 'decimal', 'v': '2'}], 'd': decimal.Decimal('1')},
+            [{'__t': 'set', 'v': [1]}],
+            {'__t': 'date', 'v': '2024-01-01'},
+        ):
+            with self.subTest(value=value):
+                self.assertRoundTrip(value)
+
+
+@skipIf(msgpack is None, 'requiere msgpack')
+class MsgPackSerializerTests(CodecTestsMixin, SimpleTestCase):
+    """Serializer msgpack del cache (majobacore/utils/cache_codecs.py)."""
+    serializer_class = MsgPackSerializer
+
+    def int_key(self, key):
+        return key
+
+    def test_tuplas_y_uuid(self):
+        self.assertRoundTrip((1, ('a', AWARE), [ID]))
+        self.assertRoundTrip(ID)
+
+
+class ORJSONSerializerTests(CodecTestsMixin, SimpleTestCase):
+    """Serializer orjson del cache (majobacore/utils/cache_codecs.py)."""
+    serializer_class = ORJSONSerializer
+
+    def int_key(self, key):
+        # JSON: las claves que no son string vuelven como string
+        return str(key)
+
+    def test_tuplas_y_uuid_vuelven_como_lista_y_string(self):
+        self.assertEqual(self.round_trip((1, ('a', AWARE))), [1, ['a', AWARE]])
+        self.assertEqual(self.round_trip(ID), str(ID))
+
+    def test_valor_sin_marcas_es_json_plano(self):
+        serializer = ORJSONSerializer({})
+        self.assertEqual(serializer.dumps({'a': [1, 2]}), b'{"a":[1,2]}')
+        # Un string con la clave adentro no obliga a escapar nada
+        self.assertEqual(serializer.dumps({'a': '"__t": 1'}), b'{"a":"\\"__t\\": 1"}')
+
+    def test_marca_desconocida_no_rompe_la_lectura(self):
+        serializer = ORJSONSerializer({})
+        stored = b'~{"l":[{"__t":"x","v":1}],"d":{"__t":"decimal","v":"1"}}'
+
+        self.assertEqual(serializer.loads(stored), {'l': [{'__t': 'x', 'v': 1}], 'd': decimal.Decimal('1')})
@@ -0,0 +1,137 @@
+import gzip
+from unittest import mock, skipIf
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from majobacore.utils.compression import CompressionMiddleware, select_encoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional
+    brotli = None
+
+BODY = b'{"proyectos": [' + b'{"nombre": "Casa", "activo": true},' * 100 + b'{}]}'
+
+
+class SelectEncodingTests(SimpleTestCase):
+    """Negociación de ``Accept-Encoding``."""
+
+    def test_br_gana_ante_igual_preferencia(self):
+        self.assertEqual(select_encoding('gzip, br', brotli_available=True), 'br')
+
+    def test_respeta_la_preferencia_del_cliente(self):
+        self.assertEqual(select_encoding('br;q=0.5, gzip', brotli_available=True), 'gzip')
+
+    def test_sin_brotli_usa_gzip(self):
+        self.assertEqual(select_encoding('br, gzip', brotli_available=False), 'gzip')
+
+    def test_q_cero_rechaza(self):
+        self.assertIsNone(select_encoding('gzip;q=0', brotli_available=False))
+        self.assertIsNone(select_encoding('br;q=0, gzip;q=0', brotli_available=True))
+        self.assertIsNone(select_encoding('identity', brotli_available=True))
+
+    def test_comodin(self):
+        self.assertEqual(select_encoding('*', brotli_available=True), 'br')
+        self.assertEqual(select_encoding('br;q=0, *', brotli_available=True), 'gzip')
+        self.assertIsNone(select_encoding('*;q=0', brotli_available=True))
+
+
+@override_settings(RESPONSE_COMPRESSION_MIN_LENGTH=200)
+class CompressionMiddlewareTests(SimpleTestCase):
+    """``CompressionMiddleware`` (majobacore/utils/compression.py)."""
+
+    def process(self, response, accept_encoding='gzip'):
+        middleware = CompressionMiddleware(lambda request: response)
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return middleware(request)
+
+    def json_response(self, body=BODY, **kwargs):
+        return HttpResponse(body, content_type='application/json', **kwargs)
+
+    def test_comprime_json_con_gzip(self):
+        response = self.process(self.json_response())
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    @skipIf(brotli is None, 'requiere brotli')
+    def test_comprime_con_brotli(self):
+        response = self.process(self.json_response(), accept_encoding='gzip, br')
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), BODY)
+
+    def test_debajo_del_umbral_no_comprime(self):
+        response = self.process(self.json_response(BODY[:199]))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, BODY[:199])
+
+    def test_filtra_por_content_type(self):
+        for content_type, compressed in (
+            ('text/html; charset=utf-8', True),
+            ('image/svg+xml', True),
+            ('image/png', False),
+            ('application/pdf', False),
+            ('text/event-stream', False),
+        ):
+            with self.subTest(content_type=content_type):
+                response = self.process(HttpResponse(BODY, content_type=content_type))
+                self.assertEqual(response.has_header('Content-Encoding'), compressed)
+
+    def test_respuesta_ya_codificada_o_no_transform(self):
+        encoded = self.json_response()
+        encoded['Content-Encoding'] = 'identity'
+        no_transform = self.json_response()
+        no_transform['Cache-Control'] = 'public, no-transform'
+
+        self.assertEqual(self.process(encoded)['Content-Encoding'], 'identity')
+        self.assertEqual(self.process(no_transform).content, BODY)
+        self.assertFalse(no_transform.has_header('Content-Encoding'))
+
+    def test_rango_parcial_no_se_comprime(self):
+        partial = self.json_response(status=206)
+        partial['Content-Range'] = f'bytes 0-{len(BODY) - 1}/{len(BODY) * 2}'
+        with_range = self.json_response()
+        with_range['Content-Range'] = f'bytes 0-{len(BODY) - 1}/{len(BODY)}'
+
+        for response in (partial, with_range):
+            with self.subTest(status=response.status_code):
+                self.assertFalse(self.process(response).has_header('Content-Encoding'))
+                self.assertEqual(response.content, BODY)
+
+    def test_streaming_se_comprime_sin_content_length(self):
+        chunks = [BODY[:50], BODY[50:]]
+        response = StreamingHttpResponse(iter(chunks), content_type='text/html')
+        response['Content-Length'] = str(len(BODY))
+
+        response = self.process(response)
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), BODY)
+
+    def test_etag_fuerte_pasa_a_debil(self):
+        strong = self.json_response()
+        strong['ETag'] = '"abc"'
+        weak = self.json_response()
+        weak['ETag'] = 'W/"abc"'
+
+        self.assertEqual(self.process(strong)['ETag'], 'W/"abc"')
+        self.assertEqual(self.process(weak)['ETag'], 'W/"abc"')
+
+    def test_sin_accept_encoding_solo_agrega_vary(self):
+        response = self.process(self.json_response(), accept_encoding='')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_si_no_achica_no_comprime(self):
+        with mock.patch('majobacore.utils.compression.compress_string', return_value=BODY * 2):
+            response = self.process(self.json_response())
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, BODY)
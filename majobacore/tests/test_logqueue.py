@@ -0,0 +1,208 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.utils.log import configure_logging
+
+from majobacore.utils.logqueue import QueueHandler
+
+
+class CaptureHandler(logging.Handler):
+    """Guarda los records que le entrega el listener; con ``gate`` se bloquea en el primero."""
+
+    instances = []
+
+    def __init__(self, gate=None, delay=0):
+        super().__init__()
+        self.records = []
+        self.gate = gate
+        self.delay = delay
+        self.blocked = threading.Event()
+        CaptureHandler.instances.append(self)
+
+    def emit(self, record):
+        if self.gate is not None and not self.blocked.is_set():
+            self.blocked.set()
+            self.gate.wait(5)
+        if self.delay:
+            time.sleep(self.delay)
+        self.records.append(record)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('Timeout esperando al listener')
+        time.sleep(0.005)
+
+
+class QueueHandlerTests(SimpleTestCase):
+    """Logging asíncrono con cola acotada (majobacore/utils/logqueue.py)."""
+
+    def make_handler(self, target, maxsize=10):
+        handler = QueueHandler([target], maxsize=maxsize)
+        self.addCleanup(handler.close)
+        logger = logging.getLogger(f'majobacore.tests.logqueue.{id(handler)}')
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return handler, logger
+
+    def test_entrega_los_records_en_orden(self):
+        target = CaptureHandler()
+        handler, logger = self.make_handler(target)
+
+        for number in range(5):
+            logger.info('Record %s', number)
+        handler.stop()
+
+        self.assertEqual([record.getMessage() for record in target.records], [
+            f'Record {number}' for number in range(5)
+        ])
+
+    def test_cola_llena_descarta_y_cuenta(self):
+        gate = threading.Event()
+        target = CaptureHandler(gate=gate)
+        handler, logger = self.make_handler(target, maxsize=2)
+
+        logger.info('Primero')
+        # El listener quedó bloqueado en el handler: la cola está vacía
+        target.blocked.wait(5)
+        for number in range(5):
+            logger.info('Lleno %s', number)
+
+        self.assertEqual(handler.dropped, 3)
+        self.assertEqual(handler.dropped_total, 3)
+
+        gate.set()
+        wait_until(handler.queue.empty)
+        logger.info('Después')
+        handler.stop()
+
+        self.assertEqual(handler.dropped, 0)
+        self.assertEqual(handler.dropped_total, 3)
+        messages = [record.getMessage() for record in target.records]
+        self.assertEqual(messages[:4], ['Primero', 'Lleno 0', 'Lleno 1', 'Después'])
+        warning = target.records[4]
+        self.assertEqual(warning.levelno, logging.WARNING)
+        self.assertEqual(warning.name, 'majobacore.utils.logqueue')
+        self.assertEqual(warning.getMessage(), 'Cola de logging llena: 3 registros descartados')
+
+    def test_aviso_de_descarte_que_no_entra_se_vuelve_a_contar(self):
+        target = CaptureHandler()
+        handler, logger = self.make_handler(target, maxsize=1)
+        # Sin listener nadie vacía la cola
+        handler.stop()
+
+        logger.info('Ocupa la cola')
+        logger.info('Descartado')
+        self.assertEqual(handler.dropped, 1)
+
+        handler._report_dropped(4)
+
+        self.assertEqual(handler.dropped, 5)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+    def test_conserva_exc_info_e_interpola_el_mensaje(self):
+        target = CaptureHandler()
+        target.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        handler, logger = self.make_handler(target)
+
+        try:
+            raise ValueError('presupuesto inválido')
+        except ValueError:
+            logger.exception('Falló la importación de %s', 'obra.xlsx')
+        handler.stop()
+
+        [record] = target.records
+        self.assertIs(record.exc_info[0], ValueError)
+        self.assertEqual(record.msg, 'Falló la importación de obra.xlsx')
+        self.assertIsNone(record.args)
+        output = target.format(record)
+        self.assertTrue(output.startswith('ERROR Falló la importación de obra.xlsx\nTraceback'))
+        self.assertIn('ValueError: presupuesto inválido', output)
+
+    def test_respeta_el_nivel_de_los_handlers_envueltos(self):
+        target = CaptureHandler()
+        target.setLevel(logging.WARNING)
+        handler, logger = self.make_handler(target)
+
+        logger.info('Ignorado')
+        logger.warning('Entregado')
+        handler.stop()
+
+        self.assertEqual([record.getMessage() for record in target.records], ['Entregado'])
+
+    def test_stop_vacia_la_cola(self):
+        target = CaptureHandler(delay=0.002)
+        handler, logger = self.make_handler(target, maxsize=100)
+
+        for number in range(50):
+            logger.info('Record %s', number)
+        handler.stop()
+
+        self.assertEqual(len(target.records), 50)
+        self.assertIsNone(handler.listener)
+        # Idempotente: atexit y close() pueden volver a llamarlo
+        handler.stop()
+
+    def test_stop_con_la_cola_llena(self):
+        gate = threading.Event()
+        target = CaptureHandler(gate=gate)
+        handler, logger = self.make_handler(target, maxsize=3)
+
+        logger.info('Primero')
+        target.blocked.wait(5)
+        for number in range(3):
+            logger.info('Lleno %s', number)
+        self.assertTrue(handler.queue.full())
+        threading.Timer(0.05, gate.set).start()
+
+        handler.stop()
+
+        self.assertEqual(len(target.records), 4)
+        self.assertIsNone(handler.listener)
+
+    def test_reconfigurar_el_logging_vacia_la_cola(self):
+        CaptureHandler.instances.clear()
+        self.addCleanup(configure_logging, settings.LOGGING_CONFIG, settings.LOGGING)
+        configure_logging(settings.LOGGING_CONFIG, {
+            'version': 1,
+            'disable_existing_loggers': False,
+            'handlers': {
+                'capture': {
+                    '()': f'{__name__}.CaptureHandler',
+                    'delay': 0.002,
+                },
+                'queue': {
+                    '()': 'majobacore.utils.logqueue.QueueHandler',
+                    'handlers': ['cfg://handlers.capture'],
+                    'maxsize': 100,
+                },
+            },
+            'loggers': {
+                'majobacore.tests.logqueue': {
+                    'handlers': ['queue'],
+                    'level': 'INFO',
+                    'propagate': False,
+                },
+            },
+        })
+        [target] = CaptureHandler.instances
+        logger = logging.getLogger('majobacore.tests.logqueue')
+        [handler] = logger.handlers
+
+        for number in range(50):
+            logger.info('Record %s', number)
+        configure_logging(settings.LOGGING_CONFIG, settings.LOGGING)
+
+        self.assertEqual(len(target.records), 50)
+        self.assertIsNone(handler.listener)
+
+    def test_handlers_sin_configurar_son_error(self):
+        with self.assertRaisesMessage(ValueError, 'orden alfabético'):
+            QueueHandler(['cfg://handlers.console'])
@@ -0,0 +1,151 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from majobacore.utils.cache import PAGE_CACHE_HEADER, anonymous_cache_page, purge_page_cache
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'page-cache-tests',
+    }
+}
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    PAGE_CACHE_TIMEOUT=600,
+    PAGE_CACHE_BROWSER_MAX_AGE=60,
+    DEPLOY_VERSION='test',
+)
+class AnonymousCachePageTests(SimpleTestCase):
+    """Full-page cache de ``anonymous_cache_page``."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.factory = RequestFactory()
+        self.calls = 0
+        self.make_response = lambda request: HttpResponse(f'render {self.calls}')
+
+    def view(self, request):
+        self.calls += 1
+        return self.make_response(request)
+
+    def get(self, path='/', method='get', user=None):
+        request = getattr(self.factory, method)(path)
+        request.user = user or AnonymousUser()
+        return anonymous_cache_page(self.view)(request)
+
+    def assertCacheControl(self, response, *directives):
+        self.assertEqual(
+            {part.strip() for part in response['Cache-Control'].split(',')},
+            set(directives),
+        )
+
+    def test_anonimo_miss_y_despues_hit(self):
+        first = self.get()
+        second = self.get()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(first[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(second[PAGE_CACHE_HEADER], 'HIT')
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Content-Type'], first['Content-Type'])
+        for response in (first, second):
+            self.assertCacheControl(response, 'public', 'max-age=60', 's-maxage=600')
+            self.assertEqual(response['Vary'], 'Cookie, Accept-Language')
+
+    def test_autenticado_no_usa_el_cache(self):
+        self.get()
+        user = mock.Mock(is_authenticated=True)
+
+        response = self.get(user=user)
+        self.get(user=user)
+
+        self.assertEqual(self.calls, 3)
+        self.assertNotIn(PAGE_CACHE_HEADER, response)
+        self.assertCacheControl(response, 'private')
+        self.assertEqual(response['Vary'], 'Cookie')
+
+    def test_query_string_no_fragmenta_la_clave(self):
+        self.get('/?utm_source=newsletter')
+        response = self.get('/?utm_source=twitter&ref=1')
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(response[PAGE_CACHE_HEADER], 'HIT')
+
+    def test_paths_distintos_no_comparten_entrada(self):
+        self.get('/')
+        self.get('/majoba/')
+
+        self.assertEqual(self.calls, 2)
+
+    def test_no_cachea_respuestas_que_no_son_200(self):
+        self.make_response = lambda request: HttpResponse('no está', status=404)
+
+        response = self.get()
+        self.get()
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn(PAGE_CACHE_HEADER, response)
+        self.assertNotIn('public', response.get('Cache-Control', ''))
+
+    def test_no_cachea_respuestas_que_setean_cookies(self):
+        def make_response(request):
+            response = HttpResponse('con cookie')
+            response.set_cookie('csrftoken', 'abc')
+            return response
+
+        self.make_response = make_response
+
+        response = self.get()
+        self.get()
+
+        self.assertEqual(self.calls, 2)
+        self.assertNotIn(PAGE_CACHE_HEADER, response)
+
+    def test_post_no_se_cachea_ni_se_sirve_del_cache(self):
+        self.get()
+
+        response = self.get(method='post')
+        self.get(method='post')
+
+        self.assertEqual(self.calls, 3)
+        self.assertNotIn(PAGE_CACHE_HEADER, response)
+        self.assertCacheControl(response, 'private')
+
+    def test_purge_page_cache_invalida_las_paginas(self):
+        self.get()
+        self.get('/majoba/')
+
+        purge_page_cache()
+
+        self.assertEqual(self.get()[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(self.get('/majoba/')[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(self.calls, 4)
+
+    def test_comando_purge_page_cache(self):
+        self.get()
+        out = StringIO()
+
+        call_command('purge_page_cache', stdout=out)
+
+        self.assertIn('invalidado', out.getvalue())
+        self.assertEqual(self.get()[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(self.calls, 2)
+
+    def test_cada_deploy_arranca_limpio(self):
+        self.get()
+
+        with self.settings(DEPLOY_VERSION='otro'):
+            response = self.get()
+
+        self.assertEqual(response[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(self.calls, 2)
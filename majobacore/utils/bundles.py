@@ -0,0 +1,159 @@
+"""
+Bundles de CSS/JS por página y CSS crítico inline.
+
+``build_bundles`` concatena y minifica los archivos de cada bundle definido en
+``settings.STATIC_BUNDLES`` dentro de ``STATIC_BUILD_ROOT/bundles/``. Desde
+ahí collectstatic (CompressedManifestStaticFilesStorage) les agrega el hash de
+contenido y las versiones .gz/.br, así que cada página pide un solo CSS
+cacheable por un año.
+
+El bundle ``critical`` (estilos compartidos del layout: navbar, tipografía,
+contenedores) no se linkea: el template tag ``inline_css_bundle`` lo inserta
+en un ``<style>`` dentro de ``base.html`` y elimina la hoja bloqueante del
+primer render.
+
+Minificación: usa rcssmin/rjsmin si están instalados; si no, el CSS pasa por
+un minificador conservador propio y el JS solo se concatena.
+"""
+import json
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+try:
+    import rcssmin
+except ImportError:  # pragma: no cover - rcssmin es opcional
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:  # pragma: no cover - rjsmin es opcional
+    rjsmin = None
+
+
+BUNDLES_DIR = 'bundles'
+MANIFEST_NAME = 'bundles.json'
+
+CRITICAL_BUNDLE = 'critical'
+
+_CSS_COMMENT_RE = re.compile(r'/\*(?!!).*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+
+
+def get_bundles():
+    """``{nombre: {'css': [...], 'js': [...]}}`` de ``settings.STATIC_BUNDLES``."""
+    return getattr(settings, 'STATIC_BUNDLES', {})
+
+
+def bundles_enabled():
+    return getattr(settings, 'STATIC_BUNDLES_ENABLED', True)
+
+
+def get_build_root():
+    return Path(settings.STATIC_BUILD_ROOT)
+
+
+def minify_css(source):
+    """Minifica CSS (rcssmin si está disponible)."""
+    if rcssmin is not None:
+        return rcssmin.cssmin(source)
+    # Conservador: comentarios (salvo /*! ... */), espacios repetidos y
+    # espacios alrededor de { } ; , >. No toca ':' ("a :hover" no es
+    # "a:hover") ni operadores de calc().
+    css = _CSS_COMMENT_RE.sub('', source)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(source):
+    """Minifica JS con rjsmin; sin rjsmin se devuelve tal cual."""
+    if rjsmin is not None:
+        return rjsmin.jsmin(source)
+    return source
+
+
+def _read_sources(paths):
+    """Contenido de cada path estático, resuelto con los finders de staticfiles."""
+    contents = []
+    for path in paths:
+        absolute = finders.find(path)
+        if absolute is None:
+            raise FileNotFoundError(f'El archivo estático {path!r} no existe')
+        contents.append(Path(absolute).read_text(encoding='utf-8'))
+    return contents
+
+
+def build_bundles():
+    """
+    Genera todos los bundles y su manifest.
+
+    Returns:
+        dict: ``{nombre: {tipo: {path, sources, original_bytes, bytes}}}``.
+    """
+    build_root = get_build_root()
+    output_dir = build_root / BUNDLES_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+
+    for name, groups in get_bundles().items():
+        manifest[name] = {}
+        for kind, paths in groups.items():
+            sources = _read_sources(paths)
+            if kind == 'css':
+                content = minify_css('\n'.join(sources))
+            else:
+                # ';' entre archivos: un archivo sin ';' final no se mezcla con el siguiente
+                content = minify_js('\n;\n'.join(sources))
+
+            path = f'{BUNDLES_DIR}/{name}.{kind}'
+            (build_root / path).write_text(content, encoding='utf-8')
+            manifest[name][kind] = {
+                'path': path,
+                'sources': list(paths),
+                'original_bytes': sum(len(source.encode()) for source in sources),
+                'bytes': len(content.encode()),
+            }
+
+    (build_root / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    _cache.clear()
+    return manifest
+
+
+_cache = {}
+
+
+def load_manifest():
+    """Manifest de bundles (vacío si no se corrió el build); releído si cambia."""
+    path = get_build_root() / MANIFEST_NAME
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+    if _cache.get('mtime') != mtime:
+        _cache.clear()
+        _cache.update(mtime=mtime, manifest=json.loads(path.read_text()))
+    return _cache['manifest']
+
+
+def get_bundle(name, kind):
+    """Entrada del manifest para ``name``/``kind``, o None si no hay build."""
+    if not bundles_enabled():
+        return None
+    return load_manifest().get(name, {}).get(kind)
+
+
+def get_bundle_sources(name, kind):
+    """Archivos fuente de un bundle según settings (para el modo sin build)."""
+    return get_bundles().get(name, {}).get(kind, [])
+
+
+def read_bundle(entry):
+    """Contenido minificado de un bundle construido (cacheado por proceso)."""
+    key = ('content', entry['path'])
+    if key not in _cache:
+        _cache[key] = (get_build_root() / entry['path']).read_text(encoding='utf-8')
+    return _cache[key]
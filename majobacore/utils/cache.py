@@ -0,0 +1,271 @@
+"""
+Utilidades de cache para el proyecto MajobaSyS.
+
+Version stamps: cada conjunto de filas cacheable (ej: "los proyectos del
+usuario 7") tiene un número de versión en cache. Las claves de fragmentos
+o respuestas incluyen esa versión, así que invalidar es solo cambiar el
+número: las entradas viejas dejan de leerse y expiran solas.
+
+``anonymous_cache_page``: full-page cache de páginas públicas para
+visitantes anónimos, con clave por deploy, idioma y path.
+
+``get_or_compute`` / ``cached_computation``: cálculos caros cacheados sin
+estampida cuando la clave vence (ver ``get_or_compute``).
+"""
+import logging
+import math
+import random
+import time
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+logger = logging.getLogger('majobacore')
+
+VERSION_KEY_PREFIX = 'version'
+
+# Las versiones no expiran: si se pierden (eviction, reinicio de Redis) se
+# genera una nueva y el efecto es solo un cache miss.
+VERSION_TIMEOUT = None
+
+
+def version_key(namespace, *parts):
+    """Clave de cache de la versión de ``namespace`` (ej: ``version:projects:7``)."""
+    return ':'.join(str(part) for part in (VERSION_KEY_PREFIX, namespace, *parts))
+
+
+def _new_version():
+    # Basada en el reloj y no en un contador: una versión regenerada tras
+    # perderse nunca coincide con una anterior cuyos fragmentos sigan en cache.
+    return time.time_ns()
+
+
+def get_version(namespace, *parts):
+    """Retorna la versión actual de ``namespace``/``parts``, creándola si no existe."""
+    key = version_key(namespace, *parts)
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, VERSION_TIMEOUT):
+            # Otro proceso la creó primero: usar la suya
+            version = cache.get(key, version)
+    return version
+
+
+def bump_version(namespace, *parts):
+    """
+    Invalida todo lo cacheado con la versión actual de ``namespace``/``parts``.
+
+    Returns:
+        int: La versión nueva.
+    """
+    version = _new_version()
+    cache.set(version_key(namespace, *parts), version, VERSION_TIMEOUT)
+    return version
+
+
+# Namespace de versión de todas las páginas públicas cacheadas
+PAGES_VERSION = 'pages'
+
+PAGE_CACHE_HEADER = 'X-Page-Cache'
+
+
+def page_cache_key(request):
+    """Clave del full-page cache: deploy, versión de páginas, idioma y path."""
+    return ':'.join((
+        'page',
+        str(settings.DEPLOY_VERSION),
+        str(get_version(PAGES_VERSION)),
+        translation.get_language() or settings.LANGUAGE_CODE,
+        request.path,
+    ))
+
+
+def purge_page_cache():
+    """Invalida todas las páginas públicas cacheadas."""
+    bump_version(PAGES_VERSION)
+
+
+def anonymous_cache_page(view_func):
+    """
+    Cachea la respuesta completa de una vista pública para usuarios anónimos.
+
+    - Solo GET/HEAD de visitantes anónimos; los autenticados (el navbar
+      cambia según el usuario) siempre reciben un render fresco y
+      ``Cache-Control: private``.
+    - La clave ignora el query string (``?utm_source=...`` no fragmenta el
+      cache) e incluye ``DEPLOY_VERSION``, así cada deploy arranca limpio.
+    - Las respuestas anónimas salen con ``Cache-Control: public`` y
+      ``s-maxage`` para que un CDN también pueda servirlas, y
+      ``Vary: Cookie, Accept-Language``.
+    - No se cachean respuestas que no sean 200 o que setean cookies.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+            response = view_func(request, *args, **kwargs)
+            patch_cache_control(response, private=True)
+            patch_vary_headers(response, ('Cookie',))
+            return response
+
+        key = page_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+            response[PAGE_CACHE_HEADER] = 'HIT'
+        else:
+            response = view_func(request, *args, **kwargs)
+            if response.status_code != 200 or response.cookies or response.streaming:
+                return response
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+            cache.set(key, (response.content, response['Content-Type']), settings.PAGE_CACHE_TIMEOUT)
+            response[PAGE_CACHE_HEADER] = 'MISS'
+
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=settings.PAGE_CACHE_BROWSER_MAX_AGE,
+            s_maxage=settings.PAGE_CACHE_TIMEOUT,
+        )
+        patch_vary_headers(response, ('Cookie', 'Accept-Language'))
+        return response
+
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# Protección contra estampidas
+# ---------------------------------------------------------------------------
+
+COMPUTE_KEY_PREFIX = 'compute'
+LOCK_KEY_PREFIX = 'lock'
+
+# Segundos que dura el lock de recálculo si el proceso que lo tiene muere
+COMPUTE_LOCK_TIMEOUT = 30
+# Sin valor en cache y con otro worker calculando: cuánto esperar su
+# resultado antes de calcular igual, y cada cuánto mirar
+COMPUTE_WAIT_TIMEOUT = 5
+COMPUTE_WAIT_INTERVAL = 0.05
+
+
+def _acquire_lock(key):
+    """Lock de un solo worker sobre ``key`` (``SET NX`` en Redis); retorna el token o ``None``."""
+    token = uuid.uuid4().hex
+    if cache.add(f'{LOCK_KEY_PREFIX}:{key}', token, COMPUTE_LOCK_TIMEOUT):
+        return token
+    return None
+
+
+def _release_lock(key, token):
+    lock_key = f'{LOCK_KEY_PREFIX}:{key}'
+    # Si el lock venció y lo tomó otro worker, no es nuestro para borrar
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def _wait_for_value(key):
+    """Espera el valor que está calculando el dueño del lock; ``None`` si no llega."""
+    lock_key = f'{LOCK_KEY_PREFIX}:{key}'
+    deadline = time.monotonic() + COMPUTE_WAIT_TIMEOUT
+    # Sin lock tomado (ej: Redis caído con IGNORE_EXCEPTIONS) no hay a quién esperar
+    while time.monotonic() < deadline and cache.get(lock_key) is not None:
+        time.sleep(COMPUTE_WAIT_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+    return cache.get(key)
+
+
+def _compute_and_store(key, compute, timeout, stale_timeout):
+    start = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - start
+    # Se guarda el vencimiento "blando" y lo que costó calcular; la entrada
+    # vive además ``stale_timeout`` segundos para servirla vencida.
+    cache.set(key, (value, time.time() + timeout, delta), timeout + stale_timeout)
+    return value
+
+
+def get_or_compute(key, compute, timeout, stale_timeout=None, beta=1.0):
+    """
+    Retorna el valor cacheado de ``key`` o lo calcula con ``compute()``,
+    sin que todos los workers recalculen a la vez cuando vence.
+
+    - Expiración anticipada probabilística (XFetch): cada lectura puede
+      decidir recalcular antes del vencimiento, con probabilidad que crece a
+      medida que se acerca y con lo que tardó el último cálculo (``beta``
+      > 1 adelanta más). Con carga, la clave casi nunca llega a vencer.
+    - Single-flight: recalcula solo el worker que toma el lock
+      ``lock:<key>`` (``cache.add``, atómico en Redis).
+    - Stale-while-revalidate: mientras tanto los demás reciben el valor
+      vencido, que sigue en cache ``stale_timeout`` segundos más (default:
+      ``timeout``). Si el recálculo falla y hay valor vencido, se sirve ese.
+    - Sin ningún valor (clave fría), los que no tienen el lock esperan hasta
+      ``COMPUTE_WAIT_TIMEOUT`` segundos el resultado del que calcula.
+
+    El valor tiene que ser serializable por el cache (dicts, listas, números).
+    """
+    if stale_timeout is None:
+        stale_timeout = timeout
+
+    entry = cache.get(key)
+    if entry is not None:
+        value, expires_at, delta = entry
+        # 1 - random() está en (0, 1]: el log es <= 0 y nunca falla
+        if time.time() - delta * beta * math.log(1.0 - random.random()) < expires_at:
+            return value
+
+        token = _acquire_lock(key)
+        if token is None:
+            return value
+        try:
+            return _compute_and_store(key, compute, timeout, stale_timeout)
+        except Exception:
+            logger.exception("Error recalculando %s, se sirve el valor vencido", key)
+            return value
+        finally:
+            _release_lock(key, token)
+
+    token = _acquire_lock(key)
+    if token is None:
+        entry = _wait_for_value(key)
+        return entry[0] if entry is not None else compute()
+    try:
+        return _compute_and_store(key, compute, timeout, stale_timeout)
+    finally:
+        _release_lock(key, token)
+
+
+def cached_computation(timeout, stale_timeout=None, beta=1.0, key=None):
+    """
+    Decorador de ``get_or_compute``: la clave es ``compute:<key>`` (default:
+    módulo y nombre de la función) más los argumentos, que deben tener una
+    representación ``str`` estable (ids, versiones, strings cortos).
+
+    ``func.uncached`` llama a la función sin cache.
+    """
+    def decorator(func):
+        prefix = ':'.join((COMPUTE_KEY_PREFIX, key or f'{func.__module__}.{func.__qualname__}'))
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = [prefix, *map(str, args), *(f'{name}={kwargs[name]}' for name in sorted(kwargs))]
+            return get_or_compute(
+                ':'.join(parts),
+                lambda: func(*args, **kwargs),
+                timeout,
+                stale_timeout=stale_timeout,
+                beta=beta,
+            )
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
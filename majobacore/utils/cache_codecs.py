@@ -0,0 +1,347 @@
+"""
+Serializers y compresores del cache Redis (django-redis).
+
+Se eligen por settings (``CACHE_SERIALIZER``, ``CACHE_COMPRESSOR``,
+``CACHE_COMPRESS_MIN_LENGTH``); ``cache_options()`` arma las ``OPTIONS`` y
+la ``VERSION`` de ``CACHES['default']``. Medir las combinaciones con
+``python manage.py benchmark_cache_codecs``.
+
+Serializers:
+
+- ``pickle``: el default de django-redis, cualquier objeto Python.
+- ``msgpack``: binario compacto. Tuplas, fechas, ``Decimal``, ``UUID``,
+  ``bytes`` y sets vuelven con su tipo (extensiones de msgpack; las fechas
+  con zona horaria vuelven en UTC);
+  lo que msgpack no conoce (instancias de modelos, ``SafeString``) se guarda
+  con pickle dentro del mismo valor.
+- ``orjson``: JSON. Fechas, ``Decimal``, ``bytes`` y sets se marcan y
+  vuelven con su tipo; las tuplas vuelven como listas, y los ``UUID`` y las
+  claves de dict que no son string, como strings. Lo demás que JSON no
+  representa se guarda con pickle, igual que los dicts que ya tienen la
+  clave de las marcas (``__t``), para no confundirlos con una al leer.
+
+Compresores: ``zlib``, ``lz4`` o ``zstd``, aplicados solo a valores de más
+de ``CACHE_COMPRESS_MIN_LENGTH`` bytes (los chicos, como contadores y
+versiones, no ganan nada y pagan la CPU). Al leer, un valor sin comprimir se
+detecta y se usa tal cual, así que cambiar el umbral no invalida el cache.
+"""
+import base64
+import datetime
+import decimal
+import importlib.util
+import pickle
+import uuid
+import warnings
+import zlib
+
+from django_redis.compressors.zlib import ZlibCompressor as _ZlibCompressor
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.base import BaseSerializer
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack es opcional
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson está en requirements/base.txt
+    orjson = None
+
+DEFAULT_COMPRESS_MIN_LENGTH = 1024
+
+
+class ThresholdCompressorMixin:
+    """
+    Toma el umbral de compresión de ``OPTIONS['COMPRESS_MIN_LENGTH']``.
+
+    Al leer, un valor que no empieza con la cabecera del formato (``magic``)
+    se guardó sin comprimir: se descarta sin intentar descomprimirlo, que
+    con zstd cuesta más que leer el valor.
+    """
+    magic = b''
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.min_length = int(options.get('COMPRESS_MIN_LENGTH', DEFAULT_COMPRESS_MIN_LENGTH))
+
+    def decompress(self, value):
+        if not value.startswith(self.magic):
+            raise CompressorError
+        return super().decompress(value)
+
+
+class ZlibCompressor(ThresholdCompressorMixin, _ZlibCompressor):
+    # Primer byte de un stream zlib con ventana de 32 KiB (el default)
+    magic = b'\x78'
+
+
+if importlib.util.find_spec('lz4') is not None:
+    from django_redis.compressors.lz4 import Lz4Compressor as _Lz4Compressor
+
+    class Lz4Compressor(ThresholdCompressorMixin, _Lz4Compressor):
+        magic = b'\x04\x22\x4d\x18'
+
+
+if importlib.util.find_spec('pyzstd') is not None:
+    from django_redis.compressors.zstd import ZStdCompressor as _ZStdCompressor
+
+    class ZstdCompressor(ThresholdCompressorMixin, _ZStdCompressor):
+        magic = b'\x28\xb5\x2f\xfd'
+
+
+# ---------------------------------------------------------------------------
+# msgpack
+# ---------------------------------------------------------------------------
+
+# Códigos de extensión de msgpack (0-127; los negativos son de msgpack)
+EXT_TUPLE = 1
+EXT_DATETIME = 2
+EXT_DATE = 3
+EXT_TIME = 4
+EXT_DECIMAL = 5
+EXT_UUID = 6
+EXT_SET = 7
+EXT_FROZENSET = 8
+EXT_PICKLE = 127
+
+
+def _msgpack_default(obj):
+    # Con strict_types msgpack deriva acá las tuplas y las subclases de
+    # dict/list/str (ej: SafeString), que así no pierden su tipo.
+    obj_type = type(obj)
+    if obj_type is tuple:
+        return msgpack.ExtType(EXT_TUPLE, _msgpack_dumps(list(obj)))
+    if obj_type is datetime.datetime:
+        if obj.tzinfo is not None:
+            # Timestamp nativo de msgpack (12 bytes); vuelve en UTC
+            return msgpack.Timestamp.from_datetime(obj)
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode())
+    if obj_type is datetime.date:
+        return msgpack.ExtType(EXT_DATE, obj.isoformat().encode())
+    if obj_type is datetime.time:
+        return msgpack.ExtType(EXT_TIME, obj.isoformat().encode())
+    if obj_type is decimal.Decimal:
+        return msgpack.ExtType(EXT_DECIMAL, str(obj).encode())
+    if obj_type is uuid.UUID:
+        return msgpack.ExtType(EXT_UUID, obj.bytes)
+    if obj_type is set:
+        return msgpack.ExtType(EXT_SET, _msgpack_dumps(list(obj)))
+    if obj_type is frozenset:
+        return msgpack.ExtType(EXT_FROZENSET, _msgpack_dumps(list(obj)))
+    return msgpack.ExtType(EXT_PICKLE, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+
+def _msgpack_ext_hook(code, data):
+    if code == EXT_TUPLE:
+        return tuple(_msgpack_loads(data))
+    if code == EXT_DATETIME:
+        return datetime.datetime.fromisoformat(data.decode())
+    if code == EXT_DATE:
+        return datetime.date.fromisoformat(data.decode())
+    if code == EXT_TIME:
+        return datetime.time.fromisoformat(data.decode())
+    if code == EXT_DECIMAL:
+        return decimal.Decimal(data.decode())
+    if code == EXT_UUID:
+        return uuid.UUID(bytes=data)
+    if code == EXT_SET:
+        return set(_msgpack_loads(data))
+    if code == EXT_FROZENSET:
+        return frozenset(_msgpack_loads(data))
+    if code == EXT_PICKLE:
+        return pickle.loads(data)
+    return msgpack.ExtType(code, data)
+
+
+def _msgpack_dumps(value):
+    return msgpack.packb(value, default=_msgpack_default, strict_types=True, use_bin_type=True)
+
+
+def _msgpack_loads(value):
+    # strict_map_key=False: dicts con claves int (ej: {user_id: ...})
+    return msgpack.unpackb(
+        value, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False, timestamp=3,
+    )
+
+
+class MsgPackSerializer(BaseSerializer):
+    """msgpack sin pérdida de tipos (ver el docstring del módulo)."""
+
+    def dumps(self, value):
+        return _msgpack_dumps(value)
+
+    def loads(self, value):
+        return _msgpack_loads(value)
+
+
+# ---------------------------------------------------------------------------
+# orjson
+# ---------------------------------------------------------------------------
+
+# Los valores con tipos marcados llevan este prefijo (no es JSON válido): solo
+# esos se recorren al leer para reconstruir los tipos.
+ORJSON_TAGGED_PREFIX = b'~'
+ORJSON_TYPE_KEY = '__t'
+# Así aparece la clave en el JSON; dentro de un string las comillas van escapadas
+_ORJSON_TYPE_KEY_JSON = b'"__t":'
+
+
+def _orjson_tag(obj):
+    obj_type = type(obj)
+    if obj_type is datetime.datetime:
+        return {ORJSON_TYPE_KEY: 'datetime', 'v': obj.isoformat()}
+    if obj_type is datetime.date:
+        return {ORJSON_TYPE_KEY: 'date', 'v': obj.isoformat()}
+    if obj_type is datetime.time:
+        return {ORJSON_TYPE_KEY: 'time', 'v': obj.isoformat()}
+    if obj_type is decimal.Decimal:
+        return {ORJSON_TYPE_KEY: 'decimal', 'v': str(obj)}
+    if obj_type is bytes:
+        return {ORJSON_TYPE_KEY: 'bytes', 'v': base64.b64encode(obj).decode()}
+    if obj_type is set:
+        return {ORJSON_TYPE_KEY: 'set', 'v': list(obj)}
+    if obj_type is frozenset:
+        return {ORJSON_TYPE_KEY: 'frozenset', 'v': list(obj)}
+    return _orjson_pickle_tag(obj)
+
+
+def _orjson_pickle_tag(obj):
+    return {
+        ORJSON_TYPE_KEY: 'pickle',
+        'v': base64.b64encode(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)).decode(),
+    }
+
+
+def _orjson_escape(value):
+    """Copia de ``value`` con los dicts que usan ``ORJSON_TYPE_KEY`` guardados con pickle."""
+    value_type = type(value)
+    if value_type is dict:
+        if ORJSON_TYPE_KEY in value:
+            return _orjson_pickle_tag(value)
+        return {key: _orjson_escape(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_orjson_escape(item) for item in value]
+    return value
+
+
+_ORJSON_UNTAG = {
+    'datetime': datetime.datetime.fromisoformat,
+    'date': datetime.date.fromisoformat,
+    'time': datetime.time.fromisoformat,
+    'decimal': decimal.Decimal,
+    'bytes': base64.b64decode,
+    'set': set,
+    'frozenset': frozenset,
+    'pickle': lambda v: pickle.loads(base64.b64decode(v)),
+}
+
+
+def _orjson_untag(value):
+    if isinstance(value, dict):
+        tag = value.get(ORJSON_TYPE_KEY)
+        if isinstance(tag, str) and tag in _ORJSON_UNTAG and len(value) == 2 and 'v' in value:
+            return _ORJSON_UNTAG[tag](_orjson_untag(value['v']))
+        return {key: _orjson_untag(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_orjson_untag(item) for item in value]
+    return value
+
+
+class ORJSONSerializer(BaseSerializer):
+    """JSON con orjson; tuplas y UUID no conservan su tipo (ver el docstring del módulo)."""
+
+    OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_NON_STR_KEYS
+        if orjson else 0
+    )
+
+    def dumps(self, value):
+        tags = 0
+
+        def default(obj):
+            nonlocal tags
+            tags += 1
+            return _orjson_tag(obj)
+
+        data = orjson.dumps(value, default=default, option=self.OPTIONS)
+        if data.count(_ORJSON_TYPE_KEY_JSON) > tags:
+            # Algún dict del valor ya tenía la clave de las marcas: se escapa
+            data = orjson.dumps(_orjson_escape(value), default=default, option=self.OPTIONS)
+            return ORJSON_TAGGED_PREFIX + data
+        return ORJSON_TAGGED_PREFIX + data if tags else data
+
+    def loads(self, value):
+        if value[:1] == ORJSON_TAGGED_PREFIX:
+            return _orjson_untag(orjson.loads(value[1:]))
+        return orjson.loads(value)
+
+
+# ---------------------------------------------------------------------------
+# Configuración
+# ---------------------------------------------------------------------------
+
+SERIALIZERS = {
+    'pickle': ('django_redis.serializers.pickle.PickleSerializer', 'pickle'),
+    'msgpack': ('majobacore.utils.cache_codecs.MsgPackSerializer', 'msgpack'),
+    'orjson': ('majobacore.utils.cache_codecs.ORJSONSerializer', 'orjson'),
+}
+
+COMPRESSORS = {
+    'none': ('django_redis.compressors.identity.IdentityCompressor', None),
+    'zlib': ('majobacore.utils.cache_codecs.ZlibCompressor', None),
+    'lz4': ('majobacore.utils.cache_codecs.Lz4Compressor', 'lz4'),
+    'zstd': ('majobacore.utils.cache_codecs.ZstdCompressor', 'pyzstd'),
+}
+
+
+def available(codecs, name):
+    """Indica si el codec ``name`` de ``SERIALIZERS``/``COMPRESSORS`` tiene su dependencia instalada."""
+    module = codecs[name][1]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def _resolve(codecs, name, fallback, kind):
+    if name not in codecs:
+        raise ValueError(f'{kind} de cache desconocido: {name!r} (opciones: {", ".join(codecs)})')
+    if not available(codecs, name):
+        warnings.warn(
+            f'{kind} de cache {name!r} no instalado ({codecs[name][1]}), se usa {fallback!r}',
+            RuntimeWarning,
+        )
+        return fallback
+    return name
+
+
+def cache_version(serializer, compressor):
+    """
+    ``VERSION`` de las claves del cache para una combinación de codecs.
+
+    Un valor escrito con otro serializer/compresor no se puede leer: al
+    cambiar la combinación cambian todas las claves y el cache arranca
+    vacío. pickle + zlib (la configuración histórica) conserva la versión 1.
+    """
+    if (serializer, compressor) == ('pickle', 'zlib'):
+        return 1
+    return zlib.crc32(f'{serializer}:{compressor}'.encode()) & 0x7fffffff
+
+
+def cache_options(serializer='pickle', compressor='zlib', min_length=DEFAULT_COMPRESS_MIN_LENGTH):
+    """
+    ``OPTIONS`` (serializer, compresor y umbral) y ``VERSION`` para ``CACHES``.
+
+    Un codec cuya dependencia no está instalada se reemplaza por pickle/zlib
+    con un warning, en vez de romper el arranque.
+
+    Returns:
+        tuple: ``(options, version)``.
+    """
+    serializer = _resolve(SERIALIZERS, serializer, 'pickle', 'Serializer')
+    compressor = _resolve(COMPRESSORS, compressor, 'zlib', 'Compresor')
+    options = {
+        'SERIALIZER': SERIALIZERS[serializer][0],
+        'COMPRESSOR': COMPRESSORS[compressor][0],
+        'COMPRESS_MIN_LENGTH': min_length,
+    }
+    return options, cache_version(serializer, compressor)
+
@@ -0,0 +1,239 @@
+"""
+Compresión negociada (brotli/gzip) de respuestas dinámicas.
+
+WhiteNoise ya sirve los estáticos precomprimidos; este middleware cubre el
+resto: JSON de la API y HTML de las vistas. Elige el encoding según
+``Accept-Encoding`` (respetando ``q=0``), solo comprime tipos de texto por
+encima de ``RESPONSE_COMPRESSION_MIN_LENGTH`` y, en respuestas streaming,
+hace flush por cada chunk para que el cliente siga recibiendo datos a medida
+que se generan.
+"""
+import secrets
+import string
+from gzip import GzipFile
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.text import StreamingBuffer, compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional
+    brotli = None
+
+
+DEFAULT_MIN_LENGTH = 1024
+DEFAULT_BROTLI_QUALITY = 4
+
+# Tipos que vale la pena comprimir; imágenes, PDFs y zips ya vienen comprimidos
+COMPRESSIBLE_CONTENT_TYPES = (
+    'text/',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'application/problem+json',
+    'image/svg+xml',
+)
+
+# Server-Sent Events: cada evento debe llegar tal cual, sin buffers intermedios
+NEVER_COMPRESS_CONTENT_TYPES = ('text/event-stream',)
+
+_FILENAME_ALPHABET = (string.ascii_letters + string.digits).encode()
+
+
+def parse_accept_encoding(header):
+    """
+    Convierte un header ``Accept-Encoding`` en ``{encoding: q}``.
+
+    Ejemplo: ``"br;q=1.0, gzip;q=0.8, *;q=0"`` ->
+    ``{'br': 1.0, 'gzip': 0.8, '*': 0.0}``.
+    """
+    accepted = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def select_encoding(header, brotli_available=None):
+    """
+    Elige ``'br'``, ``'gzip'`` o None según ``Accept-Encoding``.
+
+    Ante igual preferencia gana brotli (comprime más a igual costo de CPU
+    con la calidad que usamos para contenido dinámico).
+    """
+    if brotli_available is None:
+        brotli_available = brotli is not None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+
+    candidates = []
+    if brotli_available:
+        candidates.append(('br', accepted.get('br', wildcard)))
+    candidates.append(('gzip', accepted.get('gzip', wildcard)))
+
+    encoding, quality = max(candidates, key=lambda item: item[1])
+    return encoding if quality > 0 else None
+
+
+def _random_filename(max_random_bytes):
+    """Nombre aleatorio para el header gzip (mitigación de BREACH, como Django)."""
+    length = secrets.randbelow(max_random_bytes) + 1
+    return bytes(secrets.choice(_FILENAME_ALPHABET) for _ in range(length))
+
+
+def gzip_stream(sequence, max_random_bytes=None):
+    """Comprime un iterable de bytes en un único stream gzip, con flush por chunk."""
+    buf = StreamingBuffer()
+    filename = _random_filename(max_random_bytes) if max_random_bytes else None
+    with GzipFile(filename=filename, mode='wb', compresslevel=6, fileobj=buf, mtime=0) as zfile:
+        yield buf.read()
+        for chunk in sequence:
+            zfile.write(chunk)
+            zfile.flush()
+            data = buf.read()
+            if data:
+                yield data
+    yield buf.read()
+
+
+async def agzip_stream(sequence, max_random_bytes=None):
+    """Versión async de ``gzip_stream``."""
+    buf = StreamingBuffer()
+    filename = _random_filename(max_random_bytes) if max_random_bytes else None
+    with GzipFile(filename=filename, mode='wb', compresslevel=6, fileobj=buf, mtime=0) as zfile:
+        yield buf.read()
+        async for chunk in sequence:
+            zfile.write(chunk)
+            zfile.flush()
+            data = buf.read()
+            if data:
+                yield data
+    yield buf.read()
+
+
+def compress_brotli(data, quality=DEFAULT_BROTLI_QUALITY):
+    """Comprime ``data`` con brotli en modo texto."""
+    return brotli.compress(data, quality=quality, mode=brotli.MODE_TEXT)
+
+
+def brotli_stream(sequence, quality=DEFAULT_BROTLI_QUALITY):
+    """Comprime un iterable de bytes con brotli, con flush por chunk."""
+    compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+    for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def abrotli_stream(sequence, quality=DEFAULT_BROTLI_QUALITY):
+    """Versión async de ``brotli_stream``."""
+    compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+    async for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Reemplazo de ``GZipMiddleware`` con brotli, umbral configurable y
+    filtro por Content-Type.
+
+    Configuración (settings):
+        RESPONSE_COMPRESSION_MIN_LENGTH: Bytes mínimos para comprimir una
+            respuesta no streaming (default: 1024).
+        RESPONSE_COMPRESSION_BROTLI_QUALITY: Calidad brotli 0-11 (default: 4;
+            las calidades altas son para estáticos precomprimidos, no para
+            contenido generado en cada request).
+
+    Debe ir al principio de MIDDLEWARE (después de SecurityMiddleware) para
+    comprimir la respuesta final, ya con ETag y demás headers.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_length = getattr(settings, 'RESPONSE_COMPRESSION_MIN_LENGTH', DEFAULT_MIN_LENGTH)
+        self.brotli_quality = getattr(
+            settings, 'RESPONSE_COMPRESSION_BROTLI_QUALITY', DEFAULT_BROTLI_QUALITY,
+        )
+
+    def should_compress(self, response):
+        """Indica si el tipo y el tamaño de la respuesta justifican comprimirla."""
+        if response.has_header('Content-Encoding'):
+            return False
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return False
+        # Content-Range se refiere a bytes del cuerpo sin comprimir
+        if response.status_code == 206 or response.has_header('Content-Range'):
+            return False
+
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type.startswith(NEVER_COMPRESS_CONTENT_TYPES):
+            return False
+        if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return False
+
+        return response.streaming or len(response.content) >= self.min_length
+
+    def process_response(self, request, response):
+        if not self.should_compress(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = select_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            self._compress_streaming(response, encoding)
+            # El tamaño comprimido recién se conoce al terminar el stream
+            del response.headers['Content-Length']
+        else:
+            if encoding == 'br':
+                compressed_content = compress_brotli(response.content, self.brotli_quality)
+            else:
+                compressed_content = compress_string(
+                    response.content,
+                    max_random_bytes=self.max_random_bytes,
+                )
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        # Un ETag fuerte deja de ser válido sobre el cuerpo comprimido (RFC 9110 8.8.1)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+
+        return response
+
+    def _compress_streaming(self, response, encoding):
+        """Envuelve ``streaming_content`` con el compresor elegido."""
+        content = response.streaming_content
+        if encoding == 'br':
+            if response.is_async:
+                response.streaming_content = abrotli_stream(content, self.brotli_quality)
+            else:
+                response.streaming_content = brotli_stream(content, self.brotli_quality)
+        elif response.is_async:
+            response.streaming_content = agzip_stream(content, self.max_random_bytes)
+        else:
+            response.streaming_content = gzip_stream(content, self.max_random_bytes)
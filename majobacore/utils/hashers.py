@@ -0,0 +1,152 @@
+"""
+Hashers de contraseñas con Argon2 ajustado y un pool acotado de hashing.
+
+Con PBKDF2 (el default de Django, 1M de iteraciones) cada ``authenticate()``
+ocupa un core entero durante cientos de milisegundos: una ráfaga de logins
+deja a los workers de gunicorn sin tiempo para el resto de los endpoints.
+
+- ``Argon2PasswordHasher`` usa parámetros propios (``ARGON2_TIME_COST``,
+  ``ARGON2_MEMORY_COST``, ``ARGON2_PARALLELISM``) en vez de los de Django
+  (100 MiB y 8 lanes por hash). Es el primero de ``PASSWORD_HASHERS``: los
+  hashes PBKDF2 existentes se siguen verificando y Django los re-hashea a
+  Argon2 en el primer login correcto (``check_password`` con ``setter``). Lo
+  mismo pasa con un hash Argon2 con parámetros distintos a los configurados
+  (``must_update``), así que ajustar los parámetros no requiere migración.
+- Todos los hashers de este módulo corren ``encode``/``verify`` en un
+  ``ThreadPoolExecutor`` de ``PASSWORD_HASHING_THREADS`` hilos por proceso.
+  argon2-cffi y ``hashlib.pbkdf2_hmac`` liberan el GIL, así que con workers
+  ``gthread`` los demás hilos siguen atendiendo requests mientras se hashea,
+  y nunca hay más de ``PASSWORD_HASHING_THREADS`` hashes simultáneos por
+  proceso. Si no se consigue lugar en ``PASSWORD_HASHING_TIMEOUT`` segundos
+  se lanza ``HashingBusy``: las vistas de login y el alta de usuarios
+  responden "reintentar", la API 429 (``api.exceptions.exception_handler``)
+  y cualquier otra vista 503 (``HashingBusyMiddleware``), todas con
+  ``Retry-After``.
+
+Medición: ``python manage.py benchmark_password_hashing``.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.http import HttpResponse
+
+logger = logging.getLogger('majobacore.security')
+
+THREAD_NAME_PREFIX = 'password-hashing'
+
+# Segundos de ``Retry-After`` cuando el pool de hashing está lleno
+HASHING_BUSY_RETRY_AFTER = 1
+
+_executor = None
+_slots = None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class HashingBusy(Exception):
+    """No hubo lugar en el pool de hashing dentro de ``PASSWORD_HASHING_TIMEOUT``."""
+
+
+def _get_pool():
+    global _executor, _slots
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                threads = settings.PASSWORD_HASHING_THREADS
+                _slots = threading.BoundedSemaphore(threads)
+                _executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix=THREAD_NAME_PREFIX)
+    return _executor, _slots
+
+
+def _reset_pool():
+    # Los hilos del pool no sobreviven al fork (gunicorn --preload)
+    global _executor, _slots, _lock
+    _executor = _slots = None
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _run_in_pool(func, args, kwargs):
+    _local.in_pool = True
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _local.in_pool = False
+
+
+def run_hashing(func, *args, **kwargs):
+    """
+    Ejecuta ``func`` en el pool de hashing y espera el resultado.
+
+    Con ``PASSWORD_HASHING_THREADS = 0``, o si ya se está en un hilo del pool
+    (ej: ``PBKDF2PasswordHasher.verify`` llama a ``encode``), corre directo.
+
+    Raises:
+        HashingBusy: Si el pool sigue lleno pasado ``PASSWORD_HASHING_TIMEOUT``.
+    """
+    if settings.PASSWORD_HASHING_THREADS <= 0 or getattr(_local, 'in_pool', False):
+        return func(*args, **kwargs)
+
+    executor, slots = _get_pool()
+    if not slots.acquire(timeout=settings.PASSWORD_HASHING_TIMEOUT):
+        logger.warning("Pool de hashing lleno, se rechaza la operación")
+        raise HashingBusy('Demasiados hashes de contraseña en curso')
+    try:
+        return executor.submit(_run_in_pool, func, args, kwargs).result()
+    finally:
+        slots.release()
+
+
+class HashingBusyMiddleware:
+    """
+    503 con ``Retry-After`` para las vistas que chocan con el pool lleno sin
+    manejarlo (admin, cambio de contraseña web, ...) en lugar de un 500.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, HashingBusy):
+            return None
+        response = HttpResponse(
+            'El servidor está ocupado. Intenta nuevamente en unos segundos.',
+            status=503,
+            content_type='text/plain; charset=utf-8',
+        )
+        response['Retry-After'] = str(HASHING_BUSY_RETRY_AFTER)
+        return response
+
+
+class PooledHasherMixin:
+    """Corre ``encode`` y ``verify`` del hasher en el pool de hashing."""
+
+    def encode(self, password, salt, *args, **kwargs):
+        return run_hashing(super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return run_hashing(super().verify, password, encoded)
+
+
+class Argon2PasswordHasher(PooledHasherMixin, hashers.Argon2PasswordHasher):
+    """Argon2id con los parámetros de ``ARGON2_*`` (mismo ``algorithm`` que el de Django)."""
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
+
+
+class PBKDF2PasswordHasher(PooledHasherMixin, hashers.PBKDF2PasswordHasher):
+    """PBKDF2 de Django en el pool (verifica los hashes previos a Argon2)."""
+
+
+class PBKDF2SHA1PasswordHasher(PooledHasherMixin, hashers.PBKDF2SHA1PasswordHasher):
+    """PBKDF2-SHA1 de Django en el pool."""
@@ -5,9 +5,18 @@ import ipaddress
 import logging
 
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson está en requirements/base.txt
+    orjson = None
 
 logger = logging.getLogger('majobacore')
 
+_django_encoder = DjangoJSONEncoder()
+
 
 def get_client_ip(request):
     """
@@ -56,3 +65,26 @@ def _validate_ip(value):
     except ValueError:
         logger.warning("IP inválida o malformada recibida en request: %r", value)
         return 'desconocida'
+
+
+def fast_json_response(data, status=200):
+    """
+    Equivalente a ``JsonResponse(data)`` serializando con orjson.
+
+    Los tipos que orjson no conoce (Decimal, lazy strings, ...) se delegan
+    a ``DjangoJSONEncoder``. Sin orjson instalado devuelve un JsonResponse.
+
+    Args:
+        data (dict): Cuerpo de la respuesta.
+        status (int): Código HTTP.
+
+    Returns:
+        HttpResponse: Respuesta ``application/json``.
+    """
+    if orjson is None:
+        return JsonResponse(data, status=status)
+    return HttpResponse(
+        orjson.dumps(data, default=_django_encoder.default),
+        status=status,
+        content_type='application/json',
+    )
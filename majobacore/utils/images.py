@@ -0,0 +1,195 @@
+"""
+Variantes responsive (AVIF/WebP a varios anchos) de las imágenes estáticas.
+
+``build_variants`` genera, para cada imagen raster de ``static/``, copias
+redimensionadas en los formatos configurados dentro de
+``RESPONSIVE_IMAGES_ROOT`` (que se suma a STATICFILES_DIRS, así collectstatic
+las hashea y sirve como cualquier otro estático) y un manifest JSON con las
+dimensiones de cada original y sus variantes. El template tag
+``responsive_image`` lee ese manifest para armar ``<picture>``/``srcset``.
+
+Configuración (settings.RESPONSIVE_IMAGES):
+    WIDTHS: Anchos a generar; los mayores al original se omiten y siempre se
+        incluye una variante al ancho original.
+    FORMATS: Formatos de salida, en orden de preferencia del navegador.
+    SOURCE_DIRS: Carpetas (relativas a cada directorio de STATICFILES_DIRS)
+        a procesar.
+"""
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - Pillow está en requirements/base.txt
+    Image = features = None
+
+
+MANIFEST_NAME = 'responsive-images.json'
+
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.avif')
+
+DEFAULTS = {
+    'WIDTHS': [480, 960, 1440, 1920],
+    'FORMATS': ['avif', 'webp'],
+    'SOURCE_DIRS': ['images'],
+}
+
+# Parámetros de encoder por formato: calidad visual equivalente a un JPEG ~85
+SAVE_OPTIONS = {
+    'avif': {'quality': 55, 'speed': 6},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+
+def get_config():
+    """Configuración efectiva (defaults + settings.RESPONSIVE_IMAGES)."""
+    return {**DEFAULTS, **getattr(settings, 'RESPONSIVE_IMAGES', {})}
+
+
+def get_output_root():
+    return Path(settings.RESPONSIVE_IMAGES_ROOT)
+
+
+def variant_name(path, width, fmt):
+    """``images/slider 2.jpg`` -> ``images/slider 2.960w.webp``."""
+    stem, _ = os.path.splitext(path)
+    return f'{stem}.{width}w.{fmt}'
+
+
+def available_formats(formats):
+    """Filtra los formatos que el Pillow instalado puede escribir."""
+    if Image is None:
+        return []
+    return [fmt for fmt in formats if features.check(fmt)]
+
+
+def iter_source_images(source_dirs):
+    """
+    Recorre las imágenes raster de STATICFILES_DIRS bajo ``source_dirs``.
+
+    Yields:
+        tuple[str, Path]: (path estático relativo con ``/``, path absoluto).
+    """
+    output_root = get_output_root().resolve()
+    for static_dir in settings.STATICFILES_DIRS:
+        static_dir = Path(static_dir[1] if isinstance(static_dir, (list, tuple)) else static_dir)
+        if static_dir.resolve() == output_root:
+            continue
+        for source_dir in source_dirs:
+            base = static_dir / source_dir
+            if not base.is_dir():
+                continue
+            for path in sorted(base.rglob('*')):
+                if path.suffix.lower() in SOURCE_EXTENSIONS and path.is_file():
+                    yield path.relative_to(static_dir).as_posix(), path
+
+
+def _target_widths(original_width, widths):
+    return sorted({width for width in widths if width < original_width} | {original_width})
+
+
+def _prepare(image, fmt):
+    """Normaliza el modo de color para el encoder (conserva la transparencia)."""
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        return image.convert('RGBA')
+    return image.convert('RGB')
+
+
+def build_variants(force=False, stdout=None):
+    """
+    Genera las variantes que falten (o estén desactualizadas) y el manifest.
+
+    Args:
+        force (bool): Regenerar aunque la variante sea más nueva que el original.
+        stdout: Stream opcional donde informar el progreso.
+
+    Returns:
+        dict: Manifest ``{path: {width, height, variants: {fmt: [[w, path, bytes], ...]}}}``.
+    """
+    config = get_config()
+    formats = available_formats(config['FORMATS'])
+    output_root = get_output_root()
+    manifest = {}
+
+    for static_path, source in iter_source_images(config['SOURCE_DIRS']):
+        with Image.open(source) as image:
+            image.load()
+            width, height = image.size
+            entry = {'width': width, 'height': height, 'bytes': source.stat().st_size, 'variants': {}}
+
+            for fmt in formats:
+                entry['variants'][fmt] = []
+                for target_width in _target_widths(width, config['WIDTHS']):
+                    name = variant_name(static_path, target_width, fmt)
+                    target = output_root / name
+                    stale = force or not target.exists() or target.stat().st_mtime < source.stat().st_mtime
+                    if stale:
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        target_height = round(height * target_width / width)
+                        resized = _prepare(image, fmt)
+                        if target_width != width:
+                            resized = resized.resize((target_width, target_height), Image.LANCZOS)
+                        resized.save(target, format=fmt.upper(), **SAVE_OPTIONS.get(fmt, {}))
+                        if stdout is not None:
+                            stdout.write(f'  {name}')
+                    entry['variants'][fmt].append([target_width, name, target.stat().st_size])
+
+        manifest[static_path] = entry
+
+    output_root.mkdir(parents=True, exist_ok=True)
+    (output_root / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    _manifest_cache.clear()
+    return manifest
+
+
+_manifest_cache = {}
+
+
+def load_manifest():
+    """
+    Manifest de variantes (vacío si todavía no se corrió el build).
+
+    Se lee una vez por proceso; si el archivo cambia (``build_responsive_images``
+    en desarrollo) se vuelve a leer.
+    """
+    path = get_output_root() / MANIFEST_NAME
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+    if _manifest_cache.get('mtime') != mtime:
+        _manifest_cache.update(mtime=mtime, data=json.loads(path.read_text()))
+    return _manifest_cache['data']
+
+
+_dimensions_cache = {}
+
+
+def get_image_info(path):
+    """
+    Dimensiones y variantes de ``path`` (path estático).
+
+    Sin manifest, lee las dimensiones del original con Pillow (una vez por
+    proceso) para poder emitir igual ``width``/``height``.
+
+    Returns:
+        dict | None: ``{width, height, variants}`` o None si no se encuentra.
+    """
+    info = load_manifest().get(path)
+    if info is not None:
+        return info
+    if path not in _dimensions_cache:
+        source = finders.find(path)
+        info = None
+        if source and Image is not None:
+            try:
+                with Image.open(source) as image:
+                    info = {'width': image.width, 'height': image.height, 'variants': {}}
+            except OSError:
+                info = None
+        _dimensions_cache[path] = info
+    return _dimensions_cache[path]
@@ -0,0 +1,133 @@
+"""
+Logging asíncrono: los workers encolan los records y un hilo los escribe.
+
+``QueueHandler`` se configura en ``LOGGING`` como cualquier handler y envuelve
+a los handlers reales (ej: ``console``, el ``StreamHandler`` JSON de
+producción)::
+
+    'queue': {
+        '()': 'majobacore.utils.logqueue.QueueHandler',
+        'handlers': ['cfg://handlers.console'],
+        'maxsize': 10000,
+    }
+
+En el thread del request solo se arma el mensaje (interpolación ``%``) y se
+hace un ``put_nowait`` en una cola acotada. El formateo (JSON) y la
+escritura a stdout los hace un ``QueueListener`` en su propio hilo, así un
+stdout lento (pipe lleno, colector de logs atascado) nunca bloquea un worker
+de gunicorn. Si la cola se llena, el record se descarta y se cuenta; el
+listener informa la cantidad descartada con el próximo record que entra.
+
+Los handlers envueltos se referencian con ``cfg://handlers.<nombre>`` y
+tienen que configurarse antes que este: ``dictConfig`` crea los handlers en
+orden alfabético, por eso se llama ``queue``.
+"""
+import atexit
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler as BaseQueueHandler
+from logging.handlers import QueueListener
+
+DEFAULT_MAXSIZE = 10_000
+
+
+class _QueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # El base usa put_nowait: con la cola llena ``stop()`` fallaría con
+        # queue.Full y el hilo seguiría vivo. El listener la está vaciando,
+        # así que esperar lugar es seguro.
+        self.queue.put(self._sentinel)
+
+
+class QueueHandler(BaseQueueHandler):
+    """
+    ``QueueHandler`` con cola acotada, descarte por desborde y su propio
+    ``QueueListener`` (arrancado al configurarse el logging).
+    """
+
+    def __init__(self, handlers, maxsize=DEFAULT_MAXSIZE):
+        # dictConfig pasa un ConvertingList: resuelve ``cfg://`` al indexar,
+        # no al iterar
+        handlers = [handlers[i] for i in range(len(handlers))]
+        for handler in handlers:
+            if not isinstance(handler, logging.Handler):
+                raise ValueError(
+                    'QueueHandler: los handlers envueltos deben configurarse antes '
+                    '(dictConfig los crea en orden alfabético)'
+                )
+        super().__init__(queue.Queue(maxsize))
+        self.maxsize = maxsize
+        self.handlers = list(handlers)
+        self.dropped = 0
+        self.dropped_total = 0
+        self._dropped_lock = threading.Lock()
+        self._start_listener()
+        atexit.register(self.stop)
+        # gunicorn --preload: el hilo del listener no sobrevive al fork
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def _start_listener(self):
+        self.listener = _QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def _after_fork(self):
+        if self.listener is None:
+            return
+        self.queue = queue.Queue(self.maxsize)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._start_listener()
+
+    def stop(self):
+        """Vacía la cola y detiene el listener (al salir o al reconfigurar el logging)."""
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+
+    def close(self):
+        self.stop()
+        super().close()
+
+    def prepare(self, record):
+        """
+        Solo interpola el mensaje. A diferencia del ``prepare`` base no
+        formatea el record (el formateo lo hace el handler en el listener) y
+        conserva ``exc_info``: la cola es en memoria, no hace falta picklear.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                self.dropped_total += 1
+            return
+
+        if self.dropped:
+            with self._dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                self._report_dropped(dropped)
+
+    def _report_dropped(self, dropped):
+        warning = logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': 'Cola de logging llena: %s registros descartados',
+            'args': (dropped,),
+        })
+        try:
+            self.queue.put_nowait(self.prepare(warning))
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += dropped
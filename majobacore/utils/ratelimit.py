@@ -0,0 +1,148 @@
+"""
+Limitador de tasa GCRA (Generic Cell Rate Algorithm) sobre Redis.
+
+Un límite ``N/periodo`` equivale a una ventana deslizante de N requests por
+periodo, pero en vez de guardar el historial de timestamps (lo que hace
+``SimpleRateThrottle`` de DRF: get de la lista, recorte, set, con carreras
+entre workers) se guarda un único número por clave: el TAT (*theoretical
+arrival time*), el instante en que el cliente vuelve a tener el cupo
+completo. Cada request lo avanza ``periodo / N``; si el TAT queda más de un
+periodo en el futuro, el request se rechaza.
+
+La lectura, la decisión y la escritura corren en un script Lua (``EVALSHA``):
+un round trip por request y atómico entre todos los workers. El tiempo sale
+de ``TIME`` del servidor Redis, así los relojes de los distintos
+contenedores no influyen.
+
+Sin django-redis (desarrollo, tests) se usa el mismo algoritmo en Python
+sobre el cache de Django (no atómico, suficiente en un solo proceso). Si
+Redis falla, el request se deja pasar: el limitador no debe tirar el sitio.
+
+Usado por ``RateLimitMiddleware`` (majobacore/utils/security.py) y por los
+throttles de la API (api/throttling.py).
+"""
+import logging
+import math
+import time
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+try:
+    from django_redis import get_redis_connection
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - django-redis está en requirements/base.txt
+    get_redis_connection = None
+    RedisError = OSError
+
+logger = logging.getLogger('majobacore.security')
+
+KEY_PREFIX = 'rl'
+
+PERIODS = {
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+}
+
+# KEYS[1]: clave; ARGV[1]: ms entre requests (periodo / límite); ARGV[2]: periodo en ms.
+# Retorna {permitido, restantes, ms hasta poder reintentar}.
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now then
+    return {0, 0, allow_at - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, math.floor((now + period - new_tat) / interval), 0}
+"""
+
+_scripts = {}
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Resultado de contar un request contra un límite."""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # segundos hasta que se libere un lugar (0 si se permitió)
+
+
+def parse_rate(rate):
+    """
+    ``'5/min'`` -> ``(5, 60)``. Acepta los mismos formatos que DRF
+    (``s``/``sec``/``m``/``min``/``minute``/``h``/``hour``/``d``/``day``).
+
+    Returns:
+        tuple[int, int]: ``(requests, periodo en segundos)``.
+    """
+    num, period = rate.split('/')
+    return int(num), PERIODS[period.strip()[0]]
+
+
+def _get_redis_client():
+    if get_redis_connection is None:
+        return None
+    try:
+        return get_redis_connection('default')
+    except NotImplementedError:
+        return None
+
+
+def _redis_hit(client, key, interval_ms, period_ms):
+    # Un Script por cliente: usa EVALSHA y solo manda el código con NOSCRIPT
+    script = _scripts.get(id(client))
+    if script is None:
+        script = _scripts[id(client)] = client.register_script(GCRA_SCRIPT)
+    allowed, remaining, retry_ms = script(keys=[key], args=[interval_ms, period_ms])
+    return bool(allowed), int(remaining), int(retry_ms) / 1000
+
+
+def _cache_hit(key, interval_ms, period_ms):
+    now = int(time.time() * 1000)
+    tat = max(cache.get(key) or now, now)
+    new_tat = tat + interval_ms
+    allow_at = new_tat - period_ms
+    if allow_at > now:
+        return False, 0, (allow_at - now) / 1000
+    cache.set(key, new_tat, math.ceil((new_tat - now) / 1000))
+    return True, (now + period_ms - new_tat) // interval_ms, 0
+
+
+def hit(key, rate):
+    """
+    Cuenta un request de ``key`` contra ``rate`` (ej: ``'30/min'``).
+
+    Args:
+        key (str): Identidad limitada (ej: ``'login:ip:1.2.3.4'``).
+        rate (str): Límite ``N/periodo``.
+
+    Returns:
+        RateLimitResult
+    """
+    limit, period = parse_rate(rate)
+    period_ms = period * 1000
+    interval_ms = math.ceil(period_ms / limit)
+    cache_key = cache.make_key(f'{KEY_PREFIX}:{key}')
+
+    client = _get_redis_client()
+    if client is None:
+        allowed, remaining, retry_after = _cache_hit(cache_key, interval_ms, period_ms)
+    else:
+        try:
+            allowed, remaining, retry_after = _redis_hit(client, cache_key, interval_ms, period_ms)
+        except RedisError as e:
+            logger.warning("Rate limit sin Redis, request permitido (%s): %s", key, e)
+            return RateLimitResult(True, limit, limit, 0)
+
+    return RateLimitResult(allowed, limit, remaining, retry_after)
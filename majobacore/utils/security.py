@@ -2,11 +2,16 @@
 Security utilities for MajobaCore project.
 """
 
+import math
 import secrets
 import string
 import logging
 from django.core.management.utils import get_random_secret_key
 from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+
+from majobacore.utils.http import get_client_ip
+from majobacore.utils.ratelimit import hit
 
 logger = logging.getLogger('majobacore.security')
 
@@ -180,32 +185,117 @@ class SecurityHeadersMiddleware:
         return response
 
 
+# Rate limiting configuration
+RATE_LIMIT_SETTINGS = {
+    'DEFAULT_RATE_LIMIT': '100/hour',
+    'LOGIN_RATE_LIMIT': '5/min',
+    'REGISTRATION_RATE_LIMIT': '3/min',
+    'PASSWORD_RESET_RATE_LIMIT': '3/hour',
+    'API_RATE_LIMIT': '1000/hour',
+    'SEARCH_RATE_LIMIT': '30/min',
+}
+
+# Grupos de rutas web con límite propio: (grupo, clave de RATE_LIMIT_SETTINGS,
+# nombres de URL, métodos contados o None para todos).
+RATE_LIMIT_ROUTE_GROUPS = (
+    ('login', 'LOGIN_RATE_LIMIT', {'login'}, {'POST'}),
+    ('registration', 'REGISTRATION_RATE_LIMIT', {'user_create'}, {'POST'}),
+    ('search', 'SEARCH_RATE_LIMIT', {'search'}, None),
+)
+
+# Grupos cuyo límite es por IP aunque haya sesión (intentos de credenciales)
+RATE_LIMIT_BY_IP = {'login', 'registration'}
+
+UNSAFE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
 class RateLimitMiddleware:
     """
-    Simple rate limiting middleware.
-    Para rate limiting más robusto, considerar django-ratelimit o django-axes.
+    Rate limiting por grupo de rutas (``RATE_LIMIT_SETTINGS``) con el
+    limitador GCRA de ``majobacore.utils.ratelimit`` (un round trip a Redis).
+
+    - Login, alta de usuarios y búsqueda AJAX: su límite propio
+      (``RATE_LIMIT_ROUTE_GROUPS``).
+    - ``/api/``: ``API_RATE_LIMIT`` por IP como tope global; los límites por
+      usuario y por endpoint los aplican los throttles de DRF
+      (api/throttling.py), con el mismo limitador.
+    - Resto de la web: ``DEFAULT_RATE_LIMIT`` solo para métodos que escriben.
+
+    Se identifica por usuario si hay sesión y si no por IP. Debe ir después
+    de ``AuthenticationMiddleware``. Se desactiva con ``RATE_LIMIT_ENABLED``.
     """
-    
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.limits = {**RATE_LIMIT_SETTINGS, **getattr(settings, 'RATE_LIMIT_SETTINGS', {})}
+        self.route_groups = {
+            url_name: (group, rate_key, methods)
+            for group, rate_key, url_names, methods in RATE_LIMIT_ROUTE_GROUPS
+            for url_name in url_names
+        }
         logger.info("RateLimitMiddleware initialized")
-    
+
     def __call__(self, request):
-        # Implementar lógica de rate limiting aquí
-        # Por ahora es un placeholder
         response = self.get_response(request)
+        result = getattr(request, 'rate_limit', None)
+        if result is not None and result.allowed:
+            response['X-RateLimit-Limit'] = str(result.limit)
+            response['X-RateLimit-Remaining'] = str(result.remaining)
         return response
 
+    def get_group(self, request):
+        """
+        Returns:
+            tuple[str, str] | None: ``(grupo, clave de RATE_LIMIT_SETTINGS)``
+            o ``None`` si el request no se limita.
+        """
+        match = request.resolver_match
+        route = self.route_groups.get(match.url_name) if match else None
+        if route is not None:
+            group, rate_key, methods = route
+            if methods is None or request.method in methods:
+                return group, rate_key
+            return None
+        if request.path.startswith('/api/'):
+            return 'api', 'API_RATE_LIMIT'
+        if request.method in UNSAFE_METHODS:
+            return 'default', 'DEFAULT_RATE_LIMIT'
+        return None
 
-# Rate limiting configuration
-RATE_LIMIT_SETTINGS = {
-    'DEFAULT_RATE_LIMIT': '100/hour',
-    'LOGIN_RATE_LIMIT': '5/min',
-    'REGISTRATION_RATE_LIMIT': '3/min',
-    'PASSWORD_RESET_RATE_LIMIT': '3/hour',
-    'API_RATE_LIMIT': '1000/hour',
-    'SEARCH_RATE_LIMIT': '30/min',
-}
+    def get_ident(self, request, group):
+        # La API autentica por JWT en la vista: acá solo se conoce la IP
+        if group not in RATE_LIMIT_BY_IP and group != 'api':
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                return f'user:{user.pk}'
+        return f'ip:{get_client_ip(request)}'
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not getattr(settings, 'RATE_LIMIT_ENABLED', True):
+            return None
+        group = self.get_group(request)
+        if group is None:
+            return None
+
+        group, rate_key = group
+        ident = self.get_ident(request, group)
+        result = hit(f'{group}:{ident}', self.limits[rate_key])
+        request.rate_limit = result
+        if result.allowed:
+            return None
+
+        logger.warning("Rate limit excedido: grupo=%s %s path=%s", group, ident, request.path)
+        return self.limited_response(request, result)
+
+    def limited_response(self, request, result):
+        """429 en JSON para la API y AJAX, en texto plano para la web."""
+        detail = 'Demasiadas solicitudes. Intentá de nuevo en unos segundos.'
+        if request.path.startswith('/api/') or request.headers.get('x-requested-with') == 'XMLHttpRequest':
+            response = JsonResponse({'detail': detail}, status=429)
+        else:
+            response = HttpResponse(detail, status=429, content_type='text/plain; charset=utf-8')
+        response['Retry-After'] = str(math.ceil(result.retry_after))
+        return response
 
 
 # Security checklist for production deployment
@@ -297,9 +387,9 @@ def validate_production_security():
     if is_valid:
         logger.info("Production security validation: PASSED")
     else:
-        logger.warning(f"Production security validation: FAILED with {len(issues)} issues")
+        logger.warning("Production security validation: FAILED with %s issues", len(issues))
         for issue in issues:
-            logger.warning(f"  - {issue}")
+            logger.warning("  - %s", issue)
     
     return is_valid, issues
 
@@ -326,4 +416,4 @@ def log_security_event(event_type, user=None, ip_address=None, details=None):
     if details:
         log_data['details'] = details
     
-    logger.info(f"Security event: {event_type}", extra=log_data)
+    logger.info("Security event: %s", event_type, extra=log_data)
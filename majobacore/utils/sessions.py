@@ -0,0 +1,117 @@
+"""
+Backend de sesiones en dos niveles: Redis adelante, la base como respaldo.
+
+Con ``SESSION_ENGINE = 'django.contrib.sessions.backends.cache'`` las
+sesiones vivían solo en Redis: un corte (o un ``FLUSHALL``) deslogueaba a
+todos los usuarios web a la vez, y el re-login masivo es justo el pico de
+hashing de contraseñas que más cuesta.
+
+Este backend tiene la semántica de ``cached_db``:
+
+- Cada escritura va primero a la tabla ``django_session`` y después a Redis,
+  así la base siempre tiene la sesión y un corte de Redis no la pierde.
+- La lectura va a Redis; si no está o Redis falla, se lee de la base y se
+  vuelve a cargar en Redis. Durante un corte cada request hace un SELECT por
+  clave primaria, nadie se desloguea.
+- Los errores de Redis se registran y se ignoran en todas las operaciones
+  (con o sin ``IGNORE_EXCEPTIONS`` en el cache).
+
+Además coalesce escrituras: una sesión que el request marcó como modificada
+pero cuyos datos quedaron iguales a los leídos (ej: ``session['x'] = x``) no
+se vuelve a escribir, ni en la base ni en Redis.
+
+Las sesiones creadas con el backend ``cache`` anterior se adoptan al primer
+request (se copian a la base) para que el cambio de backend no desloguee a
+nadie. Las filas vencidas se borran con ``python manage.py clearsessions``.
+"""
+import hashlib
+import logging
+
+from django.contrib.sessions.backends import cached_db
+from django.contrib.sessions.backends.cache import KEY_PREFIX as LEGACY_KEY_PREFIX
+from django.db import IntegrityError, router, transaction
+
+logger = logging.getLogger('majobacore')
+
+
+class SessionStore(cached_db.SessionStore):
+    """``cached_db`` tolerante a fallas de Redis y sin escrituras redundantes."""
+
+    _persisted_digest = None
+
+    def _digest(self, data):
+        return hashlib.blake2b(self.serializer().dumps(data), digest_size=16).digest()
+
+    def _cache_call(self, method, *args):
+        try:
+            return getattr(self._cache, method)(*args)
+        except Exception as e:
+            logger.warning("Sesiones: cache no disponible en %s, se usa la base: %s", method, e)
+            return None
+
+    def load(self):
+        data = self._cache_call('get', self.cache_key)
+        if data is None:
+            session_key = self.session_key
+            s = self._get_session_from_db()
+            if s:
+                data = self.decode(s.session_data)
+                self._cache_call('set', self.cache_key, data, self.get_expiry_age(expiry=s.expire_date))
+            else:
+                data = self._adopt_legacy_session(session_key)
+        self._persisted_digest = self._digest(data)
+        return data
+
+    def _adopt_legacy_session(self, session_key):
+        """Copia a la base una sesión del backend ``cache`` (sin fila en ``django_session``)."""
+        data = self._cache_call('get', LEGACY_KEY_PREFIX + session_key)
+        if not data:
+            return {}
+
+        # _get_session_from_db descartó la clave al no encontrar la fila
+        self._session_key = session_key
+        expire_date = self.get_expiry_date(expiry=data.get('_session_expiry'))
+        obj = self.model(
+            session_key=self.session_key,
+            session_data=self.encode(data),
+            expire_date=expire_date,
+        )
+        using = router.db_for_write(self.model, instance=obj)
+        try:
+            with transaction.atomic(using=using):
+                obj.save(force_insert=True, using=using)
+        except IntegrityError:
+            pass  # otro request la adoptó primero
+        self._cache_call('set', self.cache_key, data, self.get_expiry_age(expiry=expire_date))
+        self._cache_call('delete', LEGACY_KEY_PREFIX + session_key)
+        return data
+
+    def exists(self, session_key):
+        if session_key and self._cache_call('has_key', self.cache_key_prefix + session_key):
+            return True
+        return super(cached_db.SessionStore, self).exists(session_key)
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        data = self._get_session(no_load=must_create)
+        digest = self._digest(data)
+        if not must_create and digest == self._persisted_digest:
+            return
+
+        # DBStore.save + cache, como cached_db pero con el cache protegido
+        super(cached_db.SessionStore, self).save(must_create)
+        self._cache_call('set', self.cache_key, self._session, self.get_expiry_age())
+        self._persisted_digest = digest
+
+    def delete(self, session_key=None):
+        super(cached_db.SessionStore, self).delete(session_key)
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        self._cache_call('delete', self.cache_key_prefix + session_key)
+        # cycle_key borra la clave anterior: lo persistido bajo la nueva sigue valiendo
+        if session_key == self.session_key:
+            self._persisted_digest = None
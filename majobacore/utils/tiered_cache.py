@@ -0,0 +1,331 @@
+"""
+Cache en dos niveles para objetos calientes que cambian poco (la fila del
+usuario autenticado, su ManagerData).
+
+1. Un LRU acotado en memoria de cada worker (``LOCAL_CACHE_MAX_ENTRIES``
+   entradas, TTL corto por namespace): un hit es un lookup en un dict, sin
+   round trip ni deserialización.
+2. El cache de Django (Redis en producción), compartido por todos los
+   workers, con TTL más largo.
+3. La base, vía el ``loader`` que pasa quien llama.
+
+Cada clave tiene un version stamp (``majobacore.utils.cache``). El valor en
+Redis se guarda junto a la versión con que se leyó de la base y se lee en el
+mismo round trip que la versión actual (``get_many``): si no coinciden es un
+miss. Invalidar (``TieredCache.invalidate``, después del commit) genera una
+versión nueva y la publica por pub/sub de Redis; cada worker escucha el canal
+en un hilo y descarta su copia local. Una lectura que empezó antes de la
+invalidación no puede dejar el valor viejo en el LRU: solo se guarda si su
+versión es la última que anunció el canal.
+
+Si la suscripción se corta, el LRU se vacía y no se usa hasta volver a
+suscribirse (los avisos perdidos no se pueden recuperar). Sin django-redis
+(desarrollo, tests) no hay canal: la invalidación solo alcanza al proceso
+que la hizo, como el resto del cache local.
+
+Hits y misses por namespace se suman cada ``STATS_FLUSH_INTERVAL`` segundos
+en un hash de Redis; ``python manage.py cache_stats`` muestra los ratios de
+todos los workers.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from majobacore.utils.cache import bump_version, get_version, version_key
+
+try:
+    from django_redis import get_redis_connection
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - django-redis está en requirements/base.txt
+    get_redis_connection = None
+    RedisError = OSError
+
+logger = logging.getLogger('majobacore')
+
+KEY_PREFIX = 'tiered'
+INVALIDATION_CHANNEL = 'tiered:invalidate'
+STATS_KEY = 'tiered:stats'
+
+# Cada cuánto el hilo de invalidaciones suma los contadores del worker en Redis
+STATS_FLUSH_INTERVAL = 30
+# Espera antes de reintentar la suscripción tras un error
+RECONNECT_DELAY = 5
+
+STATS_FIELDS = ('local_hits', 'cache_hits', 'misses')
+
+
+class LocalLRU:
+    """LRU acotado y thread-safe con vencimiento por entrada."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """``(versión, valor)`` o ``None`` si no está o venció."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, version, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return version, value
+
+    def set(self, key, version, value, timeout):
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, version, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_lru = LocalLRU(settings.LOCAL_CACHE_MAX_ENTRIES)
+# Última versión anunciada por el canal para cada clave
+_latest_versions = {}
+_stats = {}
+_flushed_stats = {}
+_subscribed = threading.Event()
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _get_redis_client():
+    if get_redis_connection is None:
+        return None
+    try:
+        return get_redis_connection('default')
+    except NotImplementedError:
+        return None
+
+
+def _count(namespace, field):
+    # Aproximado: sin lock, un incremento concurrente puede perderse
+    counters = _stats.get(namespace)
+    if counters is None:
+        counters = _stats.setdefault(namespace, dict.fromkeys(STATS_FIELDS, 0))
+    counters[field] += 1
+
+
+def _on_invalidation(data):
+    try:
+        message = json.loads(data)
+        key, version = message['key'], message['version']
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Cache en dos niveles: aviso de invalidación inválido: %r", data)
+        return
+    if len(_latest_versions) >= settings.LOCAL_CACHE_MAX_ENTRIES:
+        _latest_versions.clear()
+    _latest_versions[key] = version
+    _lru.delete(key)
+
+
+def _flush_stats(client):
+    """Suma en el hash compartido lo contado por este worker desde el último flush."""
+    pipe = client.pipeline(transaction=False)
+    pending = False
+    for namespace, counters in list(_stats.items()):
+        flushed = _flushed_stats.setdefault(namespace, dict.fromkeys(STATS_FIELDS, 0))
+        for field in STATS_FIELDS:
+            delta = counters[field] - flushed[field]
+            if delta:
+                pipe.hincrby(cache.make_key(STATS_KEY), f'{namespace}:{field}', delta)
+                flushed[field] += delta
+                pending = True
+    if pending:
+        pipe.execute()
+
+
+def _listen():
+    """Hilo del worker: aplica las invalidaciones publicadas y vuelca estadísticas."""
+    channel = cache.make_key(INVALIDATION_CHANNEL)
+    while True:
+        pubsub = None
+        try:
+            client = _get_redis_client()
+            pubsub = client.pubsub()
+            pubsub.subscribe(channel)
+            while pubsub.get_message(timeout=RECONNECT_DELAY) is None:
+                pass  # esperar la confirmación del SUBSCRIBE
+            # Lo publicado mientras no escuchábamos se perdió: arrancar vacío
+            _lru.clear()
+            _subscribed.set()
+
+            last_flush = time.monotonic()
+            while True:
+                message = pubsub.get_message(timeout=1.0)
+                if message is not None and message['type'] == 'message':
+                    _on_invalidation(message['data'])
+                if time.monotonic() - last_flush >= STATS_FLUSH_INTERVAL:
+                    _flush_stats(client)
+                    last_flush = time.monotonic()
+        except Exception as e:
+            _subscribed.clear()
+            _lru.clear()
+            logger.warning(
+                "Cache en dos niveles sin suscripción a invalidaciones, reintento en %s s: %s",
+                RECONNECT_DELAY, e,
+            )
+            time.sleep(RECONNECT_DELAY)
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+
+def _local_enabled():
+    """El LRU se usa solo si hay suscripción a las invalidaciones (o no hay Redis)."""
+    global _listener
+    if not settings.LOCAL_CACHE_ENABLED:
+        return False
+    if _get_redis_client() is None:
+        return True
+    if _listener is None:
+        with _listener_lock:
+            if _listener is None:
+                _listener = threading.Thread(target=_listen, name='tiered-cache-invalidation', daemon=True)
+                _listener.start()
+    return _subscribed.is_set()
+
+
+def _after_fork():
+    # gunicorn --preload: el hilo del listener no sobrevive al fork
+    global _listener, _listener_lock, _subscribed
+    _listener = None
+    _listener_lock = threading.Lock()
+    _subscribed = threading.Event()
+    _lru.clear()
+    _latest_versions.clear()
+    _stats.clear()
+    _flushed_stats.clear()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def _publish_invalidation(key):
+    version = bump_version(key)
+    _latest_versions[key] = version
+    _lru.delete(key)
+
+    client = _get_redis_client()
+    if client is None:
+        return
+    try:
+        client.publish(
+            cache.make_key(INVALIDATION_CHANNEL),
+            json.dumps({'key': key, 'version': version}),
+        )
+    except RedisError as e:
+        logger.warning("No se pudo publicar la invalidación de %s: %s", key, e)
+
+
+class TieredCache:
+    """
+    Namespace del cache en dos niveles.
+
+    Los valores deben ser inmutables o tratarse como tales (ej: el dict de
+    ``.values()`` de una fila): el LRU devuelve el mismo objeto a todos los
+    requests del worker.
+
+    Args:
+        namespace (str): Prefijo de las claves y de las estadísticas.
+        timeout (int): TTL en el cache de Django, en segundos.
+        local_timeout (int): TTL en el LRU del worker, en segundos.
+    """
+
+    def __init__(self, namespace, timeout, local_timeout):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.local_timeout = local_timeout
+
+    def make_key(self, key):
+        return f'{KEY_PREFIX}:{self.namespace}:{key}'
+
+    def get_or_set(self, key, loader):
+        """
+        Valor de ``key`` desde el LRU, Redis o ``loader()``, en ese orden.
+        ``None`` (ej: la fila no existe) no se cachea.
+        """
+        cache_key = self.make_key(key)
+        use_local = _local_enabled()
+        if use_local:
+            entry = _lru.get(cache_key)
+            if entry is not None:
+                _count(self.namespace, 'local_hits')
+                return entry[1]
+
+        version_cache_key = version_key(cache_key)
+        found = cache.get_many([cache_key, version_cache_key])
+        version = found.get(version_cache_key)
+        if version is None:
+            version = get_version(cache_key)
+
+        cached = found.get(cache_key)
+        if cached is not None and cached[0] == version:
+            _count(self.namespace, 'cache_hits')
+            value = cached[1]
+        else:
+            _count(self.namespace, 'misses')
+            value = loader()
+            if value is None:
+                return None
+            cache.set(cache_key, (version, value), self.timeout)
+
+        if use_local and _latest_versions.get(cache_key, version) == version:
+            _lru.set(cache_key, version, value, self.local_timeout)
+        return value
+
+    def invalidate(self, key):
+        """
+        Descarta ``key`` en este worker ya y, después del commit, en Redis y en
+        los demás workers (antes del commit podrían releer la fila vieja).
+        """
+        cache_key = self.make_key(key)
+        _lru.delete(cache_key)
+        transaction.on_commit(lambda: _publish_invalidation(cache_key))
+
+
+def local_stats():
+    """Contadores de este worker por namespace y tamaño del LRU."""
+    return {
+        'entries': len(_lru),
+        'subscribed': _subscribed.is_set(),
+        'namespaces': {namespace: dict(counters) for namespace, counters in _stats.items()},
+    }
+
+
+def shared_stats(client):
+    """Contadores sumados de todos los workers (``{namespace: {campo: n}}``)."""
+    stats = {}
+    for field, value in client.hgetall(cache.make_key(STATS_KEY)).items():
+        namespace, _, name = field.decode().rpartition(':')
+        stats.setdefault(namespace, dict.fromkeys(STATS_FIELDS, 0))[name] = int(value)
+    return stats
+
+
+def reset_shared_stats(client):
+    client.delete(cache.make_key(STATS_KEY))
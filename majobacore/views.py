@@ -5,7 +5,6 @@ Views for MajobaCore main pages and utilities.
 import logging
 from django.shortcuts import render
 from django.http import JsonResponse, HttpResponse
-from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
@@ -14,6 +13,8 @@ from django.core.cache import cache
 from django.core.mail import send_mail
 from smtplib import SMTPException
 
+from majobacore.utils.cache import anonymous_cache_page
+
 logger = logging.getLogger('majobacore')
 
 
@@ -21,26 +22,31 @@ logger = logging.getLogger('majobacore')
 # PÁGINAS PRINCIPALES
 # ============================================================================
 
+@anonymous_cache_page
 def index(request):
     """Landing page del sistema."""
     return render(request, 'index.html')
 
 
+@anonymous_cache_page
 def majoba_view(request):
     """Página de Majoba."""
     return render(request, 'majoba_template.html')
 
 
+@anonymous_cache_page
 def hormicons_view(request):
     """Página de Hormicons."""
     return render(request, 'hormicons_template.html')
 
 
+@anonymous_cache_page
 def constructora_view(request):
     """Página de Constructora."""
     return render(request, 'constructora_template.html')
 
 
+@anonymous_cache_page
 def coming_soon_view(request):
     """Página de sección en construcción (Herramientas)."""
     return render(request, 'coming_soon.html')
@@ -100,12 +106,12 @@ def budget_view(request):
             fail_silently=False,
         )
         logger.info(
-            f'Presupuesto enviado correctamente | solicitante: {email} | nombre: {name}'
+            "Presupuesto enviado correctamente | solicitante: %s | nombre: %s", email, name
         )
         return render(request, 'budget_form.html', {'success': True})
 
     except SMTPException as e:
-        logger.error(f'Error SMTP al enviar presupuesto de {email}: {e}')
+        logger.error("Error SMTP al enviar presupuesto de %s: %s", email, e)
         return render(request, 'budget_form.html', {
             'error': 'Hubo un problema al enviar tu solicitud. Por favor intentá más tarde o contactanos directamente.',
             'form_data': {
@@ -116,7 +122,7 @@ def budget_view(request):
             },
         })
     except Exception as e:
-        logger.error(f'Error inesperado al enviar presupuesto de {email}: {e}')
+        logger.error("Error inesperado al enviar presupuesto de %s: %s", email, e)
         return render(request, 'budget_form.html', {
             'error': 'Ocurrió un error inesperado. Por favor intentá más tarde.',
             'form_data': {
@@ -159,7 +165,7 @@ def health_check(request):
     except Exception as e:
         health_status['status'] = 'unhealthy'
         health_status['checks']['database'] = f'error: {str(e)}'
-        logger.error(f"Health check - Database error: {e}")
+        logger.error("Health check - Database error: %s", e)
     
     # Check cache (Redis)
     try:
@@ -172,7 +178,7 @@ def health_check(request):
     except Exception as e:
         health_status['status'] = 'degraded'  # No crítico
         health_status['checks']['cache'] = f'error: {str(e)}'
-        logger.warning(f"Health check - Cache error: {e}")
+        logger.warning("Health check - Cache error: %s", e)
     
     # Status code según resultado
     status_code = 200 if health_status['status'] == 'healthy' else 503
@@ -213,5 +219,5 @@ def readiness_check(request):
             cursor.execute("SELECT 1")
         return HttpResponse("Ready", status=200, content_type="text/plain")
     except Exception as e:
-        logger.error(f"Readiness check failed: {e}")
+        logger.error("Readiness check failed: %s", e)
         return HttpResponse("Not Ready", status=503, content_type="text/plain")
\ No newline at end of file
@@ -1,8 +1,9 @@
 from django.contrib import admin
-from .models import Client, ManagerData, Project, Notification
+from .models import Client, ManagerData, Project, Notification, NotificationArchive
 
 # Register your models here.
 admin.site.register(Client)
 admin.site.register(ManagerData)
 admin.site.register(Project)
 admin.site.register(Notification)
+admin.site.register(NotificationArchive)
@@ -0,0 +1,68 @@
+"""
+Cache del ManagerData de cada usuario (puntos, nivel, notificaciones).
+
+El perfil y el panel de la API y el panel web lo leen en cada request;
+cambia solo cuando se suman/restan puntos o llega una notificación.
+``get_manager_data(user)`` lo sirve desde el cache en dos niveles de
+``majobacore.utils.tiered_cache`` (LRU del worker, Redis, base) y lo deja
+en ``user.manager_user``, así los serializers que lo recorren no hacen la
+query del related.
+
+El ``post_save``/``post_delete`` de ``ManagerData`` (manager/signals.py)
+invalida la entrada en todos los workers. La instancia es de solo lectura:
+para modificarla, releerla de la base (ver ``manager_modification``).
+"""
+from django.conf import settings
+from django.db import router
+
+from majobacore.utils.tiered_cache import TieredCache
+
+from .models import ManagerData
+from .services import create_manager
+
+manager_data_cache = TieredCache(
+    'manager:data',
+    timeout=settings.MANAGER_DATA_CACHE_TIMEOUT,
+    local_timeout=settings.MANAGER_DATA_LOCAL_CACHE_TIMEOUT,
+)
+
+
+def _fields():
+    return [field.attname for field in ManagerData._meta.concrete_fields]
+
+
+def _load_values(user):
+    values = ManagerData.objects.filter(user_id=user.pk).values(*_fields()).first()
+    if values is None:
+        manager_data = create_manager(user)
+        if manager_data is None:
+            return None
+        values = {name: getattr(manager_data, name) for name in _fields()}
+    return values
+
+
+def get_manager_data(user):
+    """
+    Retorna el ManagerData de ``user`` desde cache, creándolo si no existe.
+
+    Returns:
+        ManagerData | None: ``None`` solo si no se pudo crear.
+    """
+    values = manager_data_cache.get_or_set(str(user.pk), lambda: _load_values(user))
+    if values is None:
+        return None
+    field_names = [name for name in _fields() if name in values]
+    manager_data = ManagerData.from_db(
+        router.db_for_read(ManagerData),
+        field_names,
+        [values[name] for name in field_names],
+    )
+    # Los dos lados del OneToOne sin query: user.manager_user y manager_data.user
+    manager_data._state.fields_cache['user'] = user
+    user._state.fields_cache['manager_user'] = manager_data
+    return manager_data
+
+
+def invalidate_manager_data(user_id):
+    """Invalida el ManagerData cacheado del usuario en Redis y en todos los workers."""
+    manager_data_cache.invalidate(str(user_id))
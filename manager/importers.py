@@ -0,0 +1,401 @@
+"""
+Importación masiva de proyectos (y sus clientes) desde CSV o XLSX.
+
+El archivo se lee fila a fila (``csv.reader`` sobre el stream, openpyxl
+en modo ``read_only``), así que el uso de memoria no depende del tamaño del
+archivo sino de ``chunk_size``. Los clientes se deduplican en memoria por
+nombre y teléfono normalizados, contra los existentes del usuario y contra
+los que aparecen en el mismo archivo. Las filas válidas se insertan con
+``bulk_create`` en lotes dentro de una única transacción; las inválidas se
+omiten y se informan en ``ImportResult.errors`` con su número de fila.
+
+Columnas reconocidas (encabezado sin distinguir mayúsculas ni acentos):
+
+    name / nombre                 (obligatoria)
+    start_date / fecha_inicio     (obligatoria: AAAA-MM-DD o DD/MM/AAAA)
+    end_date / fecha_fin
+    location / ubicacion
+    description / descripcion
+    is_active / activo            (si/no, true/false, 1/0; default: sí)
+    client / cliente
+    client_phone / telefono
+"""
+import csv
+import io
+import itertools
+import logging
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from django.db import transaction
+
+from majobacore.utils.cache import bump_version
+from .models import Client, Project
+from .signals import PROJECTS_VERSION
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - openpyxl es opcional (solo XLSX)
+    openpyxl = None
+
+logger = logging.getLogger('manager')
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Máximo de errores que se guardan en el reporte; el resto solo se cuenta
+MAX_REPORTED_ERRORS = 1000
+
+# Comienzos de celda que Excel/LibreOffice interpretan como fórmula. La
+# exportación CSV (api/exports.py) les antepone ``'`` y acá se quita.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+COLUMN_ALIASES = {
+    'name': ('name', 'nombre', 'proyecto', 'nombre_del_proyecto'),
+    'start_date': ('start_date', 'fecha_inicio', 'fecha_de_inicio', 'inicio'),
+    'end_date': ('end_date', 'fecha_fin', 'fecha_de_fin', 'fin'),
+    'location': ('location', 'ubicacion'),
+    'description': ('description', 'descripcion'),
+    'is_active': ('is_active', 'activo'),
+    'client': ('client', 'client_name', 'cliente'),
+    'client_phone': ('client_phone', 'phone', 'telefono', 'telefono_cliente'),
+}
+
+REQUIRED_COLUMNS = ('name', 'start_date')
+
+TRUE_VALUES = {'1', 'true', 'si', 'yes', 'x', 'activo'}
+FALSE_VALUES = {'0', 'false', 'no', 'inactivo'}
+
+_DATE_SEPARATORS_RE = re.compile(r'[/-]')
+_NON_DIGITS_RE = re.compile(r'\D+')
+_SPACES_RE = re.compile(r'\s+')
+
+
+class ImportFormatError(ValueError):
+    """El archivo no se puede leer (formato o encabezado inválido)."""
+
+
+@dataclass
+class ImportResult:
+    """Resumen de una importación."""
+    rows: int = 0
+    created_projects: int = 0
+    created_clients: int = 0
+    reused_clients: int = 0
+    error_count: int = 0
+    errors: list = field(default_factory=list)
+    dry_run: bool = False
+
+    def add_error(self, row_number, messages):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'errors': messages})
+
+    def as_dict(self):
+        return {
+            'rows': self.rows,
+            'created_projects': self.created_projects,
+            'created_clients': self.created_clients,
+            'reused_clients': self.reused_clients,
+            'error_count': self.error_count,
+            'errors': self.errors,
+            'dry_run': self.dry_run,
+        }
+
+
+def _strip_accents(value):
+    return ''.join(
+        char for char in unicodedata.normalize('NFKD', value)
+        if not unicodedata.combining(char)
+    )
+
+
+def normalize_header(value):
+    """``'Fecha de Inicio'`` -> ``'fecha_de_inicio'``."""
+    return _SPACES_RE.sub('_', _strip_accents(str(value or '')).strip().lower())
+
+
+def client_key(name, phone):
+    """
+    Clave de deduplicación de clientes: nombre sin acentos, en minúsculas y
+    con espacios colapsados + solo los dígitos del teléfono.
+    """
+    normalized_name = _SPACES_RE.sub(' ', _strip_accents(name).casefold()).strip()
+    return normalized_name, _NON_DIGITS_RE.sub('', phone or '')
+
+
+def _map_header(header):
+    """``{índice de columna: campo}`` a partir del encabezado del archivo."""
+    lookup = {alias: column for column, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    mapping = {}
+    for index, title in enumerate(header):
+        column = lookup.get(normalize_header(title))
+        if column and column not in mapping.values():
+            mapping[index] = column
+    missing = [column for column in REQUIRED_COLUMNS if column not in mapping.values()]
+    if missing:
+        raise ImportFormatError(f"Faltan columnas obligatorias: {', '.join(missing)}")
+    return mapping
+
+
+def _iter_csv(fileobj):
+    """Filas (listas) de un CSV binario; detecta ',' / ';' / tab en el encabezado."""
+    text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+    try:
+        header = text.readline()
+        try:
+            dialect = csv.Sniffer().sniff(header, delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(itertools.chain([header], text), dialect)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError('El CSV debe estar codificado en UTF-8') from exc
+    finally:
+        # No cerrar el archivo subyacente junto con el wrapper
+        text.detach()
+
+
+def _iter_xlsx(fileobj):
+    """Filas de la primera hoja de un XLSX, en modo streaming."""
+    if openpyxl is None:
+        raise ImportFormatError('La importación de XLSX requiere openpyxl')
+    try:
+        workbook = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception as exc:
+        raise ImportFormatError('No se pudo leer el archivo XLSX') from exc
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield ['' if value is None else value for value in row]
+    finally:
+        workbook.close()
+
+
+def iter_rows(fileobj, filename):
+    """
+    Recorre las filas de datos de un CSV/XLSX como diccionarios.
+
+    Yields:
+        tuple[int, dict]: (número de fila en el archivo, ``{campo: valor}``).
+    """
+    if filename.lower().endswith('.xlsx'):
+        rows = _iter_xlsx(fileobj)
+    elif filename.lower().endswith(('.csv', '.txt')):
+        rows = _iter_csv(fileobj)
+    else:
+        raise ImportFormatError('Formato no soportado: se aceptan archivos .csv y .xlsx')
+
+    header = next(rows, None)
+    if header is None:
+        raise ImportFormatError('El archivo está vacío')
+    mapping = _map_header(header)
+
+    for row_number, row in enumerate(rows, start=2):
+        if not any(str(value).strip() for value in row):
+            continue
+        yield row_number, {
+            column: row[index] if index < len(row) else ''
+            for index, column in mapping.items()
+        }
+
+
+def _text(value):
+    text = str(value).strip() if value is not None else ''
+    if text[:1] == "'" and text[1:2] in FORMULA_PREFIXES:
+        text = text[1:]
+    return text
+
+
+def _parse_date(value):
+    """AAAA-MM-DD, DD/MM/AAAA o DD-MM-AAAA (o date/datetime de una celda XLSX)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    # Sin strptime: es la mitad del costo de parsear una fila
+    parts = _DATE_SEPARATORS_RE.split(str(value).strip())
+    if len(parts) == 3 and all(part.isdigit() for part in parts):
+        if len(parts[0]) == 4:
+            year, month, day = parts
+        elif len(parts[2]) == 4:
+            day, month, year = parts
+        else:
+            raise ValueError(value)
+        return date(int(year), int(month), int(day))
+    raise ValueError(value)
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    normalized = _strip_accents(_text(value)).lower()
+    if not normalized or normalized in TRUE_VALUES:
+        return True
+    if normalized in FALSE_VALUES:
+        return False
+    raise ValueError(value)
+
+
+def _max_length(model, field_name):
+    return model._meta.get_field(field_name).max_length
+
+
+def parse_row(values):
+    """
+    Valida una fila y la convierte en datos de Project/Client.
+
+    Returns:
+        tuple[dict, dict | None, list[str]]: (campos del proyecto, cliente
+        ``{'name', 'phone'}`` o None, errores).
+    """
+    errors = []
+    project = {
+        'name': _text(values.get('name')),
+        'location': _text(values.get('location')),
+        'description': _text(values.get('description')),
+    }
+    client_name = _text(values.get('client'))
+    client_phone = _text(values.get('client_phone'))
+
+    if not project['name']:
+        errors.append('name: es obligatorio')
+
+    for column, model, field_name, value in (
+        ('name', Project, 'name', project['name']),
+        ('location', Project, 'location', project['location']),
+        ('client', Client, 'name', client_name),
+        ('client_phone', Client, 'phone', client_phone),
+    ):
+        limit = _max_length(model, field_name)
+        if len(value) > limit:
+            errors.append(f'{column}: máximo {limit} caracteres')
+
+    start_date = values.get('start_date')
+    if not _text(start_date):
+        errors.append('start_date: es obligatoria')
+    else:
+        try:
+            project['start_date'] = _parse_date(start_date)
+        except ValueError:
+            errors.append(f'start_date: fecha inválida {_text(start_date)!r}')
+
+    end_date = values.get('end_date')
+    project['end_date'] = None
+    if _text(end_date):
+        try:
+            project['end_date'] = _parse_date(end_date)
+        except ValueError:
+            errors.append(f'end_date: fecha inválida {_text(end_date)!r}')
+
+    try:
+        project['is_active'] = _parse_bool(values.get('is_active'))
+    except ValueError:
+        errors.append(f'is_active: valor inválido {_text(values.get("is_active"))!r}')
+
+    if project.get('start_date') and project['end_date'] and project['end_date'] < project['start_date']:
+        errors.append('end_date: no puede ser anterior a start_date')
+
+    if client_phone and not client_name:
+        errors.append('client: obligatorio si se indica client_phone')
+
+    client = {'name': client_name, 'phone': client_phone} if client_name else None
+    return project, client, errors
+
+
+class _ChunkWriter:
+    """Acumula proyectos/clientes nuevos y los inserta de a ``chunk_size``."""
+
+    def __init__(self, user, result, chunk_size, dry_run):
+        self.user = user
+        self.result = result
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.pending_projects = []
+        self.pending_clients = []
+        # Una sola query para los clientes existentes del usuario
+        self.clients = {
+            client_key(name, phone): pk
+            for pk, name, phone in Client.objects.filter(user=user).values_list('id', 'name', 'phone')
+        }
+        self.existing_keys = set(self.clients)
+
+    def get_client(self, name, phone):
+        """pk del cliente existente o instancia nueva (pendiente de insertar)."""
+        key = client_key(name, phone)
+        client = self.clients.get(key)
+        if client is None:
+            client = Client(user=self.user, name=name, phone=phone)
+            self.clients[key] = client
+            self.pending_clients.append(client)
+            self.result.created_clients += 1
+        elif key in self.existing_keys:
+            self.result.reused_clients += 1
+        return client
+
+    def add(self, project_data, client_data):
+        project = Project(user=self.user, **project_data)
+        if client_data is not None:
+            client = self.get_client(client_data['name'], client_data['phone'])
+            if isinstance(client, Client):
+                project.client = client
+            else:
+                project.client_id = client
+        self.pending_projects.append(project)
+        if len(self.pending_projects) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self.dry_run:
+            # Clientes primero: bulk_create completa sus pk (PostgreSQL/SQLite)
+            # y al insertar los proyectos Django copia ese pk a client_id.
+            Client.objects.bulk_create(self.pending_clients, batch_size=self.chunk_size)
+            Project.objects.bulk_create(self.pending_projects, batch_size=self.chunk_size)
+            # Los lotes siguientes referencian a estos clientes por pk
+            for client in self.pending_clients:
+                self.clients[client_key(client.name, client.phone)] = client.pk
+        self.result.created_projects += len(self.pending_projects)
+        self.pending_projects = []
+        self.pending_clients = []
+
+
+def import_projects(user, fileobj, filename, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    Importa proyectos (y crea los clientes que falten) para ``user``.
+
+    Args:
+        user: Dueño de los proyectos y clientes importados.
+        fileobj: Archivo binario (CSV UTF-8 o XLSX).
+        filename (str): Nombre del archivo; su extensión define el formato.
+        chunk_size (int): Filas por ``bulk_create``.
+        dry_run (bool): Validar y contar sin escribir en la base.
+
+    Returns:
+        ImportResult: Totales y errores por fila.
+
+    Raises:
+        ImportFormatError: Si el archivo no se puede leer o le faltan columnas.
+    """
+    result = ImportResult(dry_run=dry_run)
+
+    with transaction.atomic():
+        writer = _ChunkWriter(user, result, chunk_size, dry_run)
+        for row_number, values in iter_rows(fileobj, filename):
+            result.rows += 1
+            project_data, client_data, errors = parse_row(values)
+            if errors:
+                result.add_error(row_number, errors)
+                continue
+            writer.add(project_data, client_data)
+        writer.flush()
+
+        if not dry_run and result.created_projects:
+            # bulk_create no dispara post_save: invalidar a mano los
+            # fragmentos cacheados de proyectos del usuario
+            transaction.on_commit(lambda: bump_version(PROJECTS_VERSION, user.pk))
+
+    logger.info(
+        "Importación de proyectos de %s: %s proyectos, %s clientes nuevos, %s filas con errores%s",
+        user.username, result.created_projects, result.created_clients, result.error_count,
+        ' (dry run)' if dry_run else '',
+    )
+    return result
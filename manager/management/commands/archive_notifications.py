@@ -0,0 +1,91 @@
+"""
+Comando de gestión que archiva las notificaciones leídas viejas.
+
+Mueve a ``manager_notificationarchive`` las notificaciones leídas creadas
+hace más de ``--days`` días (default: ``NOTIFICATION_RETENTION_DAYS``), en
+lotes de ``--batch-size`` filas, cada uno en su propia transacción. Pensado
+para correr periódicamente (cron de Railway) y mantener chica la tabla que
+consultan el listado y ``unread-count``.
+
+Uso:
+    python manage.py archive_notifications
+    python manage.py archive_notifications --days 30 --batch-size 10000
+    python manage.py archive_notifications --dry-run
+    python manage.py archive_notifications --max-batches 20   # corrida acotada
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from manager.models import Notification
+from manager.retention import (
+    DEFAULT_BATCH_SIZE,
+    archivable_notifications,
+    archive_read_notifications,
+    get_cutoff,
+)
+
+logger = logging.getLogger('manager')
+
+
+class Command(BaseCommand):
+    help = 'Mueve las notificaciones leídas más viejas que N días a la tabla de archivo'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Antigüedad mínima en días (default: settings.NOTIFICATION_RETENTION_DAYS)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Filas por lote/transacción (default: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+            help='Cortar después de N lotes',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo contar cuántas notificaciones se archivarían',
+        )
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else settings.NOTIFICATION_RETENTION_DAYS
+        if days < 1:
+            raise CommandError('--days debe ser al menos 1')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size debe ser al menos 1')
+
+        if options['dry_run']:
+            count = archivable_notifications(get_cutoff(days)).count()
+            self.stdout.write(f'[dry run] {count} notificaciones leídas de más de {days} días')
+            return
+
+        verbose = options['verbosity'] > 1
+
+        def on_batch(moved):
+            if verbose:
+                self.stdout.write(f'  lote: {moved}')
+
+        start = time.perf_counter()
+        total = archive_read_notifications(
+            days,
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            on_batch=on_batch,
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} notificaciones archivadas en {elapsed:.1f} s; '
+            f'quedan {Notification.objects.count()} en la tabla activa'
+        ))
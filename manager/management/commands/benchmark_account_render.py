@@ -0,0 +1,124 @@
+"""
+Benchmark del render de ``manager/account_manager.html`` con y sin los
+fragmentos cacheados (escalera de niveles y panel de proyectos recientes).
+
+Crea un usuario de prueba dentro de una transacción que se revierte al final
+y usa un LocMemCache propio, así que no depende del cache configurado ni deja
+datos en la base.
+
+Uso:
+    python manage.py benchmark_account_render
+    python manage.py benchmark_account_render --iterations 500
+"""
+import timeit
+from datetime import date
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from majobacore.utils.cache import get_version
+from manager.models import ManagerData, Notification, Project
+from manager.services import humanize_notifications
+from manager.signals import PROJECTS_VERSION
+from users.models import CustomUser
+
+BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmark-account-render',
+    }
+}
+
+
+class Command(BaseCommand):
+    help = 'Mide el tiempo de render del panel de cuenta con fragmentos cacheados vs sin cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Repeticiones por medición (default: 200)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+
+        with override_settings(CACHES=BENCHMARK_CACHES), transaction.atomic():
+            user = self._create_user()
+            request = RequestFactory().get('/manager/')
+            request.user = user
+
+            def render_page():
+                # Igual que manager_view: querysets lazy + version stamp
+                context = {
+                    'manager_info': user.manager_user,
+                    'user': user,
+                    'projects': Project.objects.filter(user=user).all()[:3],
+                    'projects_version': get_version(PROJECTS_VERSION, user.pk),
+                    'notifications': humanize_notifications(
+                        Notification.objects.filter(user=user).order_by('-created_at')[:5]
+                    ),
+                }
+                return render_to_string('manager/account_manager.html', context, request=request)
+
+            def render_cold():
+                cache.clear()
+                return render_page()
+
+            cold_html = render_cold()
+            warm_html = render_page()
+            if cold_html != warm_html:
+                self.stdout.write(self.style.ERROR('¡El HTML cacheado difiere del renderizado!'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'HTML idéntico ({len(warm_html)} bytes)'))
+
+            cache.clear()
+            with CaptureQueriesContext(connection) as cold_queries:
+                render_page()
+            with CaptureQueriesContext(connection) as warm_queries:
+                render_page()
+
+            cold_ms = self._time(render_cold, iterations)
+            warm_ms = self._time(render_page, iterations)
+            self.stdout.write(
+                f'sin cache:  {cold_ms:6.2f} ms/render  {len(cold_queries)} queries\n'
+                f'fragmentos: {warm_ms:6.2f} ms/render  {len(warm_queries)} queries\n'
+                f'ahorro:     {cold_ms - warm_ms:6.2f} ms/render (x{cold_ms / warm_ms:.1f})'
+            )
+
+            # No dejar datos de benchmark en la base
+            transaction.set_rollback(True)
+
+    def _create_user(self):
+        """Usuario con ManagerData, 3 proyectos y 5 notificaciones."""
+        user = CustomUser.objects.create(
+            username='benchmark_account_render',
+            first_name='Bench',
+            last_name='Mark',
+            phone='0000000000',
+        )
+        ManagerData.objects.create(user=user, points=750, acc_level='intermedio')
+        Project.objects.bulk_create(
+            Project(
+                user=user,
+                name=f'Edificio Residencial Nº {i + 1}',
+                location='Av. Colón 1234, Córdoba',
+                start_date=date(2024, 1, 1 + i),
+                is_active=bool(i % 2),
+            )
+            for i in range(3)
+        )
+        Notification.objects.bulk_create(
+            Notification(user=user, message=f'¡Felicitaciones! sumaste {i * 10} puntos.')
+            for i in range(5)
+        )
+        return user
+
+    def _time(self, func, iterations):
+        """ms por llamada (mejor de 3 repeticiones)."""
+        return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e3
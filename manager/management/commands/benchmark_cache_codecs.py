@@ -0,0 +1,234 @@
+"""
+Compara serializers y compresores del cache (majobacore/utils/cache_codecs.py).
+
+Para cada payload representativo y cada combinación serializer/compresor
+instalada mide los bytes que ocuparía en Redis, el tiempo de codificar y
+decodificar (lo que hace django-redis en cada set/get) y si el valor vuelve
+igual. Con ``--live`` mide además el round trip SET + GET contra el Redis del
+cache ``default``, donde el tamaño del valor también cuenta.
+
+Payloads:
+    counter    contadores del dashboard (envoltorio de get_or_compute)
+    session    sesión de un usuario logueado
+    user       fila de usuario del cache en dos niveles (versión, valores)
+    dashboard  respuesta completa del dashboard de la API
+    projects   página de 24 proyectos (filas con fechas)
+    html       fragmento HTML cacheado de una página de proyectos
+
+Uso:
+    python manage.py benchmark_cache_codecs
+    python manage.py benchmark_cache_codecs --payload session --payload html
+    python manage.py benchmark_cache_codecs --min-length 256 --live
+"""
+import datetime
+import time
+from contextlib import suppress
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from django_redis.exceptions import CompressorError
+
+from majobacore.utils import cache_codecs
+
+NOW = datetime.datetime(2025, 6, 2, 14, 30, 12, 345678, tzinfo=datetime.timezone.utc)
+
+USER_ROW = {
+    'id': 7,
+    'last_login': NOW,
+    'is_superuser': False,
+    'username': 'jperez',
+    'first_name': 'Juan',
+    'last_name': 'Pérez',
+    'email': 'jperez@example.com',
+    'is_staff': False,
+    'is_active': True,
+    'date_joined': NOW - datetime.timedelta(days=400),
+    'phone': '3511234567',
+    'profession': 'Arquitecto',
+    'direction': 'Av. Colón 1234, Córdoba',
+}
+
+MANAGER_DATA = {
+    'id': 7,
+    'user_id': 7,
+    'points': 1250,
+    'acc_level': 'intermedio',
+    'notifications': 3,
+    'created_at': NOW - datetime.timedelta(days=400),
+    'updated_at': NOW,
+}
+
+
+def _projects():
+    return [
+        {
+            'id': 1000 + i,
+            'user_id': 7,
+            'client_id': 40 + i % 5,
+            'name': f'Relevamiento planialtimétrico lote {i}',
+            'description': (
+                'Relevamiento topográfico con estación total y nivelación '
+                'geométrica, cómputo de superficies y plano de mensura para '
+                f'presentación en Catastro. Expediente {2025_000 + i}.'
+            ),
+            'location': 'Barrio General Paz, Córdoba',
+            'start_date': NOW.date() - datetime.timedelta(days=30 + i),
+            'end_date': None if i % 3 else NOW.date(),
+            'is_active': bool(i % 4),
+            'created_at': NOW - datetime.timedelta(days=30 + i),
+            'updated_at': NOW - datetime.timedelta(days=i),
+        }
+        for i in range(24)
+    ]
+
+
+def _projects_html():
+    card = (
+        '<article class="project-card">'
+        '<h3 class="project-card__title">{name}</h3>'
+        '<p class="project-card__meta">{location} &middot; desde {start_date}</p>'
+        '<p class="project-card__description">{description}</p>'
+        '<a class="btn btn-outline" href="/manager/projects/{id}/edit/">Editar</a>'
+        '</article>'
+    )
+    return '<section class="projects-grid">' + ''.join(
+        card.format(**project) for project in _projects()
+    ) + '</section>'
+
+
+PAYLOADS = {
+    'counter': lambda: (
+        {'recent_projects_count': 12, 'unread_notifications_count': 3},
+        time.time() + 300,
+        0.0042,
+    ),
+    'session': lambda: {
+        '_auth_user_id': '7',
+        '_auth_user_backend': 'django.contrib.auth.backends.ModelBackend',
+        '_auth_user_hash': '9f2c4e1b7a3d5f8e0c6b2a4d8e1f3c5a7b9d0e2f4a6c8e0b2d4f6a8c0e2b4d6f',
+        '_language': 'es',
+    },
+    'user': lambda: (time.time_ns(), USER_ROW),
+    'dashboard': lambda: {
+        'user': {key: USER_ROW[key] for key in ('id', 'username', 'first_name', 'last_name', 'email')},
+        'manager_data': MANAGER_DATA,
+        'recent_projects_count': 12,
+        'unread_notifications_count': 3,
+    },
+    'projects': _projects,
+    'html': _projects_html,
+}
+
+
+class Command(BaseCommand):
+    help = 'Mide tamaño y latencia de cada serializer/compresor del cache con payloads representativos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help='Codificaciones/decodificaciones por combinación (default: 2000)',
+        )
+        parser.add_argument(
+            '--payload',
+            action='append',
+            choices=sorted(PAYLOADS),
+            help='Payload a medir (repetible; default: todos)',
+        )
+        parser.add_argument(
+            '--min-length',
+            type=int,
+            default=settings.CACHE_COMPRESS_MIN_LENGTH,
+            help='Bytes a partir de los cuales se comprime (default: CACHE_COMPRESS_MIN_LENGTH)',
+        )
+        parser.add_argument(
+            '--live',
+            action='store_true',
+            help='Mide también SET + GET contra el Redis del cache default',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError('--iterations tiene que ser mayor que 0')
+
+        client = self._redis_client() if options['live'] else None
+        codec_options = {'COMPRESS_MIN_LENGTH': options['min_length']}
+        serializers = {
+            name: import_string(path)(codec_options)
+            for name, (path, _) in cache_codecs.SERIALIZERS.items()
+            if cache_codecs.available(cache_codecs.SERIALIZERS, name)
+        }
+        compressors = {
+            name: import_string(path)(codec_options)
+            for name, (path, _) in cache_codecs.COMPRESSORS.items()
+            if cache_codecs.available(cache_codecs.COMPRESSORS, name)
+        }
+        self.stdout.write(
+            f'Serializers: {", ".join(serializers)}; compresores: {", ".join(compressors)}; '
+            f'se comprime a partir de {options["min_length"]} bytes; {iterations} iteraciones'
+        )
+
+        for payload_name in options['payload'] or PAYLOADS:
+            value = PAYLOADS[payload_name]()
+            self.stdout.write('')
+            self.stdout.write(self.style.MIGRATE_HEADING(payload_name))
+            header = f'  {"serializer":<10} {"compresor":<10} {"bytes":>8} {"encode µs":>10} {"decode µs":>10} {"igual":>6}'
+            if client is not None:
+                header += f' {"Redis µs":>10}'
+            self.stdout.write(header)
+
+            for serializer_name, serializer in serializers.items():
+                for compressor_name, compressor in compressors.items():
+                    row = self._measure(value, serializer, compressor, iterations, client)
+                    line = (
+                        f'  {serializer_name:<10} {compressor_name:<10} {row["bytes"]:>8} '
+                        f'{row["encode"]:>10.2f} {row["decode"]:>10.2f} {"sí" if row["equal"] else "no":>6}'
+                    )
+                    if client is not None:
+                        line += f' {row["redis"]:>10.2f}'
+                    self.stdout.write(line)
+
+    def _redis_client(self):
+        try:
+            from django_redis import get_redis_connection
+            return get_redis_connection('default')
+        except NotImplementedError:
+            raise CommandError('--live necesita que el cache default sea django-redis')
+
+    def _measure(self, value, serializer, compressor, iterations, client):
+        """Bytes, µs por codificación/decodificación y, con ``client``, µs por SET + GET."""
+        def encode():
+            return compressor.compress(serializer.dumps(value))
+
+        def decode(data):
+            # Igual que django-redis: un valor chico se guardó sin comprimir
+            with suppress(CompressorError):
+                data = compressor.decompress(data)
+            return serializer.loads(data)
+
+        data = encode()
+        row = {'bytes': len(data), 'equal': decode(data) == value}
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            encode()
+        row['encode'] = (time.perf_counter() - start) / iterations * 1e6
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            decode(data)
+        row['decode'] = (time.perf_counter() - start) / iterations * 1e6
+
+        if client is not None:
+            key = cache.make_key('benchmark:codecs')
+            start = time.perf_counter()
+            for _ in range(iterations):
+                client.set(key, encode(), ex=60)
+                decode(client.get(key))
+            row['redis'] = (time.perf_counter() - start) / iterations * 1e6
+            client.delete(key)
+        return row
@@ -0,0 +1,118 @@
+"""
+Benchmark de la importación masiva de proyectos (manager/importers.py).
+
+Genera un CSV sintético (por defecto 100.000 filas, con clientes repetidos
+escritos con distintas mayúsculas/acentos/formatos de teléfono y un 1% de
+filas inválidas), lo importa con ``import_projects`` y compara contra el
+camino actual fila a fila (``Client.objects.create`` + ``Project.objects.create``)
+medido sobre una muestra y extrapolado.
+
+Todo corre dentro de una transacción que se revierte al final: no deja
+datos en la base.
+
+Uso:
+    python manage.py benchmark_import
+    python manage.py benchmark_import --rows 20000 --chunk-size 2000
+"""
+import csv
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from manager.importers import import_projects
+from manager.models import Client, Project
+from users.models import CustomUser
+
+CLIENT_NAMES = ['Constructora Córdoba', 'Hormigones del Sur', 'Obras Núñez', 'Estudio Peña', 'Desarrollos Río']
+
+
+class Command(BaseCommand):
+    help = 'Mide la importación masiva de proyectos vs la creación fila a fila'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100_000, help='Filas del CSV (default: 100000)')
+        parser.add_argument('--clients', type=int, default=2_000, help='Clientes distintos (default: 2000)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Filas por bulk_create')
+        parser.add_argument(
+            '--naive-sample',
+            type=int,
+            default=1000,
+            help='Filas a crear una por una para estimar el camino actual (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        with tempfile.NamedTemporaryFile('w+', suffix='.csv', newline='', encoding='utf-8') as tmp:
+            self._write_csv(tmp, rows, options['clients'])
+            tmp.flush()
+
+            with transaction.atomic():
+                user = CustomUser.objects.create(
+                    username='benchmark_import', first_name='Bench', last_name='Mark', phone='0000000000',
+                )
+
+                with open(tmp.name, 'rb') as fileobj, CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    result = import_projects(user, fileobj, 'benchmark.csv', chunk_size=options['chunk_size'])
+                    bulk_seconds = time.perf_counter() - start
+
+                self.stdout.write(
+                    f'bulk:        {rows} filas en {bulk_seconds:6.2f} s '
+                    f'({rows / bulk_seconds:,.0f} filas/s), {len(queries)} queries\n'
+                    f'             {result.created_projects} proyectos, {result.created_clients} clientes, '
+                    f'{result.error_count} filas con errores'
+                )
+
+                naive_seconds = self._time_naive(user, options['naive_sample'])
+                estimate = naive_seconds / options['naive_sample'] * rows
+                self.stdout.write(
+                    f'fila a fila: {options["naive_sample"]} filas en {naive_seconds:6.2f} s '
+                    f'-> ~{estimate:,.0f} s estimados para {rows} filas (x{estimate / bulk_seconds:.0f})'
+                )
+
+                transaction.set_rollback(True)
+
+    def _write_csv(self, fileobj, rows, clients):
+        """CSV con clientes repetidos en variantes que deben deduplicarse."""
+        rng = random.Random(42)
+        writer = csv.writer(fileobj)
+        writer.writerow(['Nombre', 'Cliente', 'Teléfono', 'Ubicación', 'Fecha de inicio', 'Fecha de fin', 'Activo'])
+        start = date(2015, 1, 1)
+        for i in range(rows):
+            client_index = rng.randrange(clients)
+            client_name = f'{CLIENT_NAMES[client_index % len(CLIENT_NAMES)]} {client_index}'
+            phone = f'351{client_index:07d}'
+            if rng.random() < 0.5:
+                # Misma persona, escrita distinto
+                client_name = f'  {client_name.upper()} '
+                phone = f'(351) {phone[3:6]}-{phone[6:]}'
+            start_date = start + timedelta(days=rng.randrange(3650))
+            writer.writerow([
+                f'Obra {i}',
+                client_name,
+                phone,
+                f'Calle {rng.randrange(5000)}, Córdoba',
+                # 1% de filas con fecha inválida
+                'sin fecha' if i % 100 == 99 else start_date.strftime('%d/%m/%Y'),
+                (start_date + timedelta(days=180)).isoformat() if i % 3 else '',
+                'sí' if i % 4 else 'no',
+            ])
+
+    def _time_naive(self, user, sample):
+        """El camino de create_project_view: un INSERT de cliente y uno de proyecto por fila."""
+        start = time.perf_counter()
+        for i in range(sample):
+            client = Client.objects.create(user=user, name=f'Cliente {i}', phone='3510000000')
+            Project.objects.create(
+                user=user,
+                client=client,
+                name=f'Obra fila a fila {i}',
+                location='Córdoba',
+                start_date=date(2020, 1, 1),
+            )
+        return time.perf_counter() - start
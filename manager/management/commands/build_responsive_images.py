@@ -0,0 +1,81 @@
+"""
+Comando de gestión que genera las variantes responsive (AVIF/WebP) de las
+imágenes estáticas, antes de collectstatic.
+
+Es incremental: solo regenera variantes que falten o sean más viejas que su
+original. Con ``--collectstatic`` ejecuta collectstatic al terminar, así el
+build de Railway queda en un solo paso.
+
+Uso:
+    python manage.py build_responsive_images
+    python manage.py build_responsive_images --force
+    python manage.py build_responsive_images --collectstatic --settings=majobacore.settings.production
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from majobacore.utils.images import available_formats, build_variants, get_config, get_output_root
+
+logger = logging.getLogger('majobacore')
+
+
+class Command(BaseCommand):
+    help = 'Genera variantes AVIF/WebP a varios anchos de static/images (y opcionalmente collectstatic)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerar todas las variantes aunque estén al día',
+        )
+        parser.add_argument(
+            '--collectstatic',
+            action='store_true',
+            help='Ejecutar collectstatic --noinput al terminar',
+        )
+
+    def handle(self, *args, **options):
+        config = get_config()
+        formats = available_formats(config['FORMATS'])
+        if not formats:
+            raise CommandError(
+                f"Pillow no puede escribir ninguno de los formatos {config['FORMATS']}"
+            )
+        missing = set(config['FORMATS']) - set(formats)
+        if missing:
+            self.stdout.write(self.style.WARNING(f'Formatos no soportados por Pillow: {sorted(missing)}'))
+
+        verbose = options['verbosity'] > 1
+        manifest = build_variants(force=options['force'], stdout=self.stdout if verbose else None)
+
+        self._report(manifest, formats)
+        logger.info(f"Variantes responsive generadas para {len(manifest)} imágenes")
+
+        if options['collectstatic']:
+            # settings solo suma RESPONSIVE_IMAGES_ROOT a STATICFILES_DIRS si
+            # ya existía al arrancar: en el primer build se agrega acá.
+            output_root = get_output_root()
+            if output_root not in settings.STATICFILES_DIRS:
+                settings.STATICFILES_DIRS.append(output_root)
+            call_command('collectstatic', interactive=False, verbosity=options['verbosity'])
+
+    def _report(self, manifest, formats):
+        """Bytes originales vs la variante más angosta de cada formato."""
+        original_total = sum(entry['bytes'] for entry in manifest.values())
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'{len(manifest)} imágenes, {original_total / 1024:.0f} KiB originales'
+        ))
+        for fmt in formats:
+            mobile_total = 0
+            for entry in manifest.values():
+                candidates = entry['variants'].get(fmt) or []
+                # Lo que descarga un teléfono: la primera variante (la más angosta)
+                mobile_total += candidates[0][2] if candidates else entry['bytes']
+            self.stdout.write(
+                f'  {fmt:<5} variante más angosta: {mobile_total / 1024:8.0f} KiB '
+                f'({100 * (1 - mobile_total / original_total):.0f}% menos)'
+            )
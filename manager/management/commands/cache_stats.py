@@ -0,0 +1,110 @@
+"""
+Hit ratios del cache en dos niveles (majobacore/utils/tiered_cache.py).
+
+Cada worker suma sus contadores en Redis cada ``STATS_FLUSH_INTERVAL``
+segundos; este comando muestra el total por namespace: hits del LRU local,
+hits de Redis y misses (lecturas de la base).
+
+``--benchmark`` mide en este proceso la latencia de un hit local y de uno de
+Redis para un valor del tamaño de una fila de usuario.
+
+Uso:
+    python manage.py cache_stats
+    python manage.py cache_stats --reset
+    python manage.py cache_stats --benchmark 10000
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from majobacore.utils import tiered_cache
+from majobacore.utils.tiered_cache import TieredCache
+
+# Valor del tamaño de una fila de CustomUser (sin password)
+SAMPLE_VALUE = {
+    'id': 7,
+    'username': 'jperez',
+    'first_name': 'Juan',
+    'last_name': 'Pérez',
+    'email': 'jperez@example.com',
+    'phone': '3511234567',
+    'profession': 'Arquitecto',
+    'direction': 'Av. Colón 1234, Córdoba',
+    'is_active': True,
+    'is_staff': False,
+    'is_superuser': False,
+}
+
+
+class Command(BaseCommand):
+    help = 'Muestra los hit ratios del cache en dos niveles sumados de todos los workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Pone los contadores compartidos en cero',
+        )
+        parser.add_argument(
+            '--benchmark',
+            type=int,
+            metavar='N',
+            help='Mide N lecturas con hit local y N con hit de Redis en este proceso',
+        )
+
+    def handle(self, *args, **options):
+        client = tiered_cache._get_redis_client()
+
+        if options['benchmark']:
+            self._benchmark(options['benchmark'], client)
+            return
+
+        if client is None:
+            self.stdout.write(self.style.WARNING(
+                'Cache sin Redis: no hay contadores compartidos (cada proceso cuenta los suyos)'
+            ))
+            return
+
+        if options['reset']:
+            tiered_cache.reset_shared_stats(client)
+            self.stdout.write(self.style.SUCCESS('Contadores del cache en dos niveles en cero.'))
+            return
+
+        stats = tiered_cache.shared_stats(client)
+        if not stats:
+            self.stdout.write('Sin lecturas registradas todavía.')
+            return
+
+        self.stdout.write(f'{"namespace":<16} {"local":>10} {"redis":>10} {"base":>10} {"hit local":>10} {"hit total":>10}')
+        for namespace, counters in sorted(stats.items()):
+            total = sum(counters.values())
+            local, shared, misses = counters['local_hits'], counters['cache_hits'], counters['misses']
+            self.stdout.write(
+                f'{namespace:<16} {local:>10} {shared:>10} {misses:>10} '
+                f'{local / total:>10.1%} {(local + shared) / total:>10.1%}'
+            )
+
+    def _benchmark(self, iterations, client):
+        """Latencia por lectura de ``get_or_set`` con hit local y con hit de Redis."""
+        bench = TieredCache('benchmark', timeout=60, local_timeout=60)
+        bench.get_or_set('sample', lambda: SAMPLE_VALUE)
+
+        if client is not None:
+            # El LRU se usa recién con la suscripción a invalidaciones activa
+            tiered_cache._local_enabled()
+            tiered_cache._subscribed.wait(timeout=5)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            bench.get_or_set('sample', lambda: SAMPLE_VALUE)
+        local_us = (time.perf_counter() - start) / iterations * 1e6
+
+        tiered_cache._lru.clear()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            tiered_cache._lru.delete(bench.make_key('sample'))
+            bench.get_or_set('sample', lambda: SAMPLE_VALUE)
+        shared_us = (time.perf_counter() - start) / iterations * 1e6
+
+        self.stdout.write(f'hit local: {local_us:8.2f} µs/lectura')
+        self.stdout.write(f'hit Redis: {shared_us:8.2f} µs/lectura (x{shared_us / local_us:.0f})')
@@ -0,0 +1,507 @@
+"""
+Genera datos sintéticos realistas para pruebas de carga y de escala.
+
+Cada usuario ``<prefix>_000001``, ``<prefix>_000002``, ... tiene su
+ManagerData, clientes, proyectos con texto en castellano y notificaciones
+(las viejas casi siempre leídas), con fechas repartidas en los últimos
+``--days`` días. Todos comparten la contraseña ``--password`` (se hashea una
+sola vez), que es la que usan los escenarios de loadtest/locustfile.py.
+
+Inserción:
+
+- Por defecto ``bulk_create`` en lotes de ``--batch-size`` (cualquier base).
+- ``--copy`` (solo PostgreSQL): ``COPY ... FROM STDIN`` con el CSV generado
+  al vuelo, sin instanciar modelos. Es el camino para decenas de millones
+  de filas (10M de notificaciones en pocos minutos).
+
+En los dos casos las filas se generan de a una (no se arman listas con todo)
+y cada tabla se inserta en su propia transacción.
+
+Distribuciones:
+
+- ``--clients-per-user``, ``--projects-per-user`` y
+  ``--notifications-per-user`` son promedios. Con ``--skew S`` (> 0) se
+  reparten con una ley de Zipf (peso ``1/rank^S`` con el rank sorteado):
+  pocos usuarios concentran la mayoría de las filas, como en producción.
+  ``--max-per-user`` acota al usuario más cargado.
+- Puntos de ManagerData: Pareto con forma ``--points-alpha`` (más chico,
+  cola más larga); el nivel sale de los mismos umbrales que ManagerData.
+
+Con la misma ``--seed`` el contenido es siempre el mismo; cada tabla tiene
+su propio generador, así cambiar la cantidad de notificaciones no cambia los
+proyectos. ``bulk_create`` y ``COPY`` no disparan señales: si el servidor ya
+estaba corriendo con cache, vaciarlo.
+
+Uso:
+    python manage.py generate_fake_data --users 1000
+    python manage.py generate_fake_data --users 200 --projects-per-user 50 --seed 7
+    python manage.py generate_fake_data --users 100000 --notifications-per-user 100 \\
+        --skew 1.1 --max-per-user 200000 --copy          # ~10M de notificaciones
+    python manage.py generate_fake_data --clear          # solo borra los usuarios de prueba
+"""
+import csv
+import datetime
+import io
+import random
+import time
+from contextlib import contextmanager
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models.fields import AutoFieldMixin
+from django.utils import timezone
+
+from manager.models import Client, ManagerData, Notification, NotificationArchive, Project
+from manager.retention import create_month_partitions, is_partitioned
+from users.models import CustomUser
+
+DEFAULT_PREFIX = 'loadtest'
+DEFAULT_PASSWORD = 'loadtest-1234'
+
+# Filas por trozo de CSV enviado a COPY
+COPY_CHUNK_ROWS = 10_000
+
+FIRST_NAMES = [
+    'Juan', 'María', 'Carlos', 'Lucía', 'Martín', 'Sofía', 'Diego', 'Valentina',
+    'Santiago', 'Camila', 'Federico', 'Florencia', 'Nicolás', 'Agustina', 'Matías',
+    'Julieta', 'Pablo', 'Carolina', 'Gonzalo', 'Romina',
+]
+LAST_NAMES = [
+    'González', 'Rodríguez', 'Fernández', 'López', 'Martínez', 'Pérez', 'Gómez',
+    'Sánchez', 'Romero', 'Díaz', 'Álvarez', 'Torres', 'Ruiz', 'Ramírez', 'Flores',
+    'Acosta', 'Benítez', 'Medina', 'Herrera', 'Suárez',
+]
+PROFESSIONS = ['Arquitecto', 'Ingeniero civil', 'Maestro mayor de obras', 'Agrimensor', 'Constructor']
+STREETS = ['Av. Colón', 'Bv. San Juan', 'Av. Vélez Sarsfield', 'Duarte Quirós', 'Av. Rafael Núñez', 'Obispo Trejo']
+NEIGHBORHOODS = ['Nueva Córdoba', 'General Paz', 'Alberdi', 'Cerro de las Rosas', 'Güemes', 'Alta Córdoba', 'Villa Allende']
+CLIENT_KINDS = ['Constructora', 'Estudio', 'Inmobiliaria', 'Desarrollos', 'Consorcio']
+PROJECT_KINDS = [
+    'Vivienda unifamiliar', 'Ampliación de local comercial', 'Edificio de departamentos',
+    'Relevamiento planialtimétrico', 'Mensura y subdivisión', 'Refacción integral',
+    'Nave industrial', 'Cálculo estructural', 'Dirección de obra',
+]
+PROJECT_DETAILS = [
+    'Incluye cómputo y presupuesto de materiales.',
+    'Plano municipal con presentación en Obras Privadas.',
+    'Fundaciones con pilotes y vigas de encadenado.',
+    'Estructura de hormigón armado en tres niveles.',
+    'Instalaciones sanitarias y eléctricas completas.',
+    'Relevamiento con estación total y nivelación geométrica.',
+    'Seguimiento semanal de avance con el comitente.',
+    'Documentación conforme a obra para final de obra.',
+]
+NOTIFICATION_MESSAGES = [
+    ('Puntos acreditados', 'Se acreditaron {points} puntos por un proyecto de {kind} en {place}.'),
+    ('Nuevo nivel', 'Alcanzaste un nuevo nivel de cuenta.'),
+    ('Proyecto actualizado', 'El proyecto de {kind} en {place} cambió de estado.'),
+    ('Canje de puntos', 'Se descontaron {points} puntos por un canje.'),
+]
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """Permite fijar ``created_at``/``updated_at`` en ``bulk_create`` (sin auto_now)."""
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def level_for_points(points):
+    """Nivel de cuenta que corresponde a ``points`` (mismos umbrales que ManagerData)."""
+    if points >= 10000:
+        return 'maestro'
+    if points >= 5000:
+        return 'experto'
+    if points >= 2000:
+        return 'avanzado'
+    if points >= 500:
+        return 'intermedio'
+    return 'principiante'
+
+
+def per_user_counts(rng, users, mean, skew=0.0, cap=None):
+    """
+    Cantidad de filas de cada usuario con promedio ``mean``.
+
+    Con ``skew`` 0 todos reciben ``mean`` (redondeado al azar si no es
+    entero); con ``skew`` > 0 se reparte con Zipf sobre un rank sorteado.
+    """
+    if users == 0:
+        return []
+    if skew <= 0:
+        weights = [1.0] * users
+    else:
+        ranks = list(range(1, users + 1))
+        rng.shuffle(ranks)
+        weights = [rank ** -skew for rank in ranks]
+    scale = mean * users / sum(weights)
+    # Redondeo estocástico: el total esperado se mantiene en mean * users
+    counts = [int(weight * scale + rng.random()) for weight in weights]
+    if cap is not None:
+        counts = [min(count, cap) for count in counts]
+    return counts
+
+
+def insert_columns(model):
+    """Campos concretos que se insertan (todos menos el id autoincremental)."""
+    return [field for field in model._meta.concrete_fields if not isinstance(field, AutoFieldMixin)]
+
+
+class CSVStream:
+    """Archivo de solo lectura con el CSV de ``rows`` generado a medida que COPY lo lee."""
+
+    def __init__(self, rows, attnames):
+        self._chunks = self._generate(rows, attnames)
+        self._buffer = ''
+        self.count = 0
+
+    def _generate(self, rows, attnames):
+        buffer = io.StringIO()
+        # Strings entre comillas: '' es string vacío y un campo sin nada es NULL
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+        pending = 0
+        for row in rows:
+            writer.writerow([row[name] for name in attnames])
+            pending += 1
+            if pending == COPY_CHUNK_ROWS:
+                self.count += pending
+                pending = 0
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        self.count += pending
+        yield buffer.getvalue()
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def chunks(self):
+        yield from self._chunks
+
+
+class Command(BaseCommand):
+    help = 'Genera usuarios de prueba con clientes, proyectos y notificaciones (pruebas de carga y escala)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='Usuarios a crear (default: 100)')
+        parser.add_argument(
+            '--clients-per-user',
+            type=float,
+            default=3,
+            help='Clientes por usuario, promedio (default: 3)',
+        )
+        parser.add_argument(
+            '--projects-per-user',
+            type=float,
+            default=10,
+            help='Proyectos por usuario, promedio (default: 10)',
+        )
+        parser.add_argument(
+            '--notifications-per-user',
+            type=float,
+            default=20,
+            help='Notificaciones por usuario, promedio (default: 20)',
+        )
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=0.0,
+            help='Exponente de Zipf del reparto por usuario; 0 = uniforme (default: 0)',
+        )
+        parser.add_argument(
+            '--max-per-user',
+            type=int,
+            help='Tope de clientes/proyectos/notificaciones de un mismo usuario',
+        )
+        parser.add_argument(
+            '--points-alpha',
+            type=float,
+            default=1.2,
+            help='Forma de la Pareto de puntos de ManagerData (default: 1.2)',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help='Días hacia atrás en los que se reparten las fechas (default: 365)',
+        )
+        parser.add_argument('--seed', type=int, default=42, help='Semilla del generador (default: 42)')
+        parser.add_argument(
+            '--prefix',
+            default=DEFAULT_PREFIX,
+            help=f'Prefijo de los usernames (default: {DEFAULT_PREFIX})',
+        )
+        parser.add_argument(
+            '--password',
+            default=DEFAULT_PASSWORD,
+            help=f'Contraseña de todos los usuarios (default: {DEFAULT_PASSWORD})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Filas por INSERT de bulk_create (default: 5000)',
+        )
+        parser.add_argument(
+            '--copy',
+            action='store_true',
+            help='Insertar con COPY FROM STDIN (solo PostgreSQL)',
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Borra los usuarios con el prefijo (y sus datos) antes de generar; con --users 0 solo borra',
+        )
+
+    def handle(self, *args, **options):
+        if options['copy'] and connection.vendor != 'postgresql':
+            raise CommandError('--copy requiere PostgreSQL')
+        if options['days'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--days y --batch-size tienen que ser mayores que 0')
+
+        prefix = options['prefix']
+        self.users_qs = CustomUser.objects.filter(username__startswith=f'{prefix}_')
+
+        if options['clear']:
+            self._clear()
+        elif self.users_qs.exists():
+            raise CommandError(f'Ya hay usuarios "{prefix}_*": usar --clear para regenerarlos')
+
+        if options['users'] <= 0:
+            return
+
+        self.options = options
+        self.now = timezone.now()
+        self.span = options['days'] * 86400
+        start = time.monotonic()
+
+        if connection.vendor == 'postgresql' and is_partitioned():
+            # Cada mes con su partición: las filas no caen en la DEFAULT
+            create_month_partitions((self.now - datetime.timedelta(days=options['days'])).date(), self.now.date())
+
+        totals = {}
+        totals['usuarios'] = self._insert(CustomUser, self._user_rows())
+        users = list(self.users_qs.order_by('pk').values_list('pk', 'date_joined'))
+        totals['managers'] = self._insert(ManagerData, self._manager_rows(users))
+        totals['clientes'] = self._insert(Client, self._client_rows(users))
+        clients = self._clients_by_user()
+        totals['proyectos'] = self._insert(Project, self._project_rows(users, clients))
+        totals['notificaciones'] = self._insert(Notification, self._notification_rows(users))
+
+        elapsed = time.monotonic() - start
+        rows = sum(totals.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'{rows} filas en {elapsed:.1f} s ({rows / elapsed:,.0f} filas/s): '
+            + ', '.join(f'{count} {name}' for name, count in totals.items())
+            + f' (contraseña: {options["password"]})'
+        ))
+
+    # -----------------------------------------------------------------------
+    # Inserción
+    # -----------------------------------------------------------------------
+
+    def _rng(self, table):
+        # Un generador por tabla: las demás no cambian si cambia una cantidad
+        return random.Random(f'{self.options["seed"]}:{table}')
+
+    def _past(self, rng, after=None):
+        """Fecha al azar en la ventana de ``--days`` (posterior a ``after`` si se da)."""
+        if after is None:
+            return self.now - datetime.timedelta(seconds=rng.random() * self.span)
+        return after + (self.now - after) * rng.random()
+
+    def _insert(self, model, rows):
+        """Inserta ``rows`` (dicts ``attname -> valor``) y retorna cuántas filas fueron."""
+        start = time.monotonic()
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit TO OFF')
+            if self.options['copy']:
+                count = self._copy(model, rows)
+            else:
+                count = self._bulk_create(model, rows)
+        elapsed = time.monotonic() - start
+        self.stdout.write(
+            f'  {model._meta.db_table}: {count} filas en {elapsed:.1f} s '
+            f'({count / elapsed if elapsed else 0:,.0f} filas/s)'
+        )
+        return count
+
+    def _bulk_create(self, model, rows):
+        timestamps = [
+            field for field in model._meta.concrete_fields
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+        ]
+        batch_size = self.options['batch_size']
+        count = 0
+        batch = []
+        with explicit_timestamps(*timestamps):
+            for row in rows:
+                batch.append(model(**row))
+                if len(batch) == batch_size:
+                    model.objects.bulk_create(batch, batch_size=batch_size)
+                    count += len(batch)
+                    batch = []
+            model.objects.bulk_create(batch, batch_size=batch_size)
+        return count + len(batch)
+
+    def _copy(self, model, rows):
+        fields = insert_columns(model)
+        # COPY no aplica los defaults de Django: completar lo que falte
+        defaults = {field.attname: field.get_default() for field in fields}
+        stream = CSVStream(({**defaults, **row} for row in rows), [field.attname for field in fields])
+        quote = connection.ops.quote_name
+        sql = (
+            f'COPY {quote(model._meta.db_table)} ({", ".join(quote(field.column) for field in fields)}) '
+            'FROM STDIN WITH (FORMAT csv)'
+        )
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy_expert'):
+                # psycopg2
+                cursor.cursor.copy_expert(sql, stream, size=1 << 20)
+            else:  # pragma: no cover - psycopg 3
+                with cursor.cursor.copy(sql) as copy:
+                    for chunk in stream.chunks():
+                        copy.write(chunk)
+        return stream.count
+
+    def _clear(self):
+        """Borra los usuarios de prueba; las tablas grandes con DELETE directo (sin señales)."""
+        start = time.monotonic()
+        user_ids_sql, params = self.users_qs.values('pk').query.sql_with_params()
+        quote = connection.ops.quote_name
+        # Orden por FKs: Project protege a Client
+        with transaction.atomic(), connection.cursor() as cursor:
+            for model in (Notification, NotificationArchive, Project, Client, ManagerData):
+                cursor.execute(
+                    f'DELETE FROM {quote(model._meta.db_table)} WHERE user_id IN ({user_ids_sql})',
+                    params,
+                )
+            # Los usuarios por el ORM: quedan sus tokens y demás relaciones chicas
+            deleted, _ = self.users_qs.delete()
+        self.stdout.write(
+            f'Borrados {deleted} registros de usuarios de prueba y sus datos en {time.monotonic() - start:.1f} s.'
+        )
+
+    # -----------------------------------------------------------------------
+    # Filas
+    # -----------------------------------------------------------------------
+
+    def _user_rows(self):
+        rng = self._rng('users')
+        prefix = self.options['prefix']
+        password_hash = make_password(self.options['password'])
+        for i in range(1, self.options['users'] + 1):
+            joined = self._past(rng)
+            username = f'{prefix}_{i:06d}'
+            yield {
+                'username': username,
+                'password': password_hash,
+                'email': f'{username}@example.com',
+                'first_name': rng.choice(FIRST_NAMES),
+                'last_name': rng.choice(LAST_NAMES),
+                'phone': f'351{rng.randrange(10**7):07d}',
+                'profession': rng.choice(PROFESSIONS),
+                'direction': f'{rng.choice(STREETS)} {rng.randrange(100, 5000)}, Córdoba',
+                'is_active': True,
+                'date_joined': joined,
+                'created_at': joined,
+                'updated_at': joined,
+            }
+
+    def _manager_rows(self, users):
+        rng = self._rng('managers')
+        alpha = self.options['points_alpha']
+        for user_id, joined in users:
+            # Pocos usuarios con muchos puntos: la mayoría queda en los primeros niveles
+            points = min(int(rng.paretovariate(alpha) * 100) - 100, 20000)
+            yield {
+                'user_id': user_id,
+                'points': points,
+                'acc_level': level_for_points(points),
+                'notifications': 0,
+                'created_at': joined,
+                'updated_at': self._past(rng, after=joined),
+            }
+
+    def _counts(self, rng, users, mean):
+        return per_user_counts(rng, len(users), mean, self.options['skew'], self.options['max_per_user'])
+
+    def _client_rows(self, users):
+        rng = self._rng('clients')
+        counts = self._counts(rng, users, self.options['clients_per_user'])
+        for (user_id, joined), count in zip(users, counts):
+            # Todo usuario con proyectos necesita al menos un cliente
+            for _ in range(max(count, 1)):
+                yield {
+                    'user_id': user_id,
+                    'name': f'{rng.choice(CLIENT_KINDS)} {rng.choice(LAST_NAMES)}',
+                    'phone': f'351{rng.randrange(10**7):07d}',
+                    'created_at': self._past(rng, after=joined),
+                }
+
+    def _clients_by_user(self):
+        clients = {}
+        queryset = Client.objects.filter(user__in=self.users_qs).order_by('pk').values_list('user_id', 'pk')
+        for user_id, client_id in queryset.iterator(chunk_size=10_000):
+            clients.setdefault(user_id, []).append(client_id)
+        return clients
+
+    def _project_rows(self, users, clients):
+        rng = self._rng('projects')
+        counts = self._counts(rng, users, self.options['projects_per_user'])
+        for (user_id, joined), count in zip(users, counts):
+            user_clients = clients[user_id]
+            for _ in range(count):
+                created = self._past(rng, after=joined)
+                start_date = created.date() + datetime.timedelta(days=rng.randrange(30))
+                finished = rng.random() < 0.3
+                yield {
+                    'user_id': user_id,
+                    'client_id': rng.choice(user_clients),
+                    'name': f'{rng.choice(PROJECT_KINDS)} en {rng.choice(NEIGHBORHOODS)}',
+                    'description': ' '.join(rng.sample(PROJECT_DETAILS, rng.randint(1, 4))),
+                    'location': f'{rng.choice(STREETS)} {rng.randrange(100, 5000)}, {rng.choice(NEIGHBORHOODS)}',
+                    'start_date': start_date,
+                    'end_date': start_date + datetime.timedelta(days=rng.randrange(30, 400)) if finished else None,
+                    'is_active': not finished,
+                    'created_at': created,
+                    'updated_at': self._past(rng, after=created),
+                }
+
+    def _notification_rows(self, users):
+        rng = self._rng('notifications')
+        counts = self._counts(rng, users, self.options['notifications_per_user'])
+        for (user_id, joined), count in zip(users, counts):
+            for _ in range(count):
+                message, description = rng.choice(NOTIFICATION_MESSAGES)
+                created = self._past(rng, after=joined)
+                age_days = (self.now - created).days
+                yield {
+                    'user_id': user_id,
+                    'message': message,
+                    'description': description.format(
+                        points=rng.choice((50, 100, 250, 500)),
+                        kind=rng.choice(PROJECT_KINDS).lower(),
+                        place=rng.choice(NEIGHBORHOODS),
+                    ),
+                    # Las viejas casi siempre están leídas
+                    'is_read': rng.random() < min(0.95, age_days / 60),
+                    'created_at': created,
+                }
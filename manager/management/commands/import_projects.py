@@ -0,0 +1,77 @@
+"""
+Comando de gestión para importar proyectos y clientes de un CSV/XLSX.
+
+Misma lógica que ``POST /api/v1/projects/import/`` (manager/importers.py):
+lectura en streaming, clientes deduplicados por nombre y teléfono
+normalizados y ``bulk_create`` por lotes dentro de una transacción. Las
+filas con errores se omiten y se listan al final.
+
+Uso:
+    python manage.py import_projects <username> proyectos.csv
+    python manage.py import_projects <username> historico.xlsx --dry-run
+    python manage.py import_projects <username> proyectos.csv --chunk-size 5000
+"""
+
+import logging
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from manager.importers import DEFAULT_CHUNK_SIZE, ImportFormatError, import_projects
+
+logger = logging.getLogger('manager')
+
+
+class Command(BaseCommand):
+    help = 'Importa proyectos (y sus clientes) desde un archivo CSV o XLSX'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='Usuario dueño de los proyectos importados')
+        parser.add_argument('path', help='Archivo .csv (UTF-8) o .xlsx')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f'Filas por bulk_create (default: {DEFAULT_CHUNK_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validar el archivo sin escribir en la base',
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"El usuario '{options['username']}' no existe")
+
+        path = Path(options['path'])
+        if not path.is_file():
+            raise CommandError(f'No se encontró el archivo {path}')
+
+        try:
+            with path.open('rb') as fileobj:
+                result = import_projects(
+                    user,
+                    fileobj,
+                    path.name,
+                    chunk_size=options['chunk_size'],
+                    dry_run=options['dry_run'],
+                )
+        except ImportFormatError as exc:
+            raise CommandError(str(exc))
+
+        for error in result.errors:
+            self.stdout.write(self.style.WARNING(f"  fila {error['row']}: {'; '.join(error['errors'])}"))
+        if result.error_count > len(result.errors):
+            self.stdout.write(f'  ... y {result.error_count - len(result.errors)} filas más con errores')
+
+        prefix = '[dry run] ' if result.dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}{result.rows} filas: {result.created_projects} proyectos, '
+            f'{result.created_clients} clientes nuevos, {result.reused_clients} filas con cliente '
+            f'existente, {result.error_count} filas con errores'
+        ))
@@ -0,0 +1,59 @@
+"""
+Comando de gestión para el particionado mensual de ``manager_notification``
+por ``created_at`` (solo PostgreSQL, opcional).
+
+``--convert`` convierte la tabla existente (una vez, con la tabla bloqueada
+durante la copia: correrlo en una ventana de mantenimiento). Sin
+``--convert`` crea las particiones del mes actual y los siguientes
+``--months-ahead`` meses; conviene programarlo mensualmente junto a
+``archive_notifications``.
+
+Uso:
+    python manage.py partition_notifications --convert
+    python manage.py partition_notifications --months-ahead 3
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from manager.retention import convert_to_partitioned, ensure_future_partitions, is_partitioned
+
+logger = logging.getLogger('manager')
+
+
+class Command(BaseCommand):
+    help = 'Particiona manager_notification por mes (PostgreSQL) y crea las particiones futuras'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert',
+            action='store_true',
+            help='Convertir la tabla actual en particionada (copia todas las filas)',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Meses futuros con partición creada (default: 3)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('El particionado de notificaciones requiere PostgreSQL')
+
+        if is_partitioned():
+            if options['convert']:
+                self.stdout.write('La tabla ya está particionada; solo se crean particiones futuras')
+            partitions = ensure_future_partitions(options['months_ahead'])
+        elif options['convert']:
+            partitions = convert_to_partitioned(options['months_ahead'])
+        else:
+            raise CommandError(
+                'manager_notification no está particionada: usar --convert para convertirla'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Particiones al día: {partitions[0]} ... {partitions[-1]} ({len(partitions)})"
+        ))
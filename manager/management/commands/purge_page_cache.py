@@ -0,0 +1,29 @@
+"""
+Comando de gestión para invalidar el full-page cache de las páginas públicas.
+
+Cada deploy ya usa claves nuevas (``DEPLOY_VERSION``); este comando además
+cambia la versión de páginas en cache, así que también cubre deploys sin
+variable de versión y purgas manuales (ej: tras editar un template en caliente).
+Se ejecuta en el arranque del Procfile.
+
+Uso:
+    python manage.py purge_page_cache
+    python manage.py purge_page_cache --settings=majobacore.settings.production
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from majobacore.utils.cache import purge_page_cache
+
+logger = logging.getLogger('majobacore')
+
+
+class Command(BaseCommand):
+    help = 'Invalida todas las páginas públicas cacheadas (anonymous_cache_page)'
+
+    def handle(self, *args, **options):
+        purge_page_cache()
+        logger.info("Cache de páginas públicas invalidado")
+        self.stdout.write(self.style.SUCCESS('Cache de páginas públicas invalidado.'))
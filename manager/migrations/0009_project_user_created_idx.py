@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0008_alter_client_phone_blank_default"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"], name="project_user_created_idx"
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from users.models import CustomUser
 # Create your models here.
 
@@ -57,10 +58,48 @@ class Project(models.Model):
         verbose_name = 'Proyecto'
         verbose_name_plural = 'Proyectos'
         ordering = ['-created_at']
+        indexes = [
+            # Listado por usuario paginado por keyset (manager.pagination)
+            models.Index(fields=['user', '-created_at', '-id'], name='project_user_created_idx'),
+        ]
     
     def __str__(self):
         return self.name
 
+def humanize_time_elapsed(created_at, now=None):
+    """
+    Formatea en español el tiempo transcurrido desde ``created_at``.
+
+    Args:
+        created_at (datetime): Fecha de creación (aware).
+        now (datetime | None): Instante de referencia; por defecto ``timezone.now()``.
+
+    Returns:
+        str: Cadena legible como "ahora", "hace 5 minutos", "hace 2 horas", etc.
+    """
+    if now is None:
+        now = timezone.now()
+    segundos = int((now - created_at).total_seconds())
+
+    if segundos < 60:
+        return "ahora"
+    elif segundos < 3600:
+        minutos = segundos // 60
+        return f"hace {minutos} {'minuto' if minutos == 1 else 'minutos'}"
+    elif segundos < 86400:
+        horas = segundos // 3600
+        return f"hace {horas} {'hora' if horas == 1 else 'horas'}"
+    elif segundos < 2592000:
+        dias = segundos // 86400
+        return f"hace {dias} {'día' if dias == 1 else 'días'}"
+    elif segundos < 31536000:
+        meses = segundos // 2592000
+        return f"hace {meses} {'mes' if meses == 1 else 'meses'}"
+    else:
+        años = segundos // 31536000
+        return f"hace {años} {'año' if años == 1 else 'años'}"
+
+
 class Notification(models.Model):
     user = models.ForeignKey(
         CustomUser,
@@ -78,42 +117,68 @@ class Notification(models.Model):
         verbose_name = 'Notificación'
         verbose_name_plural = 'Notificaciones'
         ordering = ['-created_at']
+        indexes = [
+            # Listado por usuario (API y panel de cuenta)
+            models.Index(fields=['user', '-created_at'], name='notification_user_created_idx'),
+            # unread-count y mark-all-read: solo las no leídas
+            models.Index(
+                fields=['user'],
+                name='notification_user_unread_idx',
+                condition=models.Q(is_read=False),
+            ),
+        ]
     
-    def time_elapsed(self):
+    def time_elapsed(self, now=None):
         """
         Devuelve el tiempo transcurrido desde la creación de la notificación en español.
 
+        Args:
+            now (datetime | None): Instante de referencia. Al renderizar muchas
+                notificaciones conviene pasar el mismo ``now`` a todas.
+
         Returns:
             str: Cadena legible como "ahora", "hace 5 minutos", "hace 2 horas", etc.
         """
-        from django.utils import timezone
-
-        ahora = timezone.now()
-        diferencia = ahora - self.created_at
-        segundos = int(diferencia.total_seconds())
-
-        if segundos < 60:
-            return "ahora"
-        elif segundos < 3600:
-            minutos = segundos // 60
-            return f"hace {minutos} {'minuto' if minutos == 1 else 'minutos'}"
-        elif segundos < 86400:
-            horas = segundos // 3600
-            return f"hace {horas} {'hora' if horas == 1 else 'horas'}"
-        elif segundos < 2592000:
-            dias = segundos // 86400
-            return f"hace {dias} {'día' if dias == 1 else 'días'}"
-        elif segundos < 31536000:
-            meses = segundos // 2592000
-            return f"hace {meses} {'mes' if meses == 1 else 'meses'}"
-        else:
-            años = segundos // 31536000
-            return f"hace {años} {'año' if años == 1 else 'años'}"
+        return humanize_time_elapsed(self.created_at, now)
     
     def __str__(self):
         return f"Notificación para {self.user.username}: {self.message[:20]}"
     
 
+class NotificationArchive(models.Model):
+    """
+    Notificación leída movida fuera de ``manager_notification`` por el
+    comando ``archive_notifications`` (ver manager/retention.py).
+
+    Conserva el id original para poder rastrearla y no se lee desde las
+    vistas: la tabla caliente queda solo con lo reciente o no leído.
+    """
+    id = models.BigIntegerField(primary_key=True, verbose_name='ID original')
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications',
+        verbose_name='Usuario'
+    )
+    message = models.CharField(max_length=255, verbose_name='Mensaje')
+    description = models.TextField(blank=True, verbose_name='Descripción')
+    is_read = models.BooleanField(default=True, verbose_name='Leído')
+
+    created_at = models.DateTimeField(verbose_name='Creada')
+    archived_at = models.DateTimeField(default=timezone.now, verbose_name='Archivada')
+
+    class Meta:
+        verbose_name = 'Notificación archivada'
+        verbose_name_plural = 'Notificaciones archivadas'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='notif_archive_user_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Notificación archivada de {self.user.username}: {self.message[:20]}"
+
+
 class ManagerData(models.Model):
     user = models.OneToOneField(
         CustomUser, 
@@ -0,0 +1,88 @@
+"""
+Paginación por keyset (cursor) para los listados web de la app manager.
+
+A diferencia de OFFSET, cada página se obtiene con un ``WHERE`` sobre la
+última fila vista, así que el costo no crece con el número de página y no se
+repiten ni se saltean filas si se crean proyectos mientras el usuario
+recorre la lista.
+"""
+import base64
+import binascii
+from dataclasses import dataclass
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    """El cursor recibido no tiene el formato esperado."""
+
+
+def encode_cursor(created_at, pk):
+    """Codifica la posición ``(created_at, pk)`` como un token opaco y apto para URL."""
+    raw = f'{created_at.isoformat()}|{pk}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica un token de ``encode_cursor``.
+
+    Returns:
+        tuple[datetime, int]: Posición ``(created_at, pk)`` de la última fila vista.
+
+    Raises:
+        InvalidCursor: Si el token está corrupto o fue manipulado.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, _, pk = base64.urlsafe_b64decode(padded).decode().partition('|')
+        position = parse_datetime(created_at), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor(cursor) from exc
+    if position[0] is None:
+        raise InvalidCursor(cursor)
+    return position
+
+
+@dataclass
+class KeysetPage:
+    """Una página de resultados y el cursor para pedir la siguiente."""
+    object_list: list
+    next_cursor: str | None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+def keyset_paginate(queryset, cursor=None, page_size=24):
+    """
+    Retorna la página de ``queryset`` que sigue a ``cursor``.
+
+    El queryset se ordena por ``-created_at, -id`` (el ``id`` desempata filas
+    creadas en el mismo instante); se lee una fila de más para saber si hay
+    otra página sin hacer un COUNT.
+
+    Args:
+        queryset: QuerySet de un modelo con ``created_at``.
+        cursor (str | None): Token de la página anterior, o None para la primera.
+        page_size (int): Filas por página.
+
+    Raises:
+        InvalidCursor: Si ``cursor`` no es válido.
+    """
+    queryset = queryset.order_by('-created_at', '-id')
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return KeysetPage(rows, None)
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    return KeysetPage(rows, encode_cursor(last.created_at, last.pk))
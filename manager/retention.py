@@ -0,0 +1,278 @@
+"""
+Retención de notificaciones: archivado por lotes y particionado opcional.
+
+``archive_read_notifications`` mueve las notificaciones leídas más viejas que
+N días de ``manager_notification`` a ``manager_notificationarchive``. En
+PostgreSQL cada lote es una sola sentencia::
+
+    WITH moved AS (DELETE ... WHERE id IN (SELECT ... LIMIT n FOR UPDATE SKIP LOCKED)
+                   RETURNING ...)
+    INSERT INTO archive SELECT ... FROM moved
+
+y corre en su propia transacción, así los locks duran un lote y no la
+corrida entera. En otros motores (SQLite en desarrollo) se hace lo mismo con
+SELECT + bulk_create + DELETE dentro de la transacción del lote.
+
+El particionado (solo PostgreSQL) convierte ``manager_notification`` en una
+tabla particionada por rango mensual de ``created_at`` y crea las
+particiones futuras; ver ``partition_notifications``.
+"""
+import logging
+from datetime import date, timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Notification, NotificationArchive
+
+logger = logging.getLogger('manager')
+
+DEFAULT_BATCH_SIZE = 5000
+
+ARCHIVED_COLUMNS = ('id', 'user_id', 'message', 'description', 'is_read', 'created_at')
+
+
+def get_cutoff(older_than_days, now=None):
+    return (now or timezone.now()) - timedelta(days=older_than_days)
+
+
+def archivable_notifications(cutoff):
+    """Notificaciones leídas creadas antes de ``cutoff``."""
+    return Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+
+def _archive_batch_postgresql(cutoff, batch_size, archived_at):
+    quote = connection.ops.quote_name
+    notifications = quote(Notification._meta.db_table)
+    archive = quote(NotificationArchive._meta.db_table)
+    columns = ', '.join(quote(column) for column in ARCHIVED_COLUMNS)
+    sql = f"""
+        WITH moved AS (
+            DELETE FROM {notifications}
+            WHERE id IN (
+                SELECT id FROM {notifications}
+                WHERE is_read AND created_at < %s
+                ORDER BY created_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {columns}
+        )
+        INSERT INTO {archive} ({columns}, archived_at)
+        SELECT {columns}, %s FROM moved
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [cutoff, batch_size, archived_at])
+        return cursor.rowcount
+
+
+def _archive_batch_generic(cutoff, batch_size, archived_at):
+    rows = list(
+        archivable_notifications(cutoff)
+        .order_by('created_at')
+        .values_list(*ARCHIVED_COLUMNS)[:batch_size]
+    )
+    if not rows:
+        return 0
+    NotificationArchive.objects.bulk_create(
+        NotificationArchive(**dict(zip(ARCHIVED_COLUMNS, row)), archived_at=archived_at)
+        for row in rows
+    )
+    Notification.objects.filter(id__in=[row[0] for row in rows]).delete()
+    return len(rows)
+
+
+def archive_batch(cutoff, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Mueve hasta ``batch_size`` notificaciones archivables en una transacción.
+
+    Returns:
+        int: Cantidad de notificaciones movidas.
+    """
+    archived_at = timezone.now()
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            return _archive_batch_postgresql(cutoff, batch_size, archived_at)
+        return _archive_batch_generic(cutoff, batch_size, archived_at)
+
+
+def archive_read_notifications(older_than_days, batch_size=DEFAULT_BATCH_SIZE, max_batches=None,
+                               on_batch=None):
+    """
+    Archiva por lotes las notificaciones leídas más viejas que ``older_than_days``.
+
+    Args:
+        older_than_days (int): Antigüedad mínima (por ``created_at``).
+        batch_size (int): Filas por lote/transacción.
+        max_batches (int | None): Cortar después de N lotes (corridas acotadas).
+        on_batch (callable | None): Se llama con la cantidad movida en cada lote.
+
+    Returns:
+        int: Total de notificaciones archivadas.
+    """
+    cutoff = get_cutoff(older_than_days)
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        moved = archive_batch(cutoff, batch_size)
+        batches += 1
+        total += moved
+        if on_batch is not None:
+            on_batch(moved)
+        if moved < batch_size:
+            break
+
+    logger.info(
+        "Archivadas %s notificaciones leídas anteriores a %s en %s lotes",
+        total, cutoff.date(), batches,
+    )
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Particionado (PostgreSQL)
+# ---------------------------------------------------------------------------
+
+def _month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def _next_month(value):
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def _last_partition_month(months_ahead):
+    """Primer día del mes ``months_ahead`` meses después del actual."""
+    month = _month_start(timezone.now().date())
+    for _ in range(months_ahead):
+        month = _next_month(month)
+    return month
+
+
+def partition_name(table, month):
+    """``manager_notification`` + 2025-03 -> ``manager_notification_p2025_03``."""
+    return f'{table}_p{month:%Y_%m}'
+
+
+def is_partitioned(table=None):
+    """Indica si la tabla de notificaciones ya es particionada (relkind 'p')."""
+    table = table or Notification._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+            [table],
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
+
+def create_month_partitions(first_month, last_month, table=None):
+    """
+    Crea (si faltan) las particiones mensuales entre ``first_month`` y
+    ``last_month`` inclusive.
+
+    Returns:
+        list[str]: Nombres de las particiones creadas o ya existentes.
+    """
+    table = table or Notification._meta.db_table
+    quote = connection.ops.quote_name
+    names = []
+    month = _month_start(first_month)
+    with connection.cursor() as cursor:
+        while month <= last_month:
+            name = partition_name(table, month)
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote(name)} PARTITION OF {quote(table)} "
+                f"FOR VALUES FROM (%s) TO (%s)",
+                [month.isoformat(), _next_month(month).isoformat()],
+            )
+            names.append(name)
+            month = _next_month(month)
+    return names
+
+
+def convert_to_partitioned(months_ahead):
+    """
+    Convierte ``manager_notification`` en tabla particionada por mes.
+
+    Todo en una transacción y con la tabla bloqueada:
+
+    1. Renombra la tabla actual y crea la particionada con las mismas
+       columnas (``LIKE``), las particiones mensuales que cubren los datos
+       existentes + ``months_ahead`` y una partición DEFAULT.
+    2. Copia las filas y borra la tabla vieja (con ella se van su secuencia
+       identity, su PK, FKs e índices, liberando esos nombres).
+    3. Recrea con los mismos nombres la secuencia de ``id`` (continúa desde
+       el máximo), la PK -ahora ``(id, created_at)``: la clave de partición
+       debe formar parte de la PK-, las FKs y los índices secundarios.
+
+    Returns:
+        list[str]: Particiones mensuales creadas.
+    """
+    table = Notification._meta.db_table
+    old_table = f'{table}_unpartitioned'
+    quote = connection.ops.quote_name
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE")
+
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype IN ('p', 'f')",
+            [table],
+        )
+        constraints = cursor.fetchall()
+        primary_key = next(name for name, kind, _ in constraints if kind == 'p')
+        foreign_keys = [(name, definition) for name, kind, definition in constraints if kind == 'f']
+        # Índices secundarios (los de constraints se recrean arriba). Las
+        # definiciones se leen antes del RENAME: ya apuntan a ``table``.
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT IN ("
+            "  SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s)"
+            ")",
+            [table, table],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+        sequence = cursor.fetchone()[0] or f'{table}_id_seq'
+        cursor.execute(f"SELECT MIN(created_at), COALESCE(MAX(id), 0) FROM {quote(table)}")
+        oldest, max_id = cursor.fetchone()
+
+        cursor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(old_table)}")
+        cursor.execute(
+            f"CREATE TABLE {quote(table)} (LIKE {quote(old_table)} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        first_month = oldest.date() if oldest else timezone.now().date()
+        partitions = create_month_partitions(first_month, _last_partition_month(months_ahead), table)
+        cursor.execute(
+            f"CREATE TABLE {quote(table + '_default')} PARTITION OF {quote(table)} DEFAULT"
+        )
+
+        cursor.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(old_table)}")
+        cursor.execute(f"DROP TABLE {quote(old_table)}")
+
+        # pg_get_serial_sequence devuelve el nombre ya calificado/quoteado
+        cursor.execute(f"CREATE SEQUENCE {sequence} OWNED BY {quote(table)}.id")
+        # Próximo nextval: max_id + 1 (o 1 si la tabla estaba vacía)
+        cursor.execute("SELECT setval(%s, %s, %s)", [sequence, max(max_id, 1), max_id > 0])
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ALTER COLUMN id SET DEFAULT nextval(%s::regclass)",
+            [sequence],
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(primary_key)} "
+            f"PRIMARY KEY (id, created_at)"
+        )
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}")
+        for indexdef in indexes:
+            cursor.execute(indexdef)
+
+    logger.info("%s convertida a tabla particionada (%s particiones mensuales)", table, len(partitions))
+    return partitions
+
+
+def ensure_future_partitions(months_ahead):
+    """Crea las particiones del mes actual y los ``months_ahead`` siguientes."""
+    return create_month_partitions(timezone.now().date(), _last_partition_month(months_ahead))
@@ -6,7 +6,8 @@ lógica de negocio compartida entre vistas web y endpoints de API.
 """
 import logging
 from django.db.models import F
-from .models import ManagerData, Notification
+from django.utils import timezone
+from .models import ManagerData, Notification, humanize_time_elapsed
 
 logger = logging.getLogger('manager')
 
@@ -25,7 +26,7 @@ def create_manager(user):
         manager_data, created = ManagerData.objects.get_or_create(user=user)
         return manager_data
     except Exception as e:
-        logger.error(f"Error al crear ManagerData para {user.username}: {e}")
+        logger.error("Error al crear ManagerData para %s: %s", user.username, e)
         return None
 
 
@@ -64,9 +65,31 @@ def create_notification(manager_info, notification_type, points, description=Non
         manager_info.notifications = F('notifications') + 1
         manager_info.save(update_fields=['notifications'])
 
-        logger.info(f"Notificación creada para {manager_info.user.username}: {message}")
+        logger.info("Notificación creada para %s: %s", manager_info.user.username, message)
         return notification
 
     except Exception as e:
-        logger.error(f"Error al crear notificación: {e}")
+        logger.error("Error al crear notificación: %s", e)
         return None
+
+
+def humanize_notifications(notifications, now=None):
+    """
+    Calcula en bloque el tiempo transcurrido de una lista de notificaciones.
+
+    Usa un único ``now`` para todas las filas (en lugar de un
+    ``timezone.now()`` por cada ``{{ notification.time_elapsed }}``) y deja
+    el resultado en el atributo ``time_elapsed_display`` de cada instancia.
+
+    Args:
+        notifications: Iterable de Notification (se evalúa una sola vez).
+        now (datetime | None): Instante de referencia; por defecto, ahora.
+
+    Returns:
+        list[Notification]: Las notificaciones con ``time_elapsed_display``.
+    """
+    now = now or timezone.now()
+    notifications = list(notifications)
+    for notification in notifications:
+        notification.time_elapsed_display = humanize_time_elapsed(notification.created_at, now)
+    return notifications
@@ -0,0 +1,47 @@
+"""
+Señales de la app manager.
+
+Mantienen al día los version stamps (``majobacore.utils.cache``) de los
+fragmentos cacheados del panel de cuenta y de los contadores del dashboard,
+e invalidan el ManagerData cacheado (``manager.cache``).
+
+Las versiones se cambian recién al confirmar la transacción: si cambiaran
+antes, un request concurrente podría cachear con la versión nueva lo que
+todavía lee de las filas viejas.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from majobacore.utils.cache import bump_version
+
+from .cache import invalidate_manager_data
+from .models import ManagerData, Notification, Project
+
+# Namespace de versión de los proyectos de un usuario
+PROJECTS_VERSION = 'projects'
+# Namespace de versión de las notificaciones de un usuario
+NOTIFICATIONS_VERSION = 'notifications'
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def bump_projects_version(sender, instance, **kwargs):
+    """Invalida el panel de proyectos recientes del dueño del proyecto."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: bump_version(PROJECTS_VERSION, user_id))
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def bump_notifications_version(sender, instance, **kwargs):
+    """Invalida los contadores de notificaciones cacheados del destinatario."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: bump_version(NOTIFICATIONS_VERSION, user_id))
+
+
+@receiver(post_save, sender=ManagerData)
+@receiver(post_delete, sender=ManagerData)
+def invalidate_manager_data_cache(sender, instance, **kwargs):
+    """Descarta la copia cacheada: el próximo request la relee de la base."""
+    invalidate_manager_data(instance.user_id)
@@ -0,0 +1,78 @@
+"""
+Template tag ``responsive_image``: ``<picture>`` con variantes AVIF/WebP.
+
+Uso:
+    {% load responsive_images %}
+    {% responsive_image 'images/slider 2.jpg' alt='Obra' sizes='100vw' fetchpriority='high' %}
+    {% responsive_image 'images/majoba-card-logo.png' alt='Majoba' sizes='300px' loading='lazy' %}
+
+Genera::
+
+    <picture class="responsive-image">
+      <source type="image/avif" srcset="... 480w, ... 960w" sizes="100vw">
+      <source type="image/webp" srcset="... 480w, ... 960w" sizes="100vw">
+      <img src="<original>" width="1200" height="800" alt="Obra" decoding="async">
+    </picture>
+
+El ``<img>`` conserva el original como fallback y lleva width/height para
+reservar el espacio (sin layout shift). Si no hay variantes generadas
+(``build_responsive_images``) se emite solo el ``<img>``.
+"""
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from majobacore.utils.images import get_config, get_image_info
+
+register = template.Library()
+
+MIME_TYPES = {
+    'avif': 'image/avif',
+    'webp': 'image/webp',
+}
+
+
+@register.simple_tag
+def responsive_image(path, alt='', sizes='100vw', **attrs):
+    """
+    ``<picture>`` con ``srcset`` por formato para la imagen estática ``path``.
+
+    Args:
+        path (str): Path estático del original (ej: ``images/banner.jpeg``).
+        alt (str): Texto alternativo.
+        sizes (str): Atributo ``sizes`` (ancho en que se muestra la imagen).
+        **attrs: Atributos extra del ``<img>`` (class, loading, fetchpriority, ...);
+            ``_`` se convierte en ``-`` (``aria_hidden`` -> ``aria-hidden``).
+    """
+    info = get_image_info(path)
+    img_attrs = {'src': static(path), 'alt': alt}
+    if info is not None:
+        img_attrs.update(width=info['width'], height=info['height'])
+    img_attrs.setdefault('decoding', 'async')
+    img_attrs.update((name.replace('_', '-'), value) for name, value in attrs.items())
+
+    img = format_html(
+        '<img {}>',
+        format_html_join(' ', '{}="{}"', img_attrs.items()),
+    )
+
+    variants = info['variants'] if info else {}
+    if not any(variants.values()):
+        return img
+
+    sources = format_html_join(
+        '',
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (
+                MIME_TYPES.get(fmt, f'image/{fmt}'),
+                ', '.join(f'{static(name)} {width}w' for width, name, _ in candidates),
+                sizes,
+            )
+            for fmt, candidates in (
+                (fmt, variants.get(fmt)) for fmt in get_config()['FORMATS']
+            )
+            if candidates
+        ),
+    )
+    return format_html('<picture class="responsive-image">{}{}</picture>', sources, img)
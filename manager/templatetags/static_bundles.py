@@ -0,0 +1,61 @@
+"""
+Template tags de bundles CSS/JS (ver majobacore/utils/bundles.py).
+
+Uso:
+    {% load static_bundles %}
+    {% inline_css_bundle 'critical' %}   -> <style>...</style>
+    {% css_bundle 'index' %}             -> <link rel="stylesheet" href="/static/bundles/index.<hash>.css">
+    {% js_bundle 'admin_dashboard' %}    -> <script src="/static/bundles/admin_dashboard.<hash>.js"></script>
+
+Si el bundle no está construido (``build_static_bundles``) o
+``STATIC_BUNDLES_ENABLED`` es False, cada tag emite un ``<link>``/``<script>``
+por archivo fuente, igual que antes de los bundles.
+"""
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from majobacore.utils.bundles import get_bundle, get_bundle_sources, read_bundle
+
+register = template.Library()
+
+
+def _css_links(paths):
+    return format_html_join(
+        '\n', '<link rel="stylesheet" href="{}" />', ((static(path),) for path in paths)
+    )
+
+
+def _scripts(paths):
+    return format_html_join(
+        '\n', '<script src="{}"></script>', ((static(path),) for path in paths)
+    )
+
+
+@register.simple_tag
+def inline_css_bundle(name):
+    """CSS del bundle ``name`` dentro de un ``<style>`` (sin request bloqueante)."""
+    entry = get_bundle(name, 'css')
+    if entry is None:
+        return _css_links(get_bundle_sources(name, 'css'))
+    # Contenido generado en el build a partir de static/: no es input de usuarios
+    return mark_safe(f'<style>{read_bundle(entry)}</style>')
+
+
+@register.simple_tag
+def css_bundle(name):
+    """``<link>`` al CSS minificado (y hasheado por collectstatic) de ``name``."""
+    entry = get_bundle(name, 'css')
+    if entry is None:
+        return _css_links(get_bundle_sources(name, 'css'))
+    return format_html('<link rel="stylesheet" href="{}" />', static(entry['path']))
+
+
+@register.simple_tag
+def js_bundle(name):
+    """``<script>`` al JS concatenado/minificado de ``name``."""
+    entry = get_bundle(name, 'js')
+    if entry is None:
+        return _scripts(get_bundle_sources(name, 'js'))
+    return format_html('<script src="{}"></script>', static(entry['path']))
@@ -1,3 +1,466 @@
-from django.test import TestCase
+import json
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.cache import cache, caches
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from majobacore.utils import tiered_cache
+from majobacore.utils.cache import (
+    LOCK_KEY_PREFIX,
+    bump_version,
+    cached_computation,
+    get_or_compute,
+    get_version,
+)
+from majobacore.utils.tiered_cache import INVALIDATION_CHANNEL, TieredCache
+from manager.models import Notification, NotificationArchive, Project
+from manager.pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_paginate
+from manager.retention import archive_batch, archive_read_notifications, get_cutoff
+from manager.services import humanize_notifications
+from manager.signals import NOTIFICATIONS_VERSION
+from users.models import CustomUser
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'manager-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class VersionStampTests(TestCase):
+    """Version stamps de manager/signals.py."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.user = CustomUser.objects.create_user(
+            username='versiones',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+
+    def test_version_cambia_al_confirmar(self):
+        before = get_version(NOTIFICATIONS_VERSION, self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Notification.objects.create(user=self.user, message='Hola')
+        # Dentro de la transacción la versión no cambia
+        self.assertEqual(get_version(NOTIFICATIONS_VERSION, self.user.pk), before)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_version(NOTIFICATIONS_VERSION, self.user.pk), before)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GetOrComputeTests(SimpleTestCase):
+    """Cálculos cacheados sin estampida (majobacore/utils/cache.py)."""
+
+    key = 'compute:test'
+
+    def setUp(self):
+        cache.clear()
+
+    def store(self, value, expires_in, delta=0.0):
+        """Entrada como la deja ``get_or_compute``, que vence (blando) en ``expires_in`` segundos."""
+        cache.set(self.key, (value, time.time() + expires_in, delta), 300)
+
+    def test_clave_fria_calcula_y_guarda(self):
+        compute = mock.Mock(return_value={'total': 1})
+
+        self.assertEqual(get_or_compute(self.key, compute, 60), {'total': 1})
+        self.assertEqual(get_or_compute(self.key, compute, 60), {'total': 1})
+        compute.assert_called_once()
+
+    def test_vencida_con_lock_ajeno_sirve_el_valor_viejo(self):
+        self.store('viejo', expires_in=-1)
+        cache.add(f'{LOCK_KEY_PREFIX}:{self.key}', 'otro-worker', 30)
+        compute = mock.Mock(return_value='nuevo')
+
+        self.assertEqual(get_or_compute(self.key, compute, 60), 'viejo')
+        compute.assert_not_called()
+
+    def test_vencida_recalcula_y_libera_el_lock(self):
+        self.store('viejo', expires_in=-1)
+
+        self.assertEqual(get_or_compute(self.key, lambda: 'nuevo', 60), 'nuevo')
+        self.assertIsNone(cache.get(f'{LOCK_KEY_PREFIX}:{self.key}'))
+        self.assertEqual(get_or_compute(self.key, lambda: 'otro', 60), 'nuevo')
+
+    def test_error_al_recalcular_sirve_el_valor_viejo(self):
+        self.store('viejo', expires_in=-1)
+        compute = mock.Mock(side_effect=RuntimeError('base caída'))
+
+        with self.assertLogs('majobacore', 'ERROR'):
+            self.assertEqual(get_or_compute(self.key, compute, 60), 'viejo')
+        compute.assert_called_once()
+        self.assertIsNone(cache.get(f'{LOCK_KEY_PREFIX}:{self.key}'))
+
+    def test_error_sin_valor_viejo_se_propaga(self):
+        with self.assertRaises(RuntimeError):
+            get_or_compute(self.key, mock.Mock(side_effect=RuntimeError('base caída')), 60)
+        self.assertIsNone(cache.get(f'{LOCK_KEY_PREFIX}:{self.key}'))
+
+    def test_xfetch_recalcula_antes_de_vencer(self):
+        # Vence en 10 s pero el último cálculo tardó mucho más: se adelanta
+        self.store('viejo', expires_in=10, delta=1000)
+        with mock.patch('majobacore.utils.cache.random.random', return_value=0.5):
+            self.assertEqual(get_or_compute(self.key, lambda: 'nuevo', 60), 'nuevo')
+
+    def test_xfetch_no_recalcula_lejos_del_vencimiento(self):
+        self.store('viejo', expires_in=60, delta=0.001)
+        compute = mock.Mock(return_value='nuevo')
+
+        with mock.patch('majobacore.utils.cache.random.random', return_value=0.5):
+            self.assertEqual(get_or_compute(self.key, compute, 60), 'viejo')
+        compute.assert_not_called()
+
+    def test_clave_fria_con_lock_ajeno_espera_el_resultado(self):
+        lock_key = f'{LOCK_KEY_PREFIX}:{self.key}'
+        cache.add(lock_key, 'otro-worker', 30)
+        compute = mock.Mock(return_value='propio')
+
+        def other_worker():
+            self.store('del otro', expires_in=60)
+            cache.delete(lock_key)
+
+        timer = threading.Timer(0.2, other_worker)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertEqual(get_or_compute(self.key, compute, 60), 'del otro')
+        compute.assert_not_called()
+
+    def test_un_solo_calculo_con_muchos_concurrentes(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'valor'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_compute(self.key, compute, 60)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['valor'] * 10)
+        self.assertEqual(len(calls), 1)
+
+    def test_cached_computation_separa_por_argumentos(self):
+        calls = []
+
+        @cached_computation(timeout=60, key='test.doble')
+        def double(number):
+            calls.append(number)
+            return number * 2
+
+        self.assertEqual([double(1), double(1), double(2)], [2, 2, 4])
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(double.uncached(3), 6)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LOCAL_CACHE_ENABLED=True)
+class TieredCacheTests(TestCase):
+    """Cache en dos niveles con el LRU del worker activo (majobacore/utils/tiered_cache.py)."""
+
+    def setUp(self):
+        cache.clear()
+        self.reset_local_state()
+        self.addCleanup(self.reset_local_state)
+        self.tiered = TieredCache('test', timeout=60, local_timeout=60)
+        self.key = self.tiered.make_key(1)
+
+    def reset_local_state(self):
+        tiered_cache._lru.clear()
+        tiered_cache._latest_versions.clear()
+        tiered_cache._stats.clear()
+
+    def with_redis(self, subscribed):
+        """Simula Redis disponible, con o sin suscripción al canal de invalidaciones."""
+        client = mock.Mock()
+        subscribed_event = threading.Event()
+        if subscribed:
+            subscribed_event.set()
+        for patcher in (
+            mock.patch('majobacore.utils.tiered_cache._get_redis_client', return_value=client),
+            mock.patch('majobacore.utils.tiered_cache._listener', object()),
+            mock.patch('majobacore.utils.tiered_cache._subscribed', subscribed_event),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return client
+
+    def test_hit_local_no_va_al_cache(self):
+        loader = mock.Mock(return_value={'id': 1})
+        self.tiered.get_or_set(1, loader)
+        cache.clear()
+
+        self.assertEqual(self.tiered.get_or_set(1, loader), {'id': 1})
+        loader.assert_called_once()
+
+    def test_lectura_que_corre_con_una_invalidacion_no_llena_el_lru(self):
+        def loader():
+            # Otro worker invalida mientras esta lectura consulta la base
+            version = bump_version(self.key)
+            tiered_cache._on_invalidation(json.dumps({'key': self.key, 'version': version}))
+            return {'id': 1, 'name': 'viejo'}
+
+        self.assertEqual(self.tiered.get_or_set(1, loader), {'id': 1, 'name': 'viejo'})
+        self.assertIsNone(tiered_cache._lru.get(self.key))
+
+        # La siguiente lectura ve la versión nueva y sí llena el LRU
+        self.assertEqual(self.tiered.get_or_set(1, lambda: {'id': 1, 'name': 'nuevo'}), {'id': 1, 'name': 'nuevo'})
+        self.assertEqual(tiered_cache._lru.get(self.key)[1], {'id': 1, 'name': 'nuevo'})
+
+    def test_invalidate_publica_solo_al_confirmar(self):
+        client = self.with_redis(subscribed=True)
+        self.tiered.get_or_set(1, lambda: {'id': 1})
+        before = get_version(self.key)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.tiered.invalidate(1)
+        # El LRU propio se descarta ya; Redis y los demás workers, al confirmar
+        self.assertIsNone(tiered_cache._lru.get(self.key))
+        client.publish.assert_not_called()
+        self.assertEqual(get_version(self.key), before)
+
+        for callback in callbacks:
+            callback()
+        version = get_version(self.key)
+        self.assertNotEqual(version, before)
+        client.publish.assert_called_once_with(
+            cache.make_key(INVALIDATION_CHANNEL),
+            json.dumps({'key': self.key, 'version': version}),
+        )
+
+    def test_sin_suscripcion_no_usa_el_lru(self):
+        self.with_redis(subscribed=False)
+        loader = mock.Mock(return_value={'id': 1})
+
+        self.tiered.get_or_set(1, loader)
+        self.tiered.get_or_set(1, loader)
+
+        self.assertEqual(len(tiered_cache._lru), 0)
+        loader.assert_called_once()
+        self.assertEqual(tiered_cache._stats['test']['cache_hits'], 1)
+
+
+class KeysetPaginationTests(TestCase):
+    """Paginación por cursor del listado de proyectos (manager/pagination.py)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='pagina',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        Project.objects.bulk_create(
+            Project(user=self.user, name=f'Proyecto {number}', start_date=date(2024, 1, 1))
+            for number in range(10)
+        )
+        self.projects = Project.objects.filter(user=self.user)
+
+    def walk(self, page_size):
+        """Recorre todas las páginas y retorna los ids en orden."""
+        seen, cursor = [], None
+        while True:
+            page = keyset_paginate(self.projects, cursor, page_size)
+            seen.extend(project.pk for project in page.object_list)
+            if not page.has_next:
+                return seen
+            cursor = page.next_cursor
+
+    def test_cursor_ida_y_vuelta(self):
+        created_at = timezone.now()
+
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 42)), (created_at, 42))
+
+    def test_mismo_created_at_sin_repetidos_ni_huecos(self):
+        self.projects.update(created_at=timezone.now())
+        expected = list(self.projects.order_by('-id').values_list('id', flat=True))
+
+        for page_size in (1, 3, 4, 10):
+            with self.subTest(page_size=page_size):
+                self.assertEqual(self.walk(page_size), expected)
+
+    def test_empates_mezclados_con_distintos_instantes(self):
+        now = timezone.now()
+        for index, pk in enumerate(self.projects.order_by('id').values_list('id', flat=True)):
+            # De a tres proyectos por instante
+            self.projects.filter(pk=pk).update(created_at=now - timedelta(minutes=index // 3))
+        expected = list(self.projects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+        self.assertEqual(self.walk(4), expected)
+
+    def test_cursor_manipulado(self):
+        for cursor in ('%%%', 'bm8tZXMtdW4tY3Vyc29y', encode_cursor(timezone.now(), 1)[:-4] + 'AAAA'):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+    def test_cursor_manipulado_responde_400(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('list_projects_more'), {'cursor': 'bm8tZXMtdW4tY3Vyc29y'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Cursor inválido.'})
+
+    def test_listado_con_cursor_manipulado_vuelve_a_la_primera_pagina(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('list_projects'), {'cursor': 'bm8tZXMtdW4tY3Vyc29y'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['projects']), 10)
+
+
+class NotificationRetentionTests(TestCase):
+    """Archivado de notificaciones leídas, camino genérico (manager/retention.py)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='archiva',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        self.now = timezone.now()
+        self.old_read = [self.notification(f'Vieja {number}', days=100 + number) for number in range(5)]
+        self.old_unread = self.notification('Vieja sin leer', days=200, is_read=False)
+        self.recent_read = self.notification('Reciente leída', days=10)
+
+    def notification(self, message, days, is_read=True):
+        notification = Notification.objects.create(
+            user=self.user, message=message, description='Detalle', is_read=is_read,
+        )
+        # created_at es auto_now_add: se fecha con update()
+        Notification.objects.filter(pk=notification.pk).update(created_at=self.now - timedelta(days=days))
+        notification.refresh_from_db()
+        return notification
+
+    def test_solo_mueve_leidas_anteriores_al_corte(self):
+        total = archive_read_notifications(90, batch_size=100)
+
+        self.assertEqual(total, 5)
+        self.assertQuerySetEqual(
+            Notification.objects.order_by('pk'), [self.old_unread, self.recent_read],
+        )
+        self.assertEqual(
+            set(NotificationArchive.objects.values_list('id', flat=True)),
+            {notification.pk for notification in self.old_read},
+        )
+
+    def test_archivadas_conservan_los_datos(self):
+        archive_read_notifications(90)
+
+        for notification in self.old_read:
+            archived = NotificationArchive.objects.get(pk=notification.pk)
+            self.assertEqual(archived.user_id, notification.user_id)
+            self.assertEqual(archived.created_at, notification.created_at)
+            self.assertEqual(archived.message, notification.message)
+            self.assertEqual(archived.description, 'Detalle')
+            self.assertTrue(archived.is_read)
+
+    def test_lote_mueve_las_mas_viejas_primero(self):
+        moved = archive_batch(get_cutoff(90), batch_size=2)
+
+        self.assertEqual(moved, 2)
+        self.assertEqual(
+            set(NotificationArchive.objects.values_list('id', flat=True)),
+            {self.old_read[4].pk, self.old_read[3].pk},
+        )
+
+    def test_respeta_batch_size_y_max_batches(self):
+        batches = []
+
+        total = archive_read_notifications(90, batch_size=2, max_batches=2, on_batch=batches.append)
+
+        self.assertEqual(total, 4)
+        self.assertEqual(batches, [2, 2])
+        self.assertEqual(NotificationArchive.objects.count(), 4)
+        self.assertEqual(Notification.objects.filter(is_read=True, created_at__lt=get_cutoff(90)).count(), 1)
+
+    def test_corta_con_el_ultimo_lote_incompleto(self):
+        batches = []
+
+        archive_read_notifications(90, batch_size=2, on_batch=batches.append)
+
+        self.assertEqual(batches, [2, 2, 1])
+
+    def test_comando_archive_notifications(self):
+        out = StringIO()
+        call_command('archive_notifications', days=90, dry_run=True, stdout=out)
+        self.assertIn('5 notificaciones', out.getvalue())
+        self.assertEqual(NotificationArchive.objects.count(), 0)
+
+        out = StringIO()
+        call_command('archive_notifications', days=90, batch_size=2, stdout=out)
+        self.assertIn('5 notificaciones archivadas', out.getvalue())
+        self.assertEqual(Notification.objects.count(), 2)
+
+        with self.assertRaises(CommandError):
+            call_command('archive_notifications', days=0)
+
+    def test_comando_partition_notifications_requiere_postgresql(self):
+        with self.assertRaisesMessage(CommandError, 'PostgreSQL'):
+            call_command('partition_notifications', convert=True)
+
+
+class HumanizeNotificationsTests(TestCase):
+    """``humanize_notifications`` calcula lo mismo que ``Notification.time_elapsed``."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='humaniza',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        self.now = timezone.now()
+        ages = (
+            timedelta(seconds=10), timedelta(minutes=1), timedelta(minutes=45),
+            timedelta(hours=1), timedelta(hours=5), timedelta(days=1),
+            timedelta(days=12), timedelta(days=40), timedelta(days=400),
+        )
+        for number, age in enumerate(ages):
+            notification = Notification.objects.create(user=self.user, message=f'Aviso {number}')
+            Notification.objects.filter(pk=notification.pk).update(created_at=self.now - age)
+
+    def test_coincide_con_time_elapsed(self):
+        notifications = humanize_notifications(
+            Notification.objects.filter(user=self.user).order_by('-created_at'),
+            now=self.now,
+        )
+
+        self.assertEqual(len(notifications), 9)
+        self.assertEqual(
+            [notification.time_elapsed_display for notification in notifications],
+            [notification.time_elapsed(now=self.now) for notification in notifications],
+        )
+        self.assertEqual(notifications[0].time_elapsed_display, 'ahora')
+        self.assertEqual(notifications[4].time_elapsed_display, 'hace 5 horas')
+
+    def test_usa_un_solo_now_por_defecto(self):
+        queryset = Notification.objects.filter(user=self.user)
+
+        with mock.patch('django.utils.timezone.now', return_value=self.now) as now:
+            notifications = humanize_notifications(queryset)
+
+        now.assert_called_once()
+        self.assertEqual(
+            [notification.time_elapsed_display for notification in notifications],
+            [notification.time_elapsed(now=self.now) for notification in notifications],
+        )
@@ -1,47 +1,67 @@
-from django.http import JsonResponse
+import hashlib
+from urllib.parse import urlencode
+
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
+from django.template.loader import get_template, render_to_string
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from .models import Client, ManagerData, Project, Notification
+from .cache import get_manager_data
+from .pagination import InvalidCursor, keyset_paginate
+from .signals import PROJECTS_VERSION
 from .forms import ClientForm, ManagerDataForm, ProjectForm
-from .services import create_manager, create_notification
+from .services import create_manager, create_notification, humanize_notifications
 from users.models import CustomUser
+from users.signals import USERS_VERSION
+from majobacore.utils.cache import (
+    COMPUTE_KEY_PREFIX, cached_computation, get_or_compute, get_version,
+)
+from majobacore.utils.http import fast_json_response
 from django.db import models
 from django.db.models import F
 from django.db import transaction
 import logging
 logger = logging.getLogger(__name__)
 
+# Listado web de proyectos: tamaño de página (múltiplo de las 3/2/1 columnas
+# de la grilla) y tamaño de tanda del modo streaming (?all).
+PROJECTS_PAGE_SIZE = 24
+PROJECTS_STREAM_CHUNK_SIZE = 200
+PROJECTS_STREAM_PLACEHOLDER = '__projects_stream__'
+
+# Segundos que se cachean las estadísticas del dashboard admin (agregados sobre
+# todas las filas, tolera ese atraso) y cada página de la búsqueda de usuarios
+# (además se invalida con cada cambio de usuario).
+ADMIN_STATS_CACHE_TIMEOUT = 60
+SEARCH_USERS_CACHE_TIMEOUT = 300
+
 @login_required
 def manager_view(request):
     """
     Esta vista permite al usuario ver y administrar la información del ManagerData asociado a su cuenta.
     """
     try:
-        # Obtener o crear ManagerData para el usuario autenticado
-        manager_info, created = ManagerData.objects.get_or_create(
-            user=request.user,
-            defaults={
-                'points': 0,
-                'acc_level': 'principiante',
-                'notifications': 0
-            }
-        )
-        #Obtener proyectos asociados al usuario
-        
+        # ManagerData desde el cache en dos niveles (se crea si no existe)
+        manager_info = get_manager_data(request.user)
+        if manager_info is None:
+            raise ManagerData.DoesNotExist('No se pudo crear el ManagerData')
+        # Proyectos recientes: el queryset es lazy, si el fragmento del panel
+        # está en cache (misma versión) la consulta no se ejecuta.
         projects = Project.objects.filter(user=request.user).all()[:3]
-        print(projects)
-        notifications = Notification.objects.filter(user=request.user).order_by('-created_at')[:5]
-        if created:
-            logger.info(f"ManagerData creado para el usuario {request.user.username}")
-        
+        notifications = humanize_notifications(
+            Notification.objects.filter(user=request.user).order_by('-created_at')[:5]
+        )
+
         return render(request, 'manager/account_manager.html', {
             'manager_info': manager_info,
             'user': request.user,
             'projects': projects,
+            'projects_version': get_version(PROJECTS_VERSION, request.user.pk),
             'notifications': notifications,
         })
     except Exception as e:
-        logger.error(f"Error al cargar ManagerData para {request.user.username}: {e}")
+        logger.error("Error al cargar ManagerData para %s: %s", request.user.username, e)
         return render(request, 'manager/account_manager.html', {
             'error': 'Error al cargar la información del manager.'
         })
@@ -72,56 +92,169 @@ def create_project_view(request):
                 )
                 project.client = new_client
                 logger.info(
-                    f"Cliente '{new_client.name}' creado al vuelo por {request.user.username}"
+                    "Cliente '%s' creado al vuelo por %s", new_client.name, request.user.username
                 )
             else:
                 project.client = form.cleaned_data.get('client')
 
             project.save()
-            logger.info(f"Nuevo proyecto '{project.name}' creado por {request.user.username}")
+            logger.info("Nuevo proyecto '%s' creado por %s", project.name, request.user.username)
             return redirect('manager')
         else:
             logger.warning(
-                f"Error en el formulario de creación de proyecto por "
-                f"{request.user.username}: {form.errors}"
+                "Error en el formulario de creación de proyecto por %s: %s",
+                request.user.username, form.errors,
             )
             return render(request, 'manager/create_project.html', {'form': form})
     else:
         form = ProjectForm(user=request.user)
         return render(request, 'manager/create_project.html', {'form': form})
 
+def _projects_queryset(request, selected_client):
+    """Proyectos del usuario (opcionalmente de un cliente) con solo las columnas del listado."""
+    projects = (
+        Project.objects
+        .filter(user=request.user)
+        .select_related('client')
+        .only(
+            'id', 'name', 'location', 'start_date', 'end_date', 'is_active',
+            'created_at', 'client__name',
+        )
+    )
+    if selected_client:
+        projects = projects.filter(client_id=selected_client)
+    return projects
+
+
+def _projects_page_query(selected_client, cursor):
+    """Query string (``client`` + ``cursor``) de la página siguiente del listado."""
+    params = {'cursor': cursor}
+    if selected_client:
+        params = {'client': selected_client, **params}
+    return urlencode(params)
+
+
+@login_required
 def list_projects_view(request):
     """
-    Vista para listar todos los proyectos del usuario autenticado.
+    Vista para listar los proyectos del usuario autenticado, paginados.
+
+    Acepta los parámetros GET:
+    - ``client``: ID de cliente para filtrar los proyectos.
+    - ``cursor``: posición de la página (keyset); sin cursor, la primera.
+    - ``all``: si está presente, renderiza todos los proyectos en streaming.
 
-    Acepta el parámetro GET ``client`` (ID de cliente) para filtrar
-    los proyectos por cliente. Envía al contexto:
-    - ``projects``: QuerySet de proyectos (filtrado o completo).
+    Envía al contexto:
+    - ``projects``: proyectos de la página actual (``PROJECTS_PAGE_SIZE``).
     - ``clients``: todos los clientes del usuario (para el selector de filtro).
     - ``selected_client``: ID del cliente actualmente seleccionado (str o None).
+    - ``next_cursor`` / ``next_query``: para el botón "Cargar más" (o None).
     """
     clients = Client.objects.filter(user=request.user)
     selected_client = request.GET.get('client', '').strip() or None
-
-    projects = (
-        Project.objects
-        .filter(user=request.user)
-        .select_related('client')
-        .only('id', 'name', 'location', 'start_date', 'end_date', 'is_active', 'client_id')
-        .order_by('-created_at')
-    )
+    projects = _projects_queryset(request, selected_client)
 
     if selected_client:
-        projects = projects.filter(client_id=selected_client)
         logger.info(
-            f"Proyectos filtrados por cliente ID={selected_client} "
-            f"para {request.user.username}"
+            "Proyectos filtrados por cliente ID=%s para %s",
+            selected_client, request.user.username,
         )
 
-    return render(request, 'manager/projects_list.html', {
-        'projects': projects,
+    context = {
         'clients': clients,
         'selected_client': selected_client,
+    }
+
+    if 'all' in request.GET:
+        return _stream_projects_list(request, projects, context)
+
+    try:
+        page = keyset_paginate(projects, request.GET.get('cursor'), PROJECTS_PAGE_SIZE)
+    except InvalidCursor:
+        page = keyset_paginate(projects, None, PROJECTS_PAGE_SIZE)
+
+    context.update({
+        'projects': page.object_list,
+        'next_cursor': page.next_cursor,
+        'next_query': _projects_page_query(selected_client, page.next_cursor) if page.has_next else '',
+    })
+    return render(request, 'manager/projects_list.html', context)
+
+
+def _stream_projects_list(request, projects, context):
+    """
+    Renderiza el listado completo como StreamingHttpResponse.
+
+    La página se renderiza una vez sin proyectos (con un marcador en su
+    lugar) y los proyectos se recorren con ``iterator()`` y se renderizan en
+    tandas de ``PROJECTS_STREAM_CHUNK_SIZE``: la memoria no depende de la
+    cantidad de proyectos y el navegador empieza a pintar con el primer chunk.
+    """
+    page_html = render_to_string(
+        'manager/projects_list.html',
+        {**context, 'stream_placeholder': PROJECTS_STREAM_PLACEHOLDER},
+        request=request,
+    )
+    head, tail = page_html.split(PROJECTS_STREAM_PLACEHOLDER, 1)
+    items_template = get_template('manager/partials/project_items.html')
+    selected_client = context['selected_client']
+
+    def render_items(chunk):
+        return items_template.render({'projects': chunk, 'selected_client': selected_client})
+
+    def generate():
+        yield head
+        chunk = []
+        rendered_any = False
+        rows = projects.order_by('-created_at', '-id').iterator(chunk_size=PROJECTS_STREAM_CHUNK_SIZE)
+        for project in rows:
+            chunk.append(project)
+            if len(chunk) == PROJECTS_STREAM_CHUNK_SIZE:
+                yield render_items(chunk)
+                chunk = []
+                rendered_any = True
+        if chunk or not rendered_any:
+            # Con lista vacía el partial muestra el mensaje "No hay proyectos"
+            yield render_items(chunk)
+        yield tail
+
+    return StreamingHttpResponse(generate(), content_type='text/html; charset=utf-8')
+
+
+@login_required
+def list_projects_more_view(request):
+    """
+    Endpoint JSON del scroll infinito del listado de proyectos.
+
+    Recibe ``cursor`` (y opcionalmente ``client``) y devuelve el HTML de la
+    página siguiente junto con las URLs para pedir la otra:
+    ``{"html": ..., "next_url": ... | null, "next_page_url": ... | null}``.
+    """
+    selected_client = request.GET.get('client', '').strip() or None
+    projects = _projects_queryset(request, selected_client)
+
+    try:
+        page = keyset_paginate(projects, request.GET.get('cursor'), PROJECTS_PAGE_SIZE)
+    except InvalidCursor:
+        return JsonResponse({'error': 'Cursor inválido.'}, status=400)
+
+    html = ''
+    if page.object_list:
+        html = render_to_string('manager/partials/project_items.html', {
+            'projects': page.object_list,
+            'selected_client': selected_client,
+        })
+
+    next_url = next_page_url = None
+    if page.has_next:
+        query = _projects_page_query(selected_client, page.next_cursor)
+        next_url = f"{reverse('list_projects_more')}?{query}"
+        next_page_url = f"{reverse('list_projects')}?{query}"
+
+    return fast_json_response({
+        'html': html,
+        'next_url': next_url,
+        'next_page_url': next_page_url,
     })
 
 def modify_project_view(request, project_id):
@@ -135,7 +268,7 @@ def modify_project_view(request, project_id):
         project = Project.objects.get(id=project_id, user=request.user)
     except Project.DoesNotExist:
         logger.warning(
-            f"Proyecto con ID {project_id} no encontrado para {request.user.username}"
+            "Proyecto con ID %s no encontrado para %s", project_id, request.user.username
         )
         return redirect('list_projects')
 
@@ -143,12 +276,12 @@ def modify_project_view(request, project_id):
         form = ProjectForm(request.POST, instance=project, user=request.user)
         if form.is_valid():
             form.save()
-            logger.info(f"Proyecto '{project.name}' modificado por {request.user.username}")
+            logger.info("Proyecto '%s' modificado por %s", project.name, request.user.username)
             return redirect('list_projects')
         else:
             logger.warning(
-                f"Error en el formulario de modificación de proyecto por "
-                f"{request.user.username}: {form.errors}"
+                "Error en el formulario de modificación de proyecto por %s: %s",
+                request.user.username, form.errors,
             )
             return render(
                 request,
@@ -163,55 +296,77 @@ def modify_project_view(request, project_id):
             {'form': form, 'project': project},
         )
 
+
+@cached_computation(timeout=ADMIN_STATS_CACHE_TIMEOUT)
+def _admin_stats():
+    """Estadísticas generales del dashboard admin (agregados de todas las filas)."""
+    users = CustomUser.objects.aggregate(
+        total_users=models.Count('id'),
+        staff_users=models.Count('id', filter=models.Q(is_staff=True)),
+        active_users=models.Count('id', filter=models.Q(is_active=True)),
+    )
+    managers = ManagerData.objects.aggregate(
+        total_managers=models.Count('id'),
+        total_points=models.Sum('points'),
+    )
+    return {
+        **users,
+        'total_managers': managers['total_managers'],
+        'total_points': managers['total_points'] or 0,
+        # Usuarios por nivel
+        'levels_stats': list(
+            ManagerData.objects.values('acc_level').annotate(count=models.Count('acc_level'))
+        ),
+    }
+
+
 @login_required
 def admin_dashboard_view(request):
     """
     Dashboard especial para usuarios staff/administradores
     """
     if not request.user.is_staff:
-        logger.warning(f"Usuario no-staff {request.user.username} intentó acceder al dashboard admin")
+        logger.warning("Usuario no-staff %s intentó acceder al dashboard admin", request.user.username)
         return redirect('manager')
     
     try:
-        # Estadísticas generales
-        total_users = CustomUser.objects.count()
-        staff_users = CustomUser.objects.filter(is_staff=True).count()
-        active_users = CustomUser.objects.filter(is_active=True).count()
-        
-        # Estadísticas de ManagerData
-        total_managers = ManagerData.objects.count()
-        total_points = ManagerData.objects.aggregate(
-            total=models.Sum('points')
-        )['total'] or 0
-        
-        # Usuarios por nivel
-        levels_stats = ManagerData.objects.values('acc_level').annotate(
-            count=models.Count('acc_level')
-        )
-        
         context = {
-            'total_users': total_users,
-            'staff_users': staff_users,
-            'active_users': active_users,
-            'total_managers': total_managers,
-            'total_points': total_points,
-            'levels_stats': levels_stats,
+            **_admin_stats(),
             'user': request.user,
-            'user_created': request.session.pop('user_created', False)
-        
-
-
+            'user_created': request.session.pop('user_created', False),
         }
         
         return render(request, 'manager/admin_dashboard.html', context)
         
     except Exception as e:
-        logger.error(f"Error al cargar dashboard admin para {request.user.username}: {e}")
+        logger.error("Error al cargar dashboard admin para %s: %s", request.user.username, e)
         return render(request, 'manager/admin_dashboard.html', {
             'error': 'Error al cargar el dashboard administrativo.'
         })
 
 
+def _search_users(query, page, per_page):
+    """Usuarios que coinciden con ``query`` (página ``page``) y el total."""
+    users_qs = CustomUser.objects.filter(
+        models.Q(username__icontains=query) |
+        models.Q(first_name__icontains=query) |
+        models.Q(last_name__icontains=query)
+    ).order_by('username')
+
+    start = (page - 1) * per_page
+    users_page = users_qs[start:start + per_page]
+    return {
+        'users': [{
+            'id': user.id,
+            'username': user.username,
+            'full_name': user.get_full_name(),
+            'is_staff': user.is_staff,
+            'is_active': user.is_active,
+        } for user in users_page],
+        'total': users_qs.count(),
+    }
+
+
 @login_required
 def search_users_ajax(request):
     """Vista que maneja las búsquedas AJAX"""
@@ -223,41 +378,26 @@ def search_users_ajax(request):
     query = request.GET.get('q', '').strip()
     page = int(request.GET.get('page', 1))
     per_page = 10  # Número de resultados por página
-    print(query)
     if not query:
-        return JsonResponse({'users': [], 'total': 0, 'page': page, 'per_page': per_page})
+        return fast_json_response({'users': [], 'total': 0, 'page': page, 'per_page': per_page})
     
-    # 3. Filtrar usuarios en la base de datos
-    users_qs = CustomUser.objects.filter(
-        models.Q(username__icontains=query) |
-        models.Q(first_name__icontains=query) |
-        models.Q(last_name__icontains=query)
-    ).order_by('username')
-    
-    total_results = users_qs.count()
-    
-    # 4. Paginar resultados
-    start = (page - 1) * per_page
-    end = start + per_page
-    users_page = users_qs[start:end]
-    
-    users_data = [{
-        'id': user.id,
-        'username': user.username,
-        'full_name': user.get_full_name(),
-        
-        'is_staff': user.is_staff,
-        'is_active': user.is_active
-    } for user in users_page]
-    
-    print(users_data)
-    print(total_results)
-    print(page)
-    print(per_page)
+    # 3. Filtrar y paginar en la base (o desde cache: la clave cambia con
+    #    cada alta/modificación de usuario)
+    digest = hashlib.blake2b(query.lower().encode(), digest_size=16).hexdigest()
+    result = get_or_compute(
+        f'{COMPUTE_KEY_PREFIX}:search_users:{get_version(USERS_VERSION)}:{digest}:{page}:{per_page}',
+        lambda: _search_users(query, page, per_page),
+        SEARCH_USERS_CACHE_TIMEOUT,
+    )
+    total_results = result['total']
+
+    logger.debug(
+        "Búsqueda de usuarios '%s' por %s: %s resultados (página %s)",
+        query, request.user.username, total_results, page,
+    )
     # 5. Devolver JSON con usuarios encontrados
-    return JsonResponse({
-        'users': users_data,
-        'total': total_results,
+    return fast_json_response({
+        **result,
         'page': page,
         'per_page': per_page
     })
@@ -280,8 +420,6 @@ def manager_modification(request, user_id):
             })
 
     if request.method == 'POST':
-        if request.POST.get('checkbox-option'):
-            print('check')
         if request.POST.get('user-points'):
             points = int(request.POST.get('user-points', 0))
             if points > 0:
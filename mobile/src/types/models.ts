@@ -60,5 +60,6 @@ export interface Notification {
   description?: string;
   is_read: boolean;
   created_at: string;
-  time_elapsed: string;
+  /** Ausente con `?humanize=0`: usar `humanizeTimeElapsed` de `@/utils/time`. */
+  time_elapsed?: string;
 }
@@ -0,0 +1,35 @@
+/**
+ * Tiempo transcurrido en español, igual que `humanize_time_elapsed` del backend.
+ *
+ * `serverNow` es el header `X-Server-Time` de la respuesta: así el texto no
+ * depende del reloj del dispositivo.
+ */
+const UNITS: Array<[limit: number, seconds: number, singular: string, plural: string]> = [
+  [86400, 3600, 'hora', 'horas'],
+  [2592000, 86400, 'día', 'días'],
+  [31536000, 2592000, 'mes', 'meses'],
+  [Infinity, 31536000, 'año', 'años'],
+];
+
+/** La API usa `%z` (`-0300`); ISO 8601 estricto de `Date.parse` exige `-03:00`. */
+function parseApiDate(value: string): number {
+  return Date.parse(value.replace(/([+-]\d{2})(\d{2})$/, '$1:$2'));
+}
+
+export function humanizeTimeElapsed(createdAt: string, serverNow?: string | null): string {
+  const now = serverNow ? parseApiDate(serverNow) : Date.now();
+  const seconds = Math.floor((now - parseApiDate(createdAt)) / 1000);
+
+  if (seconds < 60) return 'ahora';
+  if (seconds < 3600) {
+    const minutes = Math.floor(seconds / 60);
+    return `hace ${minutes} ${minutes === 1 ? 'minuto' : 'minutos'}`;
+  }
+  for (const [limit, size, singular, plural] of UNITS) {
+    if (seconds < limit) {
+      const value = Math.floor(seconds / size);
+      return `hace ${value} ${value === 1 ? singular : plural}`;
+    }
+  }
+  return 'ahora';
+}
@@ -0,0 +1,77 @@
+"""
+Cache de la fila del usuario para la autenticación JWT.
+
+``get_cached_user(user_id)`` arma un ``CustomUser`` sin tocar la base en el
+caso común, con el cache en dos niveles de
+``majobacore.utils.tiered_cache``:
+
+1. El LRU en memoria del worker (``AUTH_USER_LOCAL_CACHE_TIMEOUT``,
+   segundos): ni siquiera va a Redis.
+2. El cache de Django (Redis en producción) con TTL más largo
+   (``AUTH_USER_CACHE_TIMEOUT``), compartido por todos los workers.
+
+Si no está en ninguno se lee con una query y se guarda en ambos. El
+``post_save``/``post_delete`` de ``CustomUser`` (users/signals.py) invalida
+la entrada en todos los workers (pub/sub). ``QuerySet.update()`` no dispara
+señales: quien desactive usuarios así debe llamar a ``invalidate_cached_user``.
+
+El hash de la contraseña no se guarda en cache: en la instancia queda como
+campo diferido y se lee de la base solo si se usa (ej: cambio de contraseña).
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import router
+
+from majobacore.utils.tiered_cache import TieredCache
+
+# Campos que no salen de la base
+UNCACHED_FIELDS = frozenset({'password'})
+
+user_cache = TieredCache(
+    'auth:user',
+    timeout=settings.AUTH_USER_CACHE_TIMEOUT,
+    local_timeout=settings.AUTH_USER_LOCAL_CACHE_TIMEOUT,
+)
+
+
+def _cached_fields(model):
+    return [
+        field.attname for field in model._meta.concrete_fields
+        if field.attname not in UNCACHED_FIELDS
+    ]
+
+
+def _get_values(model, user_id):
+    """Valores de la fila (dict ``attname -> valor``) o ``None`` si no existe."""
+    return user_cache.get_or_set(
+        user_id,
+        lambda: model._default_manager.filter(pk=user_id).values(*_cached_fields(model)).first(),
+    )
+
+
+def get_cached_user(user_id):
+    """
+    Retorna el usuario ``user_id`` desde cache (o la base), o ``None``.
+
+    La instancia se construye con ``from_db`` como si viniera de una query:
+    compara igual a otras instancias del mismo usuario, sirve en filtros y
+    FKs y ``save()`` actualiza solo los campos cargados.
+    """
+    User = get_user_model()
+    # El claim del token trae el id como string y la señal como int
+    values = _get_values(User, str(user_id))
+    if values is None:
+        return None
+    # Recorrer los campos del modelo y no el dict: una entrada escrita por un
+    # deploy anterior sin algún campo nuevo lo deja diferido en vez de fallar
+    field_names = [name for name in _cached_fields(User) if name in values]
+    return User.from_db(
+        router.db_for_read(User),
+        field_names,
+        [values[name] for name in field_names],
+    )
+
+
+def invalidate_cached_user(user_id):
+    """Invalida la fila cacheada del usuario en Redis y en todos los workers."""
+    user_cache.invalidate(str(user_id))
@@ -134,7 +134,7 @@ class CustomUserCreationForm(UserCreationForm):
         
         if commit:
             user.save()
-            logger.info(f"Usuario creado mediante formulario: {user.username}")
+            logger.info("Usuario creado mediante formulario: %s", user.username)
         
         return user
 
@@ -278,7 +278,7 @@ class CustomUserChangeForm(UserChangeForm):
         
         if commit:
             user.save()
-            logger.info(f"Usuario {user.username} modificado exitosamente")
+            logger.info("Usuario %s modificado exitosamente", user.username)
         
         return user
 
@@ -0,0 +1,145 @@
+"""
+Benchmark del costo de hashing de contraseñas: logins por segundo por core.
+
+Mide ``verify`` (lo que cuesta cada ``authenticate()``) en un solo hilo con
+PBKDF2 y Argon2 de Django y con el Argon2 ajustado de
+``majobacore/utils/hashers.py``; luego corre ``--threads`` hilos contra el
+pool de hashing (``PASSWORD_HASHING_THREADS``) para ver el throughput real y
+la latencia que agrega la espera por un lugar.
+
+Uso:
+    python manage.py benchmark_password_hashing
+    python manage.py benchmark_password_hashing --iterations 50 --threads 8 --duration 5
+"""
+import os
+import statistics
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.management.base import BaseCommand
+
+from majobacore.utils import hashers as pooled_hashers
+
+PASSWORD = 'contraseña-de-prueba-123'
+
+
+def _cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _candidates():
+    """``(nombre, hasher)`` a comparar; Argon2 solo si argon2-cffi está instalado."""
+    candidates = [('pbkdf2 (django)', hashers.PBKDF2PasswordHasher())]
+    try:
+        import argon2  # noqa: F401
+    except ImportError:
+        return candidates
+    candidates.append(('argon2 (django)', hashers.Argon2PasswordHasher()))
+    candidates.append(('argon2 (ajustado)', pooled_hashers.Argon2PasswordHasher()))
+    return candidates
+
+
+class Command(BaseCommand):
+    help = 'Mide logins/seg por core de cada hasher y el throughput del pool de hashing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Verificaciones por hasher en la medición de un hilo (default: 20)',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='Hilos concurrentes contra el pool (default: 4, los de un worker gthread)',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=3.0,
+            help='Segundos de la medición concurrente (default: 3)',
+        )
+
+    def handle(self, *args, **options):
+        cores = _cores()
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Un hilo ({cores} cores disponibles)'))
+        for name, hasher in _candidates():
+            self._single_thread(name, hasher, options['iterations'])
+
+        preferred = hashers.get_hasher('default')
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'Pool: {options["threads"]} hilos, PASSWORD_HASHING_THREADS={settings.PASSWORD_HASHING_THREADS}, '
+            f'hasher {preferred.algorithm}'
+        ))
+        self._concurrent(preferred, options['threads'], options['duration'], cores)
+
+    def _single_thread(self, name, hasher, iterations):
+        """Latencia de ``verify`` sin concurrencia e imprime logins/seg de un core."""
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            assert hasher.verify(PASSWORD, encoded)
+            timings.append(time.perf_counter() - start)
+
+        median_ms = statistics.median(timings) * 1000
+        self.stdout.write(
+            f'  {name:<18} {median_ms:8.1f} ms/verify  {1000 / median_ms:7.1f} logins/s por core'
+        )
+
+    def _concurrent(self, hasher, threads, duration, cores):
+        """``threads`` hilos verificando contra el pool durante ``duration`` segundos."""
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+        latencies = []
+        busy = 0
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def worker():
+            nonlocal busy
+            local_latencies = []
+            local_busy = 0
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    hasher.verify(PASSWORD, encoded)
+                except pooled_hashers.HashingBusy:
+                    local_busy += 1
+                    continue
+                local_latencies.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(local_latencies)
+                busy += local_busy
+
+        start = time.perf_counter()
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        if not latencies:
+            self.stdout.write(self.style.ERROR('  ninguna verificación completada'))
+            return
+
+        rate = len(latencies) / elapsed
+        hashing_threads = settings.PASSWORD_HASHING_THREADS or threads
+        used_cores = min(hashing_threads, threads, cores)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+        self.stdout.write(
+            f'  {rate:7.1f} logins/s  ({rate / used_cores:.1f} por core, {used_cores} cores hasheando)'
+        )
+        self.stdout.write(
+            f'  latencia p50={statistics.median(latencies) * 1000:.1f} ms  p95={p95 * 1000:.1f} ms  '
+            f'rechazados (HashingBusy)={busy}'
+        )
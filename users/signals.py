@@ -0,0 +1,33 @@
+"""
+Señales de la app users.
+
+Invalidan la fila del usuario cacheada para la autenticación JWT
+(``users.cache``) y las búsquedas de usuarios cacheadas cada vez que un
+usuario se guarda o se borra.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from majobacore.utils.cache import bump_version
+
+from .cache import invalidate_cached_user
+from .models import CustomUser
+
+# Namespace de versión del conjunto de usuarios (búsqueda del dashboard admin)
+USERS_VERSION = 'users'
+
+# Campos que filtra o muestra la búsqueda de usuarios (manager.views._search_users)
+SEARCHED_USER_FIELDS = frozenset({'username', 'first_name', 'last_name', 'is_staff', 'is_active'})
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_user_cache(sender, instance, update_fields=None, **kwargs):
+    """Descarta la copia cacheada: el próximo request la relee de la base."""
+    invalidate_cached_user(instance.pk)
+    if update_fields is not None and SEARCHED_USER_FIELDS.isdisjoint(update_fields):
+        # Ej: last_login en cada login; la búsqueda cacheada sigue valiendo
+        return
+    # Al confirmar: antes, una búsqueda concurrente cachearía filas viejas con la versión nueva
+    transaction.on_commit(lambda: bump_version(USERS_VERSION))
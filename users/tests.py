@@ -1,3 +1,226 @@
-from django.test import TestCase
+from unittest import mock, skipIf
 
-# Create your tests here.
+from django.contrib.sessions.backends.cache import KEY_PREFIX as LEGACY_KEY_PREFIX
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from majobacore.utils.cache import get_version
+from majobacore.utils.hashers import HashingBusy, HashingBusyMiddleware
+from majobacore.utils.sessions import SessionStore
+from users.models import CustomUser
+from users.signals import USERS_VERSION
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - fakeredis está en requirements/development.txt
+    fakeredis = None
+
+SESSION_SETTINGS = {
+    'SESSION_ENGINE': 'majobacore.utils.sessions',
+    'CACHES': {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'tiered-sessions-tests',
+        }
+    },
+}
+
+
+def redis_down():
+    """Simula un corte de Redis: toda operación del cache lanza ``ConnectionError``."""
+    error = ConnectionError('Redis no disponible')
+    return mock.patch.multiple(
+        LocMemCache,
+        get=mock.Mock(side_effect=error),
+        set=mock.Mock(side_effect=error),
+        delete=mock.Mock(side_effect=error),
+        has_key=mock.Mock(side_effect=error),
+    )
+
+
+@override_settings(**SESSION_SETTINGS)
+class TieredSessionStoreTests(TestCase):
+    """Sesiones en Redis con respaldo en la base (majobacore/utils/sessions.py)."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.user = CustomUser.objects.create_user(
+            username='sesiones',
+            password='Contraseña-Larga-123',
+            first_name='Ana',
+            last_name='Pérez',
+            phone='3511234567',
+        )
+
+    def test_login_sobrevive_corte_de_redis(self):
+        self.client.force_login(self.user)
+
+        with redis_down():
+            response = self.client.get(reverse('login'))
+
+        # Un usuario autenticado es redirigido fuera del login
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.wsgi_request.user.is_authenticated)
+
+    def test_redis_vaciado_recarga_desde_la_base(self):
+        self.client.force_login(self.user)
+        session_key = self.client.session.session_key
+        caches['default'].clear()
+
+        response = self.client.get(reverse('login'))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIsNotNone(caches['default'].get(SessionStore.cache_key_prefix + session_key))
+
+    def test_escritura_durante_corte_llega_a_la_base(self):
+        session = SessionStore()
+        session['carrito'] = 1
+        with redis_down():
+            session.save()
+
+        self.assertEqual(SessionStore(session.session_key)['carrito'], 1)
+
+    def test_sesion_sin_cambios_no_se_escribe(self):
+        session = SessionStore()
+        session['tema'] = 'oscuro'
+        session.save()
+
+        session = SessionStore(session.session_key)
+        session['tema'] = 'oscuro'  # marca modified, mismos datos
+        self.assertTrue(session.modified)
+        with self.assertNumQueries(0), mock.patch.object(LocMemCache, 'set') as cache_set:
+            session.save()
+        cache_set.assert_not_called()
+
+        session['tema'] = 'claro'
+        session.save()
+        self.assertEqual(SessionStore(session.session_key)['tema'], 'claro')
+
+    def test_adopta_sesion_del_backend_cache(self):
+        session_key = 'a' * 32
+        caches['default'].set(LEGACY_KEY_PREFIX + session_key, {'_auth_user_id': str(self.user.pk)}, 60)
+
+        session = SessionStore(session_key)
+
+        self.assertEqual(session['_auth_user_id'], str(self.user.pk))
+        self.assertTrue(Session.objects.filter(session_key=session_key).exists())
+        self.assertIsNone(caches['default'].get(LEGACY_KEY_PREFIX + session_key))
+
+
+@override_settings(**SESSION_SETTINGS)
+class UsersVersionTests(TestCase):
+    """Versión de la búsqueda de usuarios cacheada (users/signals.py)."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.user = CustomUser.objects.create_user(
+            username='buscado',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+
+    def test_login_no_invalida_la_busqueda(self):
+        before = get_version(USERS_VERSION)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('login'), {'username': 'buscado', 'password': 'Contraseña-Larga-123'})
+
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        self.assertEqual(get_version(USERS_VERSION), before)
+
+    def test_cambio_de_nombre_invalida_la_busqueda(self):
+        before = get_version(USERS_VERSION)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Otro'
+            self.user.save(update_fields=['first_name'])
+
+        self.assertNotEqual(get_version(USERS_VERSION), before)
+
+
+class HashingBusyTests(TestCase):
+    """Pool de hashing lleno fuera del login (majobacore/utils/hashers.py)."""
+
+    def test_alta_de_usuario_responde_503_con_retry_after(self):
+        data = {
+            'username': 'nuevo',
+            'first_name': 'Nuevo',
+            'last_name': 'Usuario',
+            'phone': '3517654321',
+            'password1': 'Contraseña-Larga-123',
+            'password2': 'Contraseña-Larga-123',
+        }
+        with mock.patch.object(CustomUser, 'set_password', side_effect=HashingBusy):
+            response = self.client.post(reverse('user_create'), data)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertFalse(CustomUser.objects.filter(username='nuevo').exists())
+
+    def test_middleware_convierte_hashing_busy_en_503(self):
+        middleware = HashingBusyMiddleware(lambda request: None)
+        request = RequestFactory().post('/admin/password_change/')
+
+        response = middleware.process_exception(request, HashingBusy())
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertIsNone(middleware.process_exception(request, ValueError()))
+
+
+@skipIf(fakeredis is None, 'requiere fakeredis')
+@override_settings(
+    RATE_LIMIT_ENABLED=True,
+    RATE_LIMIT_SETTINGS={'LOGIN_RATE_LIMIT': '3/min', 'API_RATE_LIMIT': '2/min'},
+)
+class RateLimitMiddlewareTests(TestCase):
+    """Límites por grupo de rutas con el GCRA en Lua (majobacore/utils/security.py)."""
+
+    def setUp(self):
+        self.redis = fakeredis.FakeRedis()
+        self.redis.flushall()
+        for patcher in (
+            mock.patch('majobacore.utils.ratelimit._get_redis_client', return_value=self.redis),
+            mock.patch('majobacore.utils.ratelimit._scripts', {}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def login(self):
+        return self.client.post(reverse('login'), {'username': 'nadie', 'password': 'incorrecta'})
+
+    def test_login_excedido_responde_429_con_retry_after(self):
+        for _ in range(3):
+            self.assertNotEqual(self.login().status_code, 429)
+
+        response = self.login()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+
+    def test_get_no_se_limita(self):
+        for _ in range(5):
+            self.assertEqual(self.client.get(reverse('login')).status_code, 200)
+        self.assertEqual(self.login().status_code, 200)
+
+    def test_api_limita_por_ip(self):
+        user = CustomUser.objects.create_user(
+            username='limitado',
+            password='Contraseña-Larga-123',
+            phone='3511234567',
+        )
+        self.client.force_login(user)
+        url = '/api/v1/notifications/unread-count/'
+
+        for _ in range(2):
+            self.assertNotEqual(self.client.get(url, REMOTE_ADDR='10.0.0.1').status_code, 429)
+        response = self.client.get(url, REMOTE_ADDR='10.0.0.1')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        # Otra IP tiene su propio cupo aunque sea el mismo usuario
+        self.assertNotEqual(self.client.get(url, REMOTE_ADDR='10.0.0.2').status_code, 429)
@@ -4,9 +4,11 @@ from django.contrib import messages
 from django.urls import reverse
 from .forms import CustomUserCreationForm, CustomUserChangeForm
 from .models import CustomUser
+from manager.cache import get_manager_data
 from manager.services import create_manager
 from django.contrib.auth.decorators import login_required
 import logging
+from majobacore.utils.hashers import HASHING_BUSY_RETRY_AFTER, HashingBusy
 from majobacore.utils.http import get_client_ip
 logger = logging.getLogger(__name__)
 
@@ -27,8 +29,14 @@ def user_create_view(request):
                 
             
                 return redirect('admin_dashboard')
+        except HashingBusy:
+            # set_password de form.save(): el formulario vuelve con los datos cargados
+            messages.error(request, 'El servidor está ocupado. Intenta nuevamente en unos segundos.')
+            response = render(request, 'users/user_create.html', {'form': form}, status=503)
+            response['Retry-After'] = str(HASHING_BUSY_RETRY_AFTER)
+            return response
         except Exception as e:
-            logger.error(f"Error al crear usuario: {e}")
+            logger.error("Error al crear usuario: %s", e)
             
             
     else:
@@ -51,13 +59,19 @@ def custom_login_view(request):
         
         if username and password:
             remember_me = request.POST.get('remember_me')
-            user = authenticate(request, username=username, password=password)
+            try:
+                user = authenticate(request, username=username, password=password)
+            except HashingBusy:
+                messages.error(request, 'El servidor está ocupado. Intenta nuevamente en unos segundos.')
+                response = render(request, 'users/login.html', status=503)
+                response['Retry-After'] = str(HASHING_BUSY_RETRY_AFTER)
+                return response
             
             ip = get_client_ip(request)
             if user is not None:
                 if user.is_active:
                     login(request, user)
-                    logger.info(f"Login web exitoso | usuario={username} | ip={ip}")
+                    logger.info("Login web exitoso | usuario=%s | ip=%s", username, ip)
 
                     # Crear ManagerData si no existe
                     if not hasattr(user, 'manager_user'):
@@ -76,10 +90,10 @@ def custom_login_view(request):
                     return redirect_after_login(request)
                 else:
                     messages.error(request, 'Tu cuenta está desactivada. Contacta al administrador.')
-                    logger.warning(f"Login web cuenta desactivada | usuario={username} | ip={ip}")
+                    logger.warning("Login web cuenta desactivada | usuario=%s | ip=%s", username, ip)
             else:
                 messages.error(request, 'Usuario o contraseña incorrectos.')
-                logger.warning(f"Login web fallido | usuario={username} | ip={ip}")
+                logger.warning("Login web fallido | usuario=%s | ip=%s", username, ip)
         else:
             messages.error(request, 'Por favor, completa todos los campos.')
     
@@ -107,7 +121,7 @@ def custom_logout_view(request):
     username = request.user.username if request.user.is_authenticated else 'Usuario'
     logout(request)
     messages.success(request, f'¡Hasta luego {username}! Has cerrado sesión exitosamente.')
-    logger.info(f"Usuario {username} ha cerrado sesión")
+    logger.info("Usuario %s ha cerrado sesión", username)
     return redirect('login')
 
 
@@ -117,17 +131,14 @@ def profile_view(request):
     Vista del perfil del usuario autenticado
     """
     try:
-        # Asegurarse de que el usuario tenga ManagerData
-        if not hasattr(request.user, 'manager_user'):
-            create_manager(request.user)
-        
-        manager_data = request.user.manager_user
+        # ManagerData desde el cache en dos niveles (se crea si no existe)
+        manager_data = get_manager_data(request.user)
         return render(request, 'users/profile.html', {
             'user': request.user,
             'manager_data': manager_data
         })
     except Exception as e:
-        logger.error(f"Error al cargar perfil del usuario {request.user.username}: {e}")
+        logger.error("Error al cargar perfil del usuario %s: %s", request.user.username, e)
         messages.error(request, 'Error al cargar tu perfil.')
         return redirect('index')
 
@@ -164,6 +175,6 @@ def user_modification(request, user_id):
         })
         
     except CustomUser.DoesNotExist:
-        logger.error(f"Usuario con id {user_id} no encontrado.")
+        logger.error("Usuario con id %s no encontrado.", user_id)
         messages.error(request, 'Usuario no encontrado.')
         return redirect('admin_dashboard')